@@ -1,4 +1,6 @@
 # main.py
+import argparse
+import sys
 import pandas as pd
 from src.api.formstack_client import FormstackClient
 from src.analysis.form_analyzer import FormAnalyzer
@@ -23,12 +25,10 @@ def run_command_line_report():
 
         # Get the summary data
         print("Generating Formstack form summary report...")
-        form_summary = analyzer.get_form_summary_data()
-
-        if form_summary:
-            # Create a Pandas DataFrame for easy tabular data presentation and manipulation
-            df = pd.DataFrame(form_summary)
+        # The analyzer builds a Pandas DataFrame for easy tabular data presentation and manipulation
+        df = analyzer.get_form_summary_frame()
 
+        if not df.empty:
             # Sort by creation date for better overview
             # Use na_position='last' to put forms with no creation date at the end
             df = df.sort_values(by='created_at', ascending=False, na_position='last')
@@ -65,6 +65,74 @@ def run_command_line_report():
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
+def run_inventory_export(args):
+    """
+    Exports the form inventory (forms, folders and configuration flags) to
+    Parquet, Arrow and/or CSV files for BI tools.
+
+    Args:
+        args (argparse.Namespace): Parsed 'export' command arguments.
+
+    Exits with status 1 if the export fails, so schedulers can tell.
+    """
+    # Imported here so the console report does not need the export dependencies
+    from src.export.inventory_exporter import InventoryExporter
+    try:
+        if args.from_snapshot is not None:
+            # Read everything from the local snapshot; no API calls are made
+            from src.storage.snapshot_store import SnapshotStore
+            data_source = SnapshotStore(args.from_snapshot or None)
+            config_index = None
+            print(f"Exporting from snapshot {data_source.path}...")
+        else:
+            from src.analysis.config_index import FormConfigIndex
+            data_source = FormstackClient()
+            config_index = FormConfigIndex()
+            if args.refresh_config:
+                # Crawls only new and changed forms after the first run
+                config_index.update(data_source)
+            print("Exporting from the Formstack API...")
+
+        exporter = InventoryExporter(data_source, config_index=config_index, chunk_size=args.chunk_size)
+        manifest = exporter.export(args.output, formats=args.format)
+        for name, dataset in manifest['datasets'].items():
+            print(f"  {name}: {dataset['rows']} rows -> {', '.join(dataset['files'])}")
+
+    except (ValueError, ImportError) as e:
+        print(f"Configuration error: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+        sys.exit(1)
+
+def parse_arguments():
+    """
+    Parses the command line. Without a command, the console report is run.
+    """
+    parser = argparse.ArgumentParser(description="Formstack manager command line tools")
+    subparsers = parser.add_subparsers(dest='command')
+
+    subparsers.add_parser('report', help="Print the form summary report (default)")
+
+    export_parser = subparsers.add_parser('export', help="Export the form inventory to Parquet/Arrow/CSV files")
+    export_parser.add_argument('--output', '-o', default='inventory_export',
+                               help="Output directory (default: inventory_export)")
+    export_parser.add_argument('--format', '-f', nargs='+', default=['parquet'],
+                               choices=['parquet', 'arrow', 'csv'],
+                               help="One or more output formats (default: parquet)")
+    export_parser.add_argument('--from-snapshot', nargs='?', const='', default=None, metavar='PATH',
+                               help="Export from the local snapshot instead of the API "
+                                    "(default path: FORMSTACK_SNAPSHOT_PATH)")
+    export_parser.add_argument('--chunk-size', type=int, default=None,
+                               help="Forms written per chunk (default: 5000)")
+    export_parser.add_argument('--refresh-config', action='store_true',
+                               help="Update the configuration index for new and changed forms before a live export")
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    run_command_line_report()
+    arguments = parse_arguments()
+    if arguments.command == 'export':
+        run_inventory_export(arguments)
+    else:
+        run_command_line_report()
 
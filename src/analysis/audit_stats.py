@@ -0,0 +1,146 @@
+# src/analysis/audit_stats.py
+import math
+import numpy as np
+import pandas as pd
+
+class AuditStats:
+    """
+    The aggregates shown on the Form Audit page (usage counts, activity windows,
+    health score) and the insights derived from them, computed with vectorized
+    operations over the form summary frame (FormAnalyzer.get_form_summary_frame).
+    """
+    # Activity windows in days
+    RECENT_DAYS = 30
+    STALE_DAYS = 180  # 6 months of 30 days
+    DORMANT_DAYS = 365
+
+    # Health score thresholds (percentage of forms with submissions)
+    EXCELLENT_HEALTH = 80
+    GOOD_HEALTH = 60
+
+    def __init__(self, form_frame, now=None):
+        """
+        Computes the aggregates and insights.
+
+        Args:
+            form_frame (pd.DataFrame): The form summary frame. It is not modified.
+            now (pd.Timestamp, optional): Reference time for the activity windows. Defaults to now.
+        """
+        self.computed_at = pd.Timestamp.now() if now is None else pd.Timestamp(now)
+        self.stats = self._compute_stats(form_frame)
+        self.insights = self._generate_insights(self.stats)
+
+    def _compute_stats(self, frame):
+        total = len(frame)
+        if not total:
+            return {
+                'total_forms': 0, 'active_forms': 0, 'forms_with_submissions': 0, 'unused_forms': 0,
+                'recently_active': 0, 'stale_forms': 0, 'dormant_forms': 0, 'inactive_with_submissions': 0,
+                'health_score': 0, 'action_items': 0
+            }
+
+        submissions = frame['submissions_count'].fillna(0).to_numpy()
+        inactive = frame['is_inactive'].fillna(False).astype(bool).to_numpy()
+        last_submission = frame['last_submission_at']
+        has_last_submission = last_submission.notna().to_numpy()
+        has_submissions = submissions > 0
+        unused = submissions == 0
+
+        def submitted_before(days):
+            # Forms without a last submission date only count when they never had a submission
+            cutoff = self.computed_at - pd.Timedelta(days=days)
+            return np.where(has_last_submission, (last_submission < cutoff).to_numpy(), unused)
+
+        recent_cutoff = self.computed_at - pd.Timedelta(days=self.RECENT_DAYS)
+        forms_with_submissions = int(has_submissions.sum())
+        unused_forms = int(unused.sum())
+        stale_forms = int(submitted_before(self.STALE_DAYS).sum())
+
+        return {
+            'total_forms': total,
+            'active_forms': int((~inactive).sum()),
+            'forms_with_submissions': forms_with_submissions,
+            'unused_forms': unused_forms,
+            'recently_active': int((last_submission >= recent_cutoff).sum()),
+            'stale_forms': stale_forms,
+            'dormant_forms': int(submitted_before(self.DORMANT_DAYS).sum()),
+            'inactive_with_submissions': int((inactive & has_submissions).sum()),
+            # Percentage of forms that are actively used, rounded half up
+            'health_score': int(math.floor(forms_with_submissions / total * 100 + 0.5)),
+            # Forms that might need attention
+            'action_items': unused_forms + stale_forms
+        }
+
+    def _generate_insights(self, stats):
+        """
+        Returns the insights shown on the audit page, as dictionaries with
+        'type' (success, warning, danger or info), 'icon', 'title' and 'description'.
+        """
+        insights = []
+        health_score = stats['health_score']
+
+        if health_score >= self.EXCELLENT_HEALTH:
+            insights.append({
+                'type': 'success',
+                'icon': 'fa-check-circle',
+                'title': 'Excellent Form Health',
+                'description': f"{health_score}% of your forms are actively collecting data. Your form portfolio is well-maintained!"
+            })
+        elif health_score >= self.GOOD_HEALTH:
+            insights.append({
+                'type': 'warning',
+                'icon': 'fa-exclamation-triangle',
+                'title': 'Good Form Health',
+                'description': f"{health_score}% of your forms are active. Consider reviewing unused forms for potential cleanup."
+            })
+        else:
+            insights.append({
+                'type': 'danger',
+                'icon': 'fa-times-circle',
+                'title': 'Form Health Needs Attention',
+                'description': f"Only {health_score}% of your forms are actively used. Consider archiving or removing unused forms."
+            })
+
+        if stats['unused_forms'] > 0:
+            insights.append({
+                'type': 'info',
+                'icon': 'fa-info-circle',
+                'title': 'Unused Forms Detected',
+                'description': f"{stats['unused_forms']} forms have never received submissions. These might be drafts or test forms that can be cleaned up."
+            })
+
+        if stats['stale_forms'] > 0:
+            insights.append({
+                'type': 'warning',
+                'icon': 'fa-clock-o',
+                'title': 'Stale Forms Found',
+                'description': f"{stats['stale_forms']} forms haven't received submissions in 6+ months. Review if these are still needed."
+            })
+
+        if stats['recently_active'] > 0:
+            insights.append({
+                'type': 'success',
+                'icon': 'fa-trending-up',
+                'title': 'Recent Activity',
+                'description': f"{stats['recently_active']} forms received submissions in the last {self.RECENT_DAYS} days, showing good engagement."
+            })
+
+        if stats['inactive_with_submissions'] > 0:
+            insights.append({
+                'type': 'warning',
+                'icon': 'fa-pause-circle',
+                'title': 'Inactive Forms with Data',
+                'description': f"{stats['inactive_with_submissions']} inactive forms have submission data. Consider if they should be reactivated."
+            })
+
+        return insights
+
+    def to_dict(self):
+        """
+        Returns the stats, insights and reference time as a JSON-serializable dictionary.
+        """
+        return {
+            'stats': dict(self.stats),
+            'insights': [dict(insight) for insight in self.insights],
+            'computed_at': self.computed_at.strftime('%Y-%m-%d %H:%M:%S')
+        }
@@ -0,0 +1,435 @@
+# src/analysis/config_index.py
+import json
+import os
+import threading
+import time
+import numpy as np
+from dotenv import load_dotenv
+from src.api.job_progress import JobCancelled, current_job
+
+# Load environment variables from .env file.
+# This ensures that FORMSTACK_CONFIG_INDEX_PATH is available for the default index location.
+load_dotenv()
+
+class FormConfigIndex:
+    """
+    A persistent index of the configuration of every form: which forms have
+    webhooks, confirmations, notifications, partial submissions and integrations.
+
+    Every form gets a bit position. Each configuration type is a bitset (a Python
+    int) with the bits of the forms that have at least one item of that type, next
+    to the item counts per form and a bitset of the forms for which that type is
+    known. Combining configuration filters is a bitwise AND of a few integers and
+    makes no API calls.
+
+    The index is filled by crawling the forms' configuration with
+    iter_forms_configuration. Later crawls only refetch forms whose 'updated' or
+    'last_submission_time' changed (new submissions change the partial submissions
+    without touching 'updated'). Types whose fetch failed are left unknown, and a
+    form is only marked as crawled (its signature recorded) once every type was
+    fetched, so failed forms are retried by the next crawl. Interactive callers may record some
+    types of a form on their own; the crawl completes them. The index is saved
+    to a JSON file after every crawl batch, so it survives restarts.
+    """
+    # Configuration types in the index (keys of FormstackClient.FORM_CONFIG_FETCHERS)
+    CONFIG_TYPES = ['webhooks', 'confirmations', 'notifications', 'partial_submissions', 'integrations']
+
+    # Default location of the index file
+    DEFAULT_PATH = os.getenv("FORMSTACK_CONFIG_INDEX_PATH", "formstack_config_index.json")
+
+    # Number of forms whose configuration is fetched between two saves of the index
+    CRAWL_BATCH_SIZE = 100
+
+    # Version of the file format; files with another version are ignored
+    # (version 1 and 2 files are still read, see _load)
+    FILE_VERSION = 3
+
+    def __init__(self, path=None):
+        """
+        Initializes the index and loads it from path if the file exists.
+
+        Args:
+            path (str, optional): Path of the JSON file. Defaults to DEFAULT_PATH.
+                                  Pass False to keep the index in memory only.
+        """
+        self.path = self.DEFAULT_PATH if path is None else path
+        self._form_ids = []  # bit position -> form ID (None once the form is removed)
+        self._positions = {}  # form ID -> bit position
+        self._signatures = {}  # form ID -> signature() of the form when all of its configuration was fetched
+        self._counts = {config_type: {} for config_type in self.CONFIG_TYPES}  # type -> form ID -> item count
+        self._bits = dict.fromkeys(self.CONFIG_TYPES, 0)
+        self._known = dict.fromkeys(self.CONFIG_TYPES, 0)  # type -> bits of the forms for which it is known
+        self._indexed = 0  # bits of the forms for which every type is known
+
+        # Incremented whenever flags change / bit positions are assigned or released
+        self.version = 0
+        self.layout_version = 0
+
+        self.crawling = False
+        self.progress = {'done': 0, 'total': 0}
+        self.last_crawl_at = None
+        self.last_crawl_summary = None
+        self.last_error = None
+        self._lock = threading.RLock()
+        self._crawl_lock = threading.Lock()
+
+        if self.path:
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _position(self, form_id):
+        position = self._positions.get(form_id)
+        if position is None:
+            position = len(self._form_ids)
+            self._form_ids.append(form_id)
+            self._positions[form_id] = position
+            self.layout_version += 1
+        return position
+
+    def set_configuration(self, form_id, configuration, signature=None):
+        """
+        Records the configuration of one form.
+
+        Args:
+            form_id (str or int): The form ID.
+            configuration (dict): Maps configuration types to the lists returned by the API
+                                  (as returned by get_forms_configuration). Types that are
+                                  missing or None (failed fetches) are left as they were.
+            signature (str, optional): The form's signature(), recorded as the state
+                                       the form was crawled at. Only pass it when every
+                                       configuration type was fetched.
+        """
+        form_id = str(form_id)
+        with self._lock:
+            bit = 1 << self._position(form_id)
+            indexed = True
+            for config_type in self.CONFIG_TYPES:
+                items = configuration.get(config_type)
+                if items is None:
+                    indexed = indexed and bool(self._known[config_type] & bit)
+                    continue
+                count = len(items)
+                self._counts[config_type][form_id] = count
+                if count:
+                    self._bits[config_type] |= bit
+                else:
+                    self._bits[config_type] &= ~bit
+                self._known[config_type] |= bit
+            if indexed:
+                self._indexed |= bit
+            if signature is not None:
+                self._signatures[form_id] = signature
+            self.version += 1
+
+    def remove(self, form_id):
+        """
+        Removes a form from the index (no-op if it is not indexed).
+        """
+        form_id = str(form_id)
+        with self._lock:
+            position = self._positions.pop(form_id, None)
+            if position is None:
+                return
+            mask = ~(1 << position)
+            for config_type in self.CONFIG_TYPES:
+                self._bits[config_type] &= mask
+                self._known[config_type] &= mask
+                self._counts[config_type].pop(form_id, None)
+            self._indexed &= mask
+            self._signatures.pop(form_id, None)
+            self._form_ids[position] = None
+            self.version += 1
+            self.layout_version += 1
+
+    @staticmethod
+    def signature(form):
+        """
+        Returns the state of a form its configuration is crawled at: its 'updated'
+        and 'last_submission_time' values (as in SnapshotStore).
+        """
+        return json.dumps([None if form.get(key) is None else str(form.get(key))
+                           for key in ('updated', 'last_submission_time')])
+
+    def update(self, data_source, forms=None, full=False):
+        """
+        Crawls the configuration of new and changed forms and drops removed forms.
+        Only one crawl runs at a time; a call made while another crawl is running
+        returns None immediately. Progress is reported to the current job
+        (job_progress.current_job), and cancelling the job stops the crawl after
+        saving the forms crawled so far.
+
+        Args:
+            data_source: A FormstackClient, RequestDataContext or SnapshotStore
+                         (anything with get_all_forms and iter_forms_configuration).
+            forms (list, optional): The current forms. Fetched from data_source when omitted.
+            full (bool): If True, refetch the configuration of every form.
+
+        Returns:
+            dict: Number of forms 'crawled', 'failed' (some configuration could not be
+                  fetched; retried by the next crawl), 'removed' and 'unchanged', or
+                  None if another crawl is running.
+        """
+        if not self._crawl_lock.acquire(blocking=False):
+            return None
+        self.crawling = True
+        try:
+            if forms is None:
+                forms = data_source.get_all_forms()
+            current = {str(form['id']): self.signature(form) for form in forms if form.get('id') is not None}
+
+            with self._lock:
+                removed_ids = [form_id for form_id in self._positions if form_id not in current]
+                for form_id in removed_ids:
+                    self.remove(form_id)
+                to_crawl = [form_id for form_id, signature in current.items()
+                            if full or not self.is_indexed(form_id) or self._signatures.get(form_id) != signature]
+            failed = 0
+
+            job = current_job()
+            if job is not None:
+                job.set_total(len(to_crawl))
+            self.progress = {'done': 0, 'total': len(to_crawl)}
+            for start in range(0, len(to_crawl), self.CRAWL_BATCH_SIZE):
+                batch = to_crawl[start:start + self.CRAWL_BATCH_SIZE]
+                for form_id, configuration in data_source.iter_forms_configuration(batch, self.CONFIG_TYPES):
+                    if job is not None:
+                        job.raise_if_cancelled()
+                    # Types that failed are not recorded, and without the signature the
+                    # form is crawled again next time instead of being taken as unchanged
+                    complete = all(configuration.get(config_type) is not None for config_type in self.CONFIG_TYPES)
+                    self.set_configuration(form_id, configuration, current[form_id] if complete else None)
+                    failed += not complete
+                    self.progress = {'done': self.progress['done'] + 1, 'total': len(to_crawl)}
+                    if job is not None:
+                        job.advance()
+                self.save()
+
+            if removed_ids and not to_crawl:
+                self.save()
+
+            summary = {'crawled': len(to_crawl) - failed, 'failed': failed, 'removed': len(removed_ids),
+                       'unchanged': len(current) - len(to_crawl)}
+            self.last_crawl_at = time.time()
+            self.last_crawl_summary = summary
+            self.last_error = None
+            print(f"Configuration index updated: {summary['crawled']} crawled, {summary['failed']} failed, "
+                  f"{summary['removed']} removed, {summary['unchanged']} unchanged")
+            return summary
+        except JobCancelled as e:
+            self.save()
+            self.last_error = e
+            print(f"Configuration index crawl cancelled after {self.progress['done']} forms")
+            return None
+        except Exception as e:
+            self.last_error = e
+            print(f"Error updating configuration index: {e}")
+            return None
+        finally:
+            self.crawling = False
+            self._crawl_lock.release()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def is_indexed(self, form_id, config_types=None):
+        """
+        Returns True if the configuration of the form is known.
+
+        Args:
+            form_id (str or int): The form ID.
+            config_types (iterable, optional): Only check these configuration types.
+                                               Defaults to every type.
+        """
+        position = self._positions.get(str(form_id))
+        if position is None:
+            return False
+        if config_types is None:
+            return bool(self._indexed >> position & 1)
+        return all(self._known[config_type] >> position & 1 for config_type in config_types)
+
+    def counts(self, form_id):
+        """
+        Returns {configuration type: item count} for one form, with None for the types
+        that are not known yet, or None if no type of the form is known.
+        """
+        form_id = str(form_id)
+        with self._lock:
+            counts = {config_type: self._counts[config_type].get(form_id) for config_type in self.CONFIG_TYPES}
+            return counts if any(count is not None for count in counts.values()) else None
+
+    def matching_bits(self, config_types):
+        """
+        Returns the bitset of the forms that have every given configuration type.
+        Without configuration types, returns the bits of the fully indexed forms.
+
+        Raises:
+            ValueError: If a configuration type is unknown.
+        """
+        with self._lock:
+            bits = self._indexed
+            for position, config_type in enumerate(config_types):
+                if config_type not in self._bits:
+                    raise ValueError(f"Unknown configuration type '{config_type}'. Valid types: {', '.join(self.CONFIG_TYPES)}")
+                # A type's bits are only ever set for forms for which it is known
+                bits = self._bits[config_type] if position == 0 else bits & self._bits[config_type]
+            return bits
+
+    def matching_ids(self, config_types):
+        """
+        Returns the IDs of the forms that have every given configuration type.
+        """
+        with self._lock:
+            bits = self.matching_bits(config_types)
+            form_ids = self._form_ids
+            return [form_ids[position] for position in np.flatnonzero(self._bits_to_array(bits, len(form_ids)))]
+
+    def positions(self, form_ids):
+        """
+        Returns the bit position of each form ID as an array (-1 for forms not in the index).
+        """
+        with self._lock:
+            get = self._positions.get
+            return np.array([get(str(form_id), -1) for form_id in form_ids], dtype=np.int64)
+
+    def mask(self, positions, config_types):
+        """
+        Returns a boolean array telling, for each bit position in positions (see
+        positions()), whether that form has every given configuration type.
+        """
+        with self._lock:
+            flags = self._bits_to_array(self.matching_bits(config_types), len(self._form_ids))
+        result = np.zeros(len(positions), dtype=bool)
+        known = (positions >= 0) & (positions < len(flags))
+        result[known] = flags[positions[known]]
+        return result
+
+    @staticmethod
+    def _bits_to_array(bits, size):
+        """
+        Unpacks a bitset into a boolean array of length size.
+        """
+        raw = bits.to_bytes(max(1, (size + 7) // 8), 'little')
+        return np.unpackbits(np.frombuffer(raw, dtype=np.uint8), bitorder='little')[:size].astype(bool)
+
+    @staticmethod
+    def _popcount(bits):
+        return bin(bits).count('1')
+
+    def status(self):
+        """
+        Returns the index size, per-type form counts and crawl state.
+
+        Returns:
+            dict: indexed (forms for which every type is known), known (forms for which
+                  each type is known), counts (forms having each configuration type),
+                  crawling, progress, last_crawl_at, last_crawl_summary, last_error and path.
+        """
+        with self._lock:
+            indexed = self._indexed
+            known = {config_type: self._popcount(bits) for config_type, bits in self._known.items()}
+            counts = {config_type: self._popcount(bits) for config_type, bits in self._bits.items()}
+        return {
+            'indexed': self._popcount(indexed),
+            'known': known,
+            'counts': counts,
+            'crawling': self.crawling,
+            'progress': dict(self.progress),
+            'last_crawl_at': self.last_crawl_at,
+            'last_crawl_summary': self.last_crawl_summary,
+            'last_error': str(self.last_error) if self.last_error else None,
+            'path': self.path or None
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self):
+        """
+        Writes the index to its JSON file (no-op for in-memory indexes).
+        The file is replaced atomically, so a crash never leaves a partial index.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            data = {
+                'version': self.FILE_VERSION,
+                'saved_at': time.time(),
+                'last_crawl_at': self.last_crawl_at,
+                'form_ids': self._form_ids,
+                'signatures': self._signatures,
+                'indexed': format(self._indexed, 'x'),
+                'known': {config_type: format(bits, 'x') for config_type, bits in self._known.items()},
+                'bits': {config_type: format(bits, 'x') for config_type, bits in self._bits.items()},
+                'counts': {config_type: {form_id: count for form_id, count in counts.items() if count}
+                           for config_type, counts in self._counts.items()},
+            }
+        temporary_path = f"{self.path}.tmp"
+        try:
+            with open(temporary_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(temporary_path, self.path)
+        except OSError as e:
+            print(f"Error saving configuration index to {self.path}: {e}")
+
+    def _load(self):
+        """
+        Loads the index from its JSON file, if it exists and is readable.
+        """
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Error loading configuration index from {self.path}: {e}")
+            return
+        if data.get('version') not in (1, 2, self.FILE_VERSION):
+            print(f"Ignoring configuration index {self.path}: unsupported version {data.get('version')}")
+            return
+
+        with self._lock:
+            self._form_ids = data['form_ids']
+            self._positions = {form_id: position for position, form_id in enumerate(self._form_ids) if form_id is not None}
+            # Version 1 and 2 files signed forms with 'updated' only: recrawl every form once
+            self._signatures = data.get('signatures', {}) if data.get('version') == self.FILE_VERSION else {}
+            self._indexed = int(data['indexed'], 16)
+            size = len(self._form_ids)
+            for config_type in self.CONFIG_TYPES:
+                self._bits[config_type] = int(data['bits'].get(config_type, '0'), 16)
+                # Version 1 files only hold fully indexed forms
+                known = data.get('known', {}).get(config_type, format(self._indexed, 'x'))
+                self._known[config_type] = int(known, 16)
+                stored_counts = data['counts'].get(config_type, {})
+                # Only non-zero counts are stored
+                known_ids = [self._form_ids[position]
+                             for position in np.flatnonzero(self._bits_to_array(self._known[config_type], size))]
+                self._counts[config_type] = {form_id: stored_counts.get(form_id, 0)
+                                             for form_id in known_ids if form_id is not None}
+            self.last_crawl_at = data.get('last_crawl_at')
+            self.version += 1
+            self.layout_version += 1
+        print(f"Loaded configuration index for {self._popcount(self._indexed)} forms from {self.path}")
+
+if __name__ == "__main__":
+    # Example usage: crawl the configuration of every form and print the counts
+    from src.api.formstack_client import FormstackClient
+    from src.api.rate_limiter import PRIORITY_BACKGROUND, request_priority
+
+    try:
+        index = FormConfigIndex()
+        with request_priority(PRIORITY_BACKGROUND):
+            print(index.update(FormstackClient()))
+        status = index.status()
+        print(f"\n{status['indexed']} forms indexed")
+        for config_type, count in status['counts'].items():
+            print(f"  {config_type}: {count}")
+        print(f"Forms with webhooks and notifications: {len(index.matching_ids(['webhooks', 'notifications']))}")
+    except ValueError as ve:
+        print(f"Configuration Error: {ve}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
@@ -0,0 +1,90 @@
+# src/analysis/data_context.py
+import threading
+
+class RequestDataContext:
+    """
+    A request-scoped unit of work over a FormstackClient.
+
+    The context can be passed to the analyzers wherever they expect a client.
+    The account-wide list resources (forms, folders, complete folder hierarchy)
+    are fetched at most once per context and shared by every analyzer that uses
+    it; every other attribute is delegated to the wrapped client.
+
+    Create one context per request (or per report run) so the data never
+    outlives the unit of work that fetched it.
+    """
+    def __init__(self, formstack_client):
+        """
+        Initializes the RequestDataContext.
+
+        Args:
+            formstack_client: An instance of FormstackClient to make API calls.
+        """
+        self.client = formstack_client
+        self._results = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # Anything not memoized here (get_form_details, get_form_webhooks, ...)
+        # goes straight to the client.
+        if name == 'client':
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    def _fetch_once(self, key, loader):
+        """
+        Returns the memoized result for key, calling loader the first time.
+        Concurrent callers for the same key wait for the first one to finish.
+
+        Args:
+            key (str): Name of the resource.
+            loader (callable): Function with no arguments that fetches the resource.
+
+        Returns:
+            The (shared) result of loader.
+        """
+        if key in self._results:
+            return self._results[key]
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._results:
+                self._results[key] = loader()
+            return self._results[key]
+
+    def get_all_forms(self):
+        """
+        Returns all forms, fetching them from the API at most once per context.
+        """
+        return self._fetch_once('forms', self.client.get_all_forms)
+
+    def iter_forms(self, per_page=None, prefetch=True):
+        """
+        Iterates over all forms. The first full iteration streams pages from the API
+        and memoizes the result; later calls iterate over the memoized list.
+        """
+        if 'forms' in self._results:
+            yield from self._results['forms']
+            return
+        forms = []
+        for form in self.client.iter_forms(per_page=per_page, prefetch=prefetch):
+            forms.append(form)
+            yield form
+        self._results.setdefault('forms', forms)
+
+    def get_all_folders(self):
+        """
+        Returns the top-level folders, fetching them from the API at most once per context.
+        """
+        return self._fetch_once('folders', self.client.get_all_folders)
+
+    def get_complete_folder_hierarchy(self):
+        """
+        Returns the complete folder hierarchy, reusing the forms and top-level
+        folders already fetched by this context.
+        """
+        return self._fetch_once('folder_hierarchy', lambda: self.client.get_complete_folder_hierarchy(
+            basic_folders=self.get_all_folders(),
+            forms_data=self.get_all_forms()
+        ))
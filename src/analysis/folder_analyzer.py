@@ -1,6 +1,7 @@
 # src/analysis/folder_analyzer.py
 from datetime import datetime
 import pandas as pd
+from src.analysis.folder_tree import FolderTree
 
 class FolderAnalyzer:
     """
@@ -12,7 +13,8 @@ class FolderAnalyzer:
         Initializes the FolderAnalyzer with a FormstackClient instance.
 
         Args:
-            formstack_client: An instance of FormstackClient to make API calls.
+            formstack_client: An instance of FormstackClient to make API calls, or a
+                              RequestDataContext wrapping one to share fetched data.
         """
         self.client = formstack_client
 
@@ -43,7 +45,8 @@ class FolderAnalyzer:
         Returns:
             list: A list of dictionaries, where each dictionary contains
                   summary information for a folder (id, name, parent_id,
-                  parent_name, subfolders, form_count, etc.)
+                  parent_name, subfolders, form_count, total_form_count
+                  including subfolders, folder_path, depth_level, etc.)
         """
         try:
             # Fetch raw data from Formstack API using the complete hierarchy method
@@ -61,9 +64,6 @@ class FolderAnalyzer:
                 print(f"Sample folder data structure: {list(folders_data[0].keys())}")
                 print(f"First folder: {folders_data[0]}")
             
-            # Create a mapping for easier parent/child lookups
-            folder_map = {folder['id']: folder for folder in folders_data}
-            
             # Count forms in each folder
             folder_form_counts = {}
             for form in forms_data:
@@ -71,6 +71,11 @@ class FolderAnalyzer:
                 if folder_id:
                     folder_form_counts[folder_id] = folder_form_counts.get(folder_id, 0) + 1
 
+            # Index the hierarchy once: children, paths, depths and subtree
+            # form counts are all computed in a single pass
+            folder_tree = FolderTree(folders_data, folder_form_counts)
+            folder_map = folder_tree.folders
+
             # Build folder summary data
             folder_summary = []
             
@@ -78,21 +83,19 @@ class FolderAnalyzer:
                 try:
                     folder_id = folder.get('id')
                     folder_name = folder.get('name', 'Unnamed Folder')
-                    parent_id = folder.get('parent', None)
+                    # Top-level folders may report a parent of "0" or ""
+                    parent_id = FolderTree.parent_of(folder)
                     
                     # Get parent folder name if it exists
                     parent_name = None
                     if parent_id and parent_id in folder_map:
                         parent_name = folder_map[parent_id].get('name', 'Unknown Parent')
                     
-                    # Find subfolders
-                    subfolders = []
-                    for other_folder in folders_data:
-                        if other_folder.get('parent') == folder_id:
-                            subfolders.append({
-                                'id': other_folder.get('id'),
-                                'name': other_folder.get('name', 'Unnamed Subfolder')
-                            })
+                    # Look up subfolders in the adjacency map
+                    subfolders = [{
+                        'id': subfolder_id,
+                        'name': folder_map[subfolder_id].get('name', 'Unnamed Subfolder')
+                    } for subfolder_id in folder_tree.subfolder_ids(folder_id)]
                     
                     # Get form count for this folder
                     form_count = folder_form_counts.get(folder_id, 0)
@@ -119,9 +122,11 @@ class FolderAnalyzer:
                         'subfolder_count': len(subfolders),
                         'subfolders': subfolders,
                         'form_count': form_count,
+                        'total_form_count': folder_tree.subtree_form_count(folder_id),
                         'created_at': created_at,
-                        'folder_path': self._build_folder_path(folder_id, folder_map),
-                        'depth_level': self._calculate_folder_depth(folder_id, folder_map)
+                        'folder_path': folder_tree.path(folder_id),
+                        'depth_level': folder_tree.depth(folder_id),
+                        'in_cycle': folder_tree.in_cycle(folder_id)
                     }
                     
                     folder_summary.append(folder_record)
@@ -138,68 +143,17 @@ class FolderAnalyzer:
             print(f"Error in get_folder_summary_data: {e}")
             return []
 
-    def _build_folder_path(self, folder_id, folder_map):
-        """
-        Builds a hierarchical path for a folder (e.g., "Parent > Child > Grandchild").
-        
-        Args:
-            folder_id: The ID of the folder to build path for
-            folder_map: Dictionary mapping folder IDs to folder data
-            
-        Returns:
-            str: The hierarchical path of the folder
-        """
-        path_parts = []
-        current_id = folder_id
-        max_depth = 10  # Prevent infinite loops
-        depth = 0
-        
-        while current_id and depth < max_depth:
-            if current_id in folder_map:
-                folder = folder_map[current_id]
-                path_parts.insert(0, folder.get('name', 'Unknown'))
-                current_id = folder.get('parent')
-            else:
-                break
-            depth += 1
-        
-        return ' > '.join(path_parts) if path_parts else 'Root'
-
-    def _calculate_folder_depth(self, folder_id, folder_map):
-        """
-        Calculates the depth level of a folder in the hierarchy (0 = root).
-        
-        Args:
-            folder_id: The ID of the folder to calculate depth for
-            folder_map: Dictionary mapping folder IDs to folder data
-            
-        Returns:
-            int: The depth level (0 for root folders)
-        """
-        depth = 0
-        current_id = folder_id
-        max_depth = 10  # Prevent infinite loops
-        
-        while current_id and depth < max_depth:
-            if current_id in folder_map:
-                folder = folder_map[current_id]
-                parent_id = folder.get('parent')
-                if parent_id:
-                    depth += 1
-                    current_id = parent_id
-                else:
-                    break
-            else:
-                break
-        
-        return depth
-
     def get_folder_stats(self):
         """
         Gets general statistics about folders.
+        Stats are computed from the top-level folder list and the forms; with a
+        RequestDataContext, these are the responses already fetched for the folder
+        summary, so no extra API calls are made.
         
         Returns:
-            dict: Statistics about folders (total count, root folders, etc.)
+            dict: Statistics about folders: total_folders (top-level folders),
+                  root_folders, folders_with_forms (folders holding at least one form)
+                  and total_forms_in_folders (forms in any folder).
         """
         try:
             folders_data = self.client.get_all_folders()
@@ -223,8 +177,8 @@ class FolderAnalyzer:
                     folders_with_forms.add(folder_id)
                     total_forms_in_folders += 1
             
-            # Count root folders
-            root_folders = sum(1 for folder in folders_data if not folder.get('parent'))
+            # Count root folders (top-level folders may report a parent of "0" or "")
+            root_folders = sum(1 for folder in folders_data if FolderTree.parent_of(folder) is None)
             
             return {
                 'total_folders': len(folders_data),
@@ -0,0 +1,158 @@
+# src/analysis/folder_tree.py
+from collections import deque
+
+class FolderTree:
+    """
+    A single-pass index over a flat list of Formstack folders.
+
+    Builds a parent -> children adjacency map once and computes every folder's
+    path, depth and subtree form count in one breadth-first traversal, so all
+    lookups afterwards are O(1). Parent cycles are detected and reported
+    instead of being cut off at an arbitrary depth.
+    """
+    # Separator used between folder names in a folder path
+    PATH_SEPARATOR = ' > '
+
+    # 'parent' values the API uses for top-level folders
+    ROOT_PARENT_VALUES = (None, '', '0', 0)
+
+    @classmethod
+    def parent_of(cls, folder):
+        """
+        Returns the parent ID of a folder, or None for a top-level folder
+        (the API reports those with a parent of "0", "" or no parent at all).
+        """
+        parent_id = folder.get('parent')
+        return None if parent_id in cls.ROOT_PARENT_VALUES else parent_id
+
+    def __init__(self, folders, form_counts=None):
+        """
+        Builds the tree index.
+
+        Args:
+            folders (list): Folder dictionaries with at least 'id', and optionally 'name' and 'parent'.
+            form_counts (dict, optional): Mapping of folder ID to the number of forms directly in it.
+        """
+        self.folders = {folder.get('id'): folder for folder in folders if folder.get('id') is not None}
+        self.form_counts = form_counts or {}
+        self.children = {folder_id: [] for folder_id in self.folders}
+        self.roots = []
+        self.cycles = []
+
+        for folder_id, folder in self.folders.items():
+            parent_id = self.parent_of(folder)
+            if parent_id is not None and parent_id in self.folders:
+                self.children[parent_id].append(folder_id)
+            else:
+                # No parent, or a parent that was not fetched: the folder starts a tree
+                self.roots.append(folder_id)
+
+        self._paths = {}
+        self._depths = {}
+        self._subtree_form_counts = {}
+        self._cycle_members = set()
+        self._build()
+
+    def _build(self):
+        """
+        Computes paths and depths top-down and subtree form counts bottom-up.
+        """
+        order = []
+        self._traverse(self.roots, order)
+
+        # Folders not reachable from a root are on (or below) a parent cycle
+        if len(order) < len(self.folders):
+            for cycle in self._find_cycles(set(self.folders) - set(self._paths)):
+                self.cycles.append(cycle)
+                self._cycle_members.update(cycle)
+                print(f"Warning: folder parent cycle detected: {' -> '.join(str(folder_id) for folder_id in cycle)}")
+                # Break the cycle by treating its first member as the top of its tree
+                self._traverse([cycle[0]], order)
+
+        for folder_id in reversed(order):
+            total = self.form_counts.get(folder_id, 0)
+            for child_id in self.children[folder_id]:
+                total += self._subtree_form_counts.get(child_id, 0)
+            self._subtree_form_counts[folder_id] = total
+
+    def _traverse(self, start_ids, order):
+        """
+        Breadth-first traversal from start_ids, assigning path and depth to every
+        folder not visited yet and appending it to order.
+        """
+        queue = deque()
+        for folder_id in start_ids:
+            if folder_id in self._paths:
+                continue
+            folder = self.folders[folder_id]
+            self._paths[folder_id] = folder.get('name', 'Unknown')
+            # A parent that exists but was not fetched still counts as one level
+            self._depths[folder_id] = 1 if self.parent_of(folder) is not None and folder_id not in self._cycle_members else 0
+            queue.append(folder_id)
+
+        while queue:
+            folder_id = queue.popleft()
+            order.append(folder_id)
+            for child_id in self.children[folder_id]:
+                if child_id in self._paths:
+                    continue
+                self._paths[child_id] = self._paths[folder_id] + self.PATH_SEPARATOR + self.folders[child_id].get('name', 'Unknown')
+                self._depths[child_id] = self._depths[folder_id] + 1
+                queue.append(child_id)
+
+    def _find_cycles(self, unvisited_ids):
+        """
+        Finds the parent cycles among folders that could not be reached from a root.
+
+        Args:
+            unvisited_ids (set): IDs of folders not reached by the traversal.
+
+        Returns:
+            list: Each cycle as a list of folder IDs in parent order.
+        """
+        cycles = []
+        settled = set()
+        for start_id in self.folders:
+            if start_id not in unvisited_ids or start_id in settled:
+                continue
+            chain = []
+            position = {}
+            current_id = start_id
+            while current_id in unvisited_ids and current_id not in settled and current_id not in position:
+                position[current_id] = len(chain)
+                chain.append(current_id)
+                current_id = self.parent_of(self.folders[current_id])
+            if current_id in position:
+                cycles.append(chain[position[current_id]:])
+            settled.update(chain)
+        return cycles
+
+    def path(self, folder_id):
+        """
+        Returns the hierarchical path of a folder (e.g., "Parent > Child > Grandchild").
+        """
+        return self._paths.get(folder_id, 'Root')
+
+    def depth(self, folder_id):
+        """
+        Returns the depth level of a folder in the hierarchy (0 = root).
+        """
+        return self._depths.get(folder_id, 0)
+
+    def subfolder_ids(self, folder_id):
+        """
+        Returns the IDs of the direct subfolders of a folder.
+        """
+        return self.children.get(folder_id, [])
+
+    def subtree_form_count(self, folder_id):
+        """
+        Returns the number of forms in a folder and all of its subfolders.
+        """
+        return self._subtree_form_counts.get(folder_id, 0)
+
+    def in_cycle(self, folder_id):
+        """
+        Returns True if the folder is part of a parent cycle.
+        """
+        return folder_id in self._cycle_members
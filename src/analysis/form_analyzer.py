@@ -13,95 +13,160 @@ class FormAnalyzer:
         Initializes the FormAnalyzer with a FormstackClient instance.
 
         Args:
-            formstack_client: An instance of FormstackClient to make API calls.
+            formstack_client: An instance of FormstackClient to make API calls, or a
+                              RequestDataContext wrapping one to share fetched data.
         """
         self.client = formstack_client
 
-    def _parse_formstack_date(self, date_string):
+    # Date format used by the Formstack API (e.g. "2024-05-01 12:00:00")
+    FORMSTACK_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+    # Raw form keys read from the API payload
+    RAW_FORM_COLUMNS = ['id', 'name', 'folder', 'created', 'last_submission_time',
+                        'submissions', 'submissions_unread', 'views', 'url', 'inactive']
+
+    # Columns of the form summary, in order
+    SUMMARY_COLUMNS = ['id', 'name', 'folder_id', 'folder_name', 'created_at', 'last_submission_at',
+                       'submissions_count', 'submissions_unread_count', 'views_count', 'form_url', 'is_inactive']
+
+    def _parse_formstack_dates(self, date_strings):
         """
-        Parses a Formstack API date string (e.g., "YYYY-MM-DD HH:MM:SS") into a datetime object.
-        Uses pandas.to_datetime for robustness.
+        Parses a column of Formstack API date strings (e.g., "YYYY-MM-DD HH:MM:SS")
+        into datetimes with a single vectorized call. The few values that do not match
+        the Formstack format are retried one by one with format inference (which works
+        on pandas 1.x as well as 2.x, unlike format='mixed').
 
         Args:
-            date_string (str): The date string from Formstack API.
+            date_strings (pd.Series): The date strings from Formstack API (may contain None).
 
         Returns:
-            datetime.datetime or pd.NaT: The parsed datetime object, or pd.NaT if parsing fails.
+            pd.Series: datetime64 values, with pd.NaT for empty or unparseable dates.
+        """
+        dates = pd.to_datetime(date_strings, format=self.FORMSTACK_DATE_FORMAT, errors='coerce')
+        unparsed = dates.isna() & date_strings.notna() & (date_strings.astype(str) != '')
+        if unparsed.any():
+            dates[unparsed] = date_strings[unparsed].map(self._parse_formstack_date)
+        return dates
+
+    @staticmethod
+    def _parse_formstack_date(date_string):
+        """
+        Parses one date string in any format pandas recognizes into a tz-naive
+        timestamp, or pd.NaT if it cannot be parsed.
         """
-        if not date_string:
-            return pd.NaT # Use Pandas Not a Time for null dates
         try:
-            # pandas.to_datetime is robust and can often infer the format.
-            # If not, you might specify format='%Y-%m-%d %H:%M:%S'
-            return pd.to_datetime(date_string, errors='coerce')
+            date = pd.to_datetime(date_string, errors='coerce')
         except Exception as e:
             print(f"Warning: Could not parse date string '{date_string}': {e}")
             return pd.NaT
+        if date is not pd.NaT and date.tzinfo is not None:
+            date = date.tz_convert(None)
+        return date
+
+    def get_form_summary_frame(self):
+        """
+        Fetches all forms and folders and builds the form summary directly as
+        a DataFrame from the raw form payloads. Dates, counts and flags are
+        converted column by column rather than form by form.
+
+        Returns:
+            pd.DataFrame: One row per form with the columns in SUMMARY_COLUMNS
+                          (id, name, folder_id, folder_name, created_at,
+                          last_submission_at, submissions_count,
+                          submissions_unread_count, views_count, form_url, is_inactive).
+                          Dates are datetime64 columns (NaT when missing).
+
+        Raises:
+            Exception: Whatever listing the forms raised, so that callers such as the
+                       summary refresher can keep their previous summary.
+        """
+        # 1. Fetch all folders and create a lookup map
+        folders = self.client.get_all_folders()
+        # Create a dictionary mapping folder ID to folder name for quick lookup
+        folder_map = {folder.get('id'): folder.get('name', 'Unknown Folder') for folder in folders}
+
+        # 2. Stream all forms page by page straight into a columnar frame
+        raw = pd.DataFrame.from_records(self.client.iter_forms(), columns=self.RAW_FORM_COLUMNS)
+        if raw.empty:
+            print("No forms found to analyze.")
+            return pd.DataFrame(columns=self.SUMMARY_COLUMNS)
+
+        # 3. Convert every column in bulk
+        return self._summarize_raw_forms(raw, folder_map)
+
+    def iter_form_summary_frames(self, chunk_size=5000):
+        """
+        Yields the form summary in frames of at most chunk_size forms, so that large
+        accounts can be processed (e.g. exported) without holding every form in memory.
+
+        Args:
+            chunk_size (int, optional): Maximum number of forms per frame. Defaults to 5000.
+
+        Yields:
+            pd.DataFrame: Frames with the same columns and types as get_form_summary_frame.
+        """
+        folders = self.client.get_all_folders()
+        folder_map = {folder.get('id'): folder.get('name', 'Unknown Folder') for folder in folders}
+
+        chunk = []
+        for form in self.client.iter_forms():
+            chunk.append(form)
+            if len(chunk) >= chunk_size:
+                yield self._summarize_raw_forms(
+                    pd.DataFrame.from_records(chunk, columns=self.RAW_FORM_COLUMNS), folder_map)
+                chunk = []
+        if chunk:
+            yield self._summarize_raw_forms(
+                pd.DataFrame.from_records(chunk, columns=self.RAW_FORM_COLUMNS), folder_map)
+
+    def _summarize_raw_forms(self, raw, folder_map):
+        """
+        Converts raw form payload columns (RAW_FORM_COLUMNS) into summary columns.
+
+        Args:
+            raw (pd.DataFrame): Raw form records.
+            folder_map (dict): Folder ID to folder name.
+
+        Returns:
+            pd.DataFrame: The summary frame (SUMMARY_COLUMNS).
+        """
+        summary = pd.DataFrame({
+            'id': raw['id'],
+            'name': raw['name'].fillna('Untitled Form'), # Provide a default name
+            'folder_id': raw['folder'].astype(object).where(raw['folder'].notna(), None),
+            'folder_name': raw['folder'].map(folder_map).fillna('Uncategorized Forms'),
+            'created_at': self._parse_formstack_dates(raw['created']),
+            'last_submission_at': self._parse_formstack_dates(raw['last_submission_time']),
+            'submissions_count': pd.to_numeric(raw['submissions'], errors='coerce').fillna(0).astype(int),
+            'submissions_unread_count': pd.to_numeric(raw['submissions_unread'], errors='coerce').fillna(0).astype(int),
+            'views_count': pd.to_numeric(raw['views'], errors='coerce').fillna(0).astype(int),
+            'form_url': raw['url'].fillna(''),
+            'is_inactive': raw['inactive'].astype(object).where(raw['inactive'].notna(), False).astype(bool)
+        }, columns=self.SUMMARY_COLUMNS)
+        return summary
 
     def get_form_summary_data(self):
         """
         Fetches all forms and folders, then extracts creation date,
         latest submission date, associated folder name, and other metrics
-        for each form.
+        for each form. This is a thin adapter over get_form_summary_frame.
 
         Returns:
             list: A list of dictionaries, where each dictionary contains
-                  summary information for a form (id, name, created_at,
-                  last_submission_at, folder_name, submissions_count,
+                  summary information for a form (id, name, folder_id,
+                  folder_name, created_at, last_submission_at, submissions_count,
                   submissions_unread_count, views_count, form_url, is_inactive).
-                  Dates are datetime objects (or pd.NaT).
+                  Dates are datetime objects (or pd.NaT). Returns an empty list if
+                  the forms cannot be fetched.
         """
-        all_forms_summary = []
-        
-        # 1. Fetch all forms
-        forms = self.client.get_all_forms() 
-        if not forms:
-            print("No forms found to analyze.")
+        try:
+            summary = self.get_form_summary_frame()
+        except Exception as e:
+            print(f"Error fetching forms to analyze: {e}")
             return []
-
-        # 2. Fetch all folders and create a lookup map
-        folders = self.client.get_all_folders()
-        # Create a dictionary mapping folder ID to folder name for quick lookup
-        folder_map = {folder.get('id'): folder.get('name', 'Unknown Folder') for folder in folders}
-
-        # 3. Process each form
-        for form in forms:
-            form_id = form.get('id')
-            form_name = form.get('name', 'Untitled Form') # Provide a default name
-            
-            # Retrieve basic dates and IDs
-            form_created_at_str = form.get('created') 
-            last_submission_time_str = form.get('last_submission_time')
-            folder_id = form.get('folder')
-
-            # Retrieve new fields
-            submissions_count = int(form.get('submissions', 0)) # Convert to int, default to 0
-            submissions_unread_count = int(form.get('submissions_unread', 0)) # Convert to int, default to 0
-            views_count = int(form.get('views', 0)) # Convert to int, default to 0
-            form_url = form.get('url', '') # Get form URL
-            is_inactive = bool(form.get('inactive', False)) # Convert to boolean
-
-            # Look up folder name
-            folder_name = folder_map.get(folder_id, 'Uncategorized Forms') 
-
-            # Parse dates
-            form_created_at = self._parse_formstack_date(form_created_at_str)
-            last_submission_date = self._parse_formstack_date(last_submission_time_str)
-
-            all_forms_summary.append({
-                'id': form_id,
-                'name': form_name,
-                'folder_name': folder_name, 
-                'created_at': form_created_at, 
-                'last_submission_at': last_submission_date,
-                'submissions_count': submissions_count, # New field
-                'submissions_unread_count': submissions_unread_count, # New field
-                'views_count': views_count, # New field
-                'form_url': form_url, # New field
-                'is_inactive': is_inactive # New field
-            })
-        
-        return all_forms_summary
+        if summary.empty:
+            return []
+        return summary.to_dict(orient='records')
 
 # Example Usage (for testing purposes when running this file directly)
 if __name__ == "__main__":
@@ -112,10 +177,9 @@ if __name__ == "__main__":
         analyzer = FormAnalyzer(client)
         
         print("Starting form analysis...")
-        summary_data = analyzer.get_form_summary_data()
+        df = analyzer.get_form_summary_frame()
 
-        if summary_data:
-            df = pd.DataFrame(summary_data)
+        if not df.empty:
             # Format dates for display
             df['created_at'] = df['created_at'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('N/A')
             df['last_submission_at'] = df['last_submission_at'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('No Submissions')
@@ -0,0 +1,339 @@
+# src/analysis/form_query.py
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from src.analysis.config_index import FormConfigIndex
+
+class FormQuery:
+    """
+    A read-only query index over the form summary frame (FormAnalyzer.get_form_summary_frame)
+    for server-side pagination, sorting and filtering.
+
+    Everything that does not depend on the query is computed once when the index
+    is built: JSON-ready rows, lower-cased search columns and, for every sortable
+    column, its ascending and descending row order. An unfiltered page sorted on
+    one column is then a slice of a precomputed order, and the row order of every
+    other (filters, sort) combination is computed once with vectorized operations
+    and kept in a small LRU cache, so paging through it only costs the page size.
+
+    The 'has' filter (e.g. has=webhooks,notifications) selects forms by their
+    configuration using a FormConfigIndex, without calling the API.
+    """
+    # Columns that can be sorted on, and the default sort (newest forms first)
+    SORTABLE_COLUMNS = [
+        'name', 'id', 'folder_name', 'created_at', 'last_submission_at',
+        'submissions_count', 'submissions_unread_count', 'views_count', 'is_inactive'
+    ]
+    DEFAULT_SORT = '-created_at'
+
+    # Page size limits
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 500
+
+    # Number of (filters, sort) row orders kept in memory
+    RESULT_CACHE_SIZE = 64
+
+    # Query string parameters accepted as filters
+    FILTER_PARAMS = [
+        'search', 'name', 'id', 'folder', 'folder_id', 'status', 'has',
+        'submissions_min', 'submissions_max',
+        'created_from', 'created_to', 'last_submission_from', 'last_submission_to'
+    ]
+
+    DISPLAY_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+    def __init__(self, form_frame, config_index=None):
+        """
+        Builds the index.
+
+        Args:
+            form_frame (pd.DataFrame): The form summary frame. It is not modified.
+            config_index (FormConfigIndex, optional): Configuration index used by the 'has' filter.
+        """
+        frame = form_frame.reset_index(drop=True)
+        self.size = len(frame)
+        self.config_index = config_index
+        self._config_positions = None
+        self._config_layout_version = None
+
+        # Typed columns used by the filters
+        self._created_at = frame['created_at'] if 'created_at' in frame else pd.Series(pd.NaT, index=frame.index)
+        self._last_submission_at = frame['last_submission_at'] if 'last_submission_at' in frame else pd.Series(pd.NaT, index=frame.index)
+        self._submissions = frame['submissions_count'].fillna(0).to_numpy() if self.size else np.zeros(0)
+        self._inactive = frame['is_inactive'].fillna(False).astype(bool).to_numpy() if self.size else np.zeros(0, dtype=bool)
+        self._ids = frame['id'].astype(str) if self.size else pd.Series([], dtype=object)
+        self._names = frame['name'].fillna('').astype(str).str.lower() if self.size else pd.Series([], dtype=object)
+        self._folder_names = frame['folder_name'].fillna('').astype(str) if self.size else pd.Series([], dtype=object)
+        self._folder_ids = frame['folder_id'].astype(str) if self.size else pd.Series([], dtype=object)
+        self._search_text = (
+            self._names + ' ' + self._ids + ' ' + self._folder_names.str.lower() + ' '
+            + frame['form_url'].fillna('').astype(str).str.lower()
+        ) if self.size else pd.Series([], dtype=object)
+
+        self.records = self._build_records(frame)
+        self._stats = {
+            'total_forms': self.size,
+            'active_forms': int((~self._inactive).sum()),
+            'total_submissions': int(sum(record['submissions_count'] for record in self.records)),
+            'unread_submissions': int(sum(record['submissions_unread_count'] for record in self.records))
+        }
+        self.folder_names = sorted(name for name in self._folder_names.unique() if name) if self.size else []
+
+        # Per-column sort ranks (missing values always rank last) and precomputed orders
+        self._ranks = {}
+        self._orders = {}
+        for column in self.SORTABLE_COLUMNS:
+            if column not in frame:
+                continue
+            key = self._sort_key(frame[column], column)
+            for descending in (False, True):
+                rank = key.rank(method='min', ascending=not descending, na_option='bottom').to_numpy()
+                self._ranks[(column, descending)] = rank
+                self._orders[(column, descending)] = np.argsort(rank, kind='stable')
+
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _sort_key(series, column):
+        """
+        Returns the values a column is sorted by: case-insensitive text,
+        and IDs numerically when they are all numeric.
+        """
+        if column == 'id':
+            numeric_ids = pd.to_numeric(series, errors='coerce')
+            return numeric_ids if numeric_ids.notna().all() else series.astype(str)
+        if column in ('name', 'folder_name'):
+            return series.str.lower()
+        if column == 'is_inactive':
+            return series.astype(float)
+        return series
+
+    def _build_records(self, frame):
+        """
+        Converts the frame into JSON-serializable rows, formatted like the dashboard tables.
+        """
+        if frame.empty:
+            return []
+        display = frame.copy()
+        display['created_at'] = display['created_at'].dt.strftime(self.DISPLAY_DATE_FORMAT).fillna('N/A')
+        display['last_submission_at'] = display['last_submission_at'].dt.strftime(self.DISPLAY_DATE_FORMAT).fillna('No Submissions')
+        display = display.fillna({
+            'submissions_count': 0,
+            'submissions_unread_count': 0,
+            'views_count': 0,
+            'form_url': '',
+            'folder_name': 'Uncategorized',
+            'name': 'Untitled Form'
+        })
+        display['submissions_count'] = display['submissions_count'].astype(int)
+        display['submissions_unread_count'] = display['submissions_unread_count'].astype(int)
+        display['views_count'] = display['views_count'].astype(int)
+        display['is_inactive'] = display['is_inactive'].astype(bool)
+        return display.to_dict(orient='records')
+
+    def stats(self):
+        """
+        Returns the dashboard totals: total and active forms, total and unread submissions.
+        """
+        return dict(self._stats)
+
+    @classmethod
+    def parse_sort(cls, sort):
+        """
+        Parses a sort specification such as "-created_at,name" (a leading "-" sorts descending).
+
+        Returns:
+            tuple: (column, descending) pairs.
+
+        Raises:
+            ValueError: If a column cannot be sorted on.
+        """
+        keys = []
+        for part in (sort or cls.DEFAULT_SORT).split(','):
+            part = part.strip()
+            if not part:
+                continue
+            descending = part.startswith('-')
+            column = part.lstrip('-+')
+            if column not in cls.SORTABLE_COLUMNS:
+                raise ValueError(f"Cannot sort by '{column}'. Sortable columns: {', '.join(cls.SORTABLE_COLUMNS)}")
+            keys.append((column, descending))
+        return tuple(keys) or cls.parse_sort(cls.DEFAULT_SORT)
+
+    @classmethod
+    def parse_filters(cls, params):
+        """
+        Extracts and validates the filter parameters of a query.
+
+        Args:
+            params (Mapping): Query parameters (e.g. request.args).
+
+        Returns:
+            tuple: Sorted (name, value) pairs of the non-empty filters.
+
+        Raises:
+            ValueError: If a filter value is invalid.
+        """
+        filters = {}
+        for name in cls.FILTER_PARAMS:
+            value = params.get(name)
+            if value is None or str(value).strip() == '':
+                continue
+            value = str(value).strip()
+            if name == 'status' and value not in ('active', 'inactive'):
+                raise ValueError("status must be 'active' or 'inactive'")
+            if name == 'has':
+                config_types = sorted({config_type.strip() for config_type in value.split(',') if config_type.strip()})
+                invalid = [config_type for config_type in config_types if config_type not in FormConfigIndex.CONFIG_TYPES]
+                if invalid:
+                    raise ValueError(f"Unknown configuration type '{invalid[0]}'. Valid types: {', '.join(FormConfigIndex.CONFIG_TYPES)}")
+                if not config_types:
+                    continue
+                value = ','.join(config_types)
+            if name in ('submissions_min', 'submissions_max'):
+                try:
+                    value = int(value)
+                except ValueError:
+                    raise ValueError(f"{name} must be an integer")
+            if name.endswith('_from') or name.endswith('_to'):
+                try:
+                    timestamp = pd.Timestamp(value)
+                except (TypeError, ValueError):
+                    raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
+                if timestamp is pd.NaT:
+                    raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
+                if timestamp.tzinfo is not None:
+                    # The date columns are tz-naive: compare in UTC without the offset
+                    timestamp = timestamp.tz_convert(None)
+                value = timestamp.isoformat()
+            filters[name] = value
+        return tuple(sorted(filters.items()))
+
+    def _mask(self, filters):
+        """
+        Returns a boolean array selecting the forms that match every filter.
+        """
+        mask = np.ones(self.size, dtype=bool)
+        for name, value in filters:
+            if name == 'search':
+                mask &= self._search_text.str.contains(value.lower(), regex=False).to_numpy()
+            elif name == 'name':
+                mask &= self._names.str.contains(value.lower(), regex=False).to_numpy()
+            elif name == 'id':
+                mask &= self._ids.str.contains(value, regex=False).to_numpy()
+            elif name == 'folder':
+                mask &= (self._folder_names == value).to_numpy()
+            elif name == 'folder_id':
+                mask &= (self._folder_ids == value).to_numpy()
+            elif name == 'status':
+                mask &= self._inactive if value == 'inactive' else ~self._inactive
+            elif name == 'has':
+                mask &= self._config_mask(value.split(','))
+            elif name == 'submissions_min':
+                mask &= self._submissions >= value
+            elif name == 'submissions_max':
+                mask &= self._submissions <= value
+            elif name in ('created_from', 'last_submission_from'):
+                dates = self._created_at if name == 'created_from' else self._last_submission_at
+                mask &= (dates >= pd.Timestamp(value)).to_numpy()
+            elif name in ('created_to', 'last_submission_to'):
+                dates = self._created_at if name == 'created_to' else self._last_submission_at
+                # Date-only bounds include the whole day
+                end = pd.Timestamp(value)
+                if end == end.normalize():
+                    end += pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+                mask &= (dates <= end).to_numpy()
+        return mask
+
+    def _config_mask(self, config_types):
+        """
+        Returns a boolean array selecting the forms that have every configuration type.
+        Forms whose configuration is not indexed yet never match.
+        """
+        if self.config_index is None:
+            return np.zeros(self.size, dtype=bool)
+        # The rows' bit positions only change when forms are added to or removed from the index
+        layout_version = self.config_index.layout_version
+        if self._config_layout_version != layout_version:
+            self._config_positions = self.config_index.positions(self._ids)
+            self._config_layout_version = layout_version
+        return self.config_index.mask(self._config_positions, config_types)
+
+    def _ordered_rows(self, filters, sort_keys):
+        """
+        Returns the row positions matching filters, in sort order (cached per query).
+        """
+        if not filters and len(sort_keys) == 1 and sort_keys[0] in self._orders:
+            return self._orders[sort_keys[0]]
+
+        cache_key = (filters, sort_keys)
+        if self.config_index is not None and any(name == 'has' for name, _ in filters):
+            # Configuration filters are only valid for the current state of the index
+            cache_key += (self.config_index.version,)
+        with self._lock:
+            if cache_key in self._results:
+                self._results.move_to_end(cache_key)
+                return self._results[cache_key]
+
+        if len(sort_keys) == 1:
+            order = self._orders[sort_keys[0]]
+        else:
+            # np.lexsort sorts by its last key first
+            order = np.lexsort([self._ranks[key] for key in reversed(sort_keys)])
+        if filters:
+            order = order[self._mask(filters)[order]]
+
+        with self._lock:
+            self._results[cache_key] = order
+            while len(self._results) > self.RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return order
+
+    def matching_records(self, params):
+        """
+        Returns every row matching the filters in params, in the requested sort
+        order ('sort'), without pagination.
+
+        Raises:
+            ValueError: If a parameter is invalid.
+        """
+        if not self.size:
+            return []
+        order = self._ordered_rows(self.parse_filters(params), self.parse_sort(params.get('sort')))
+        return [self.records[position] for position in order]
+
+    def query(self, params):
+        """
+        Runs a paginated, sorted and filtered query.
+
+        Args:
+            params (Mapping): Query parameters: the FILTER_PARAMS, 'sort'
+                              (e.g. "-created_at,name"), 'page' and 'per_page'.
+
+        Returns:
+            dict: forms (the rows of the page), total, page, per_page, pages and sort.
+
+        Raises:
+            ValueError: If a parameter is invalid.
+        """
+        filters = self.parse_filters(params)
+        sort_keys = self.parse_sort(params.get('sort'))
+        try:
+            page = max(1, int(params.get('page', 1)))
+            per_page = int(params.get('per_page', self.DEFAULT_PAGE_SIZE))
+        except ValueError:
+            raise ValueError("page and per_page must be integers")
+        per_page = min(max(1, per_page), self.MAX_PAGE_SIZE)
+
+        order = self._ordered_rows(filters, sort_keys) if self.size else np.zeros(0, dtype=int)
+        start = (page - 1) * per_page
+        return {
+            'forms': [self.records[position] for position in order[start:start + per_page]],
+            'total': int(len(order)),
+            'page': page,
+            'per_page': per_page,
+            'pages': (len(order) + per_page - 1) // per_page,
+            'sort': ','.join(('-' if descending else '') + column for column, descending in sort_keys)
+        }
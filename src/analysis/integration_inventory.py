@@ -0,0 +1,342 @@
+# src/analysis/integration_inventory.py
+import json
+import os
+import threading
+import time
+from dotenv import load_dotenv
+from src.api.integration_detector import IntegrationDetector
+from src.api.job_progress import JobCancelled, current_job
+
+# Load environment variables from .env file.
+# This ensures that FORMSTACK_INTEGRATION_INVENTORY_PATH is available for the default inventory location.
+load_dotenv()
+
+class IntegrationInventory:
+    """
+    An account-wide inventory of the integrations detected in form fields,
+    indexed by integration type so "which forms use Stripe?" is answered without
+    fetching or scanning any fields.
+
+    The inventory is filled from the FieldCatalog, which already holds the fields
+    of every form: update() runs the IntegrationDetector over the catalogued fields
+    of new forms and of forms rescanned by the catalog since the last update, so
+    form fields are only ever fetched by the catalog's crawl. The inventory is
+    saved to a JSON file after every batch; a file written with another indicator
+    set is ignored, since its detections would be out of date.
+    """
+    # Default location of the inventory file
+    DEFAULT_PATH = os.getenv("FORMSTACK_INTEGRATION_INVENTORY_PATH", "formstack_integration_inventory.json")
+
+    # Number of forms whose fields are scanned between two saves of the inventory
+    CRAWL_BATCH_SIZE = 100
+
+    # Version of the file format; files with another version are ignored
+    FILE_VERSION = 1
+
+    def __init__(self, path=None, detector=None):
+        """
+        Initializes the inventory and loads it from path if the file exists.
+
+        Args:
+            path (str, optional): Path of the JSON file. Defaults to DEFAULT_PATH.
+                                  Pass False (or '') to keep the inventory in memory only.
+            detector (IntegrationDetector, optional): Defaults to an IntegrationDetector
+                                                      with the default indicators.
+        """
+        self.path = self.DEFAULT_PATH if path is None else path
+        self.detector = detector or IntegrationDetector()
+        self._forms = {}  # form ID -> {'name', 'updated', 'detections'}
+        self._forms_by_type = {}  # integration type -> set of form IDs
+
+        self.crawling = False
+        self.progress = {'done': 0, 'total': 0}
+        self.last_crawl_at = None
+        self.last_crawl_summary = None
+        self.last_error = None
+        self._lock = threading.RLock()
+        self._crawl_lock = threading.Lock()
+
+        if self.path:
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def set_fields(self, form_id, fields, name=None, updated=None):
+        """
+        Records the integrations detected in one form's fields, replacing earlier ones.
+
+        Args:
+            form_id (str or int): The form ID.
+            fields (list): The form's fields.
+            name (str, optional): The form name, reported by queries.
+            updated (str, optional): The form's 'updated' value when the fields were fetched.
+        """
+        self._set_detections(str(form_id), self.detector.detect(fields), name, updated)
+
+    def set_many_fields(self, forms, fields_per_form):
+        """
+        Records the integrations detected in the fields of many forms (one scan for all).
+
+        Args:
+            forms (list): Form dictionaries with 'id' and optionally 'name' and 'updated'.
+            fields_per_form (list): The field list of each form, in the same order.
+        """
+        for form, detections in zip(forms, self.detector.detect_many(fields_per_form)):
+            self._set_detections(str(form['id']), detections, form.get('name'), form.get('updated'))
+
+    def _set_detections(self, form_id, detections, name, updated):
+        with self._lock:
+            self.remove(form_id)
+            self._forms[form_id] = {'name': name, 'updated': updated, 'detections': detections}
+            for detection in detections:
+                self._forms_by_type.setdefault(detection['type'], set()).add(form_id)
+
+    def remove(self, form_id):
+        """
+        Drops a form from the inventory.
+        """
+        form_id = str(form_id)
+        with self._lock:
+            entry = self._forms.pop(form_id, None)
+            if entry is None:
+                return
+            for detection in entry['detections']:
+                form_ids = self._forms_by_type.get(detection['type'])
+                if form_ids is not None:
+                    form_ids.discard(form_id)
+                    if not form_ids:
+                        del self._forms_by_type[detection['type']]
+
+    def update(self, data_source, forms=None, full=False):
+        """
+        Scans the fields of new and changed forms and drops removed forms.
+        Only one crawl runs at a time; a call made while another crawl is running
+        returns None immediately. Progress is reported to the current job
+        (job_progress.current_job), and cancelling the job stops the crawl after
+        saving the forms scanned so far.
+
+        Args:
+            data_source: The FieldCatalog to read forms and fields from (or anything
+                         with get_all_forms and get_forms_fields).
+            forms (list, optional): The current forms. Read from data_source when omitted.
+            full (bool): If True, rescan every form.
+
+        Returns:
+            dict: Number of forms 'scanned', 'failed' (left for the next crawl), 'removed'
+                  and 'unchanged', or None if
+                  another crawl is running.
+        """
+        if not self._crawl_lock.acquire(blocking=False):
+            return None
+        self.crawling = True
+        try:
+            if forms is None:
+                forms = data_source.get_all_forms()
+            current = {str(form['id']): form for form in forms if form.get('id') is not None}
+
+            with self._lock:
+                removed_ids = [form_id for form_id in self._forms if form_id not in current]
+                for form_id in removed_ids:
+                    self.remove(form_id)
+                to_scan = [form_id for form_id, form in current.items()
+                           if full or form_id not in self._forms or self._forms[form_id]['updated'] != form.get('updated')]
+
+            job = current_job()
+            if job is not None:
+                job.set_total(len(to_scan))
+            self.progress = {'done': 0, 'total': len(to_scan)}
+            failed = 0
+            for start in range(0, len(to_scan), self.CRAWL_BATCH_SIZE):
+                batch = to_scan[start:start + self.CRAWL_BATCH_SIZE]
+                fields_per_form = data_source.get_forms_fields(batch)
+                if job is not None:
+                    # Calls interrupted by a cancellation return empty lists: do not record them
+                    job.raise_if_cancelled()
+                # Forms whose fields could not be fetched (None) are left for the next crawl
+                fetched = [(current[form_id], fields) for form_id, fields in zip(batch, fields_per_form)
+                           if fields is not None]
+                failed += len(batch) - len(fetched)
+                self.set_many_fields([form for form, _ in fetched], [fields for _, fields in fetched])
+                self.progress = {'done': self.progress['done'] + len(batch), 'total': len(to_scan)}
+                if job is not None:
+                    job.advance(len(batch))
+                self.save()
+
+            if removed_ids and not to_scan:
+                self.save()
+
+            summary = {'scanned': len(to_scan) - failed, 'failed': failed, 'removed': len(removed_ids),
+                       'unchanged': len(current) - len(to_scan)}
+            self.last_crawl_at = time.time()
+            self.last_crawl_summary = summary
+            self.last_error = None
+            print(f"Integration inventory updated: {summary['scanned']} scanned, {summary['failed']} failed, "
+                  f"{summary['removed']} removed, {summary['unchanged']} unchanged")
+            return summary
+        except JobCancelled as e:
+            self.save()
+            self.last_error = e
+            print(f"Integration inventory crawl cancelled after {self.progress['done']} forms")
+            return None
+        except Exception as e:
+            self.last_error = e
+            print(f"Error updating integration inventory: {e}")
+            return None
+        finally:
+            self.crawling = False
+            self._crawl_lock.release()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def types(self):
+        """
+        Returns the detected integration types, most widely used first.
+
+        Returns:
+            list: Dictionaries with 'type', 'forms' (number of forms), 'fields'
+                  (number of matching fields) and 'confidence' (the indicator weight).
+        """
+        with self._lock:
+            summary = []
+            for integration_type, form_ids in self._forms_by_type.items():
+                fields = sum(1 for form_id in form_ids for detection in self._forms[form_id]['detections']
+                             if detection['type'] == integration_type)
+                summary.append({
+                    'type': integration_type,
+                    'forms': len(form_ids),
+                    'fields': fields,
+                    'confidence': self.detector.indicators.get(integration_type)
+                })
+        summary.sort(key=lambda entry: (-entry['forms'], entry['type']))
+        return summary
+
+    def forms_with(self, integration_type, min_confidence=None):
+        """
+        Returns the forms with fields of one integration type.
+
+        Args:
+            integration_type (str): An indicator keyword (e.g. "stripe").
+            min_confidence (float, optional): Only report detections with at least this confidence.
+
+        Returns:
+            list: Dictionaries with 'form_id', 'form_name' and 'fields' (field_id,
+                  field_name and confidence of the matching fields), sorted by form name.
+        """
+        integration_type = str(integration_type).lower()
+        with self._lock:
+            forms = []
+            for form_id in self._forms_by_type.get(integration_type, ()):
+                entry = self._forms[form_id]
+                fields = [{'field_id': detection['field_id'], 'field_name': detection['field_name'],
+                           'confidence': detection['confidence']}
+                          for detection in entry['detections']
+                          if detection['type'] == integration_type
+                          and (min_confidence is None or detection['confidence'] >= min_confidence)]
+                if fields:
+                    forms.append({'form_id': form_id, 'form_name': entry['name'], 'fields': fields})
+        forms.sort(key=lambda form: (str(form['form_name'] or '').lower(), form['form_id']))
+        return forms
+
+    def detections(self, form_id):
+        """
+        Returns the integrations detected for one form, or None if it has not been scanned.
+        """
+        with self._lock:
+            entry = self._forms.get(str(form_id))
+            return [dict(detection) for detection in entry['detections']] if entry else None
+
+    def status(self):
+        """
+        Returns the inventory size and crawl state.
+
+        Returns:
+            dict: scanned (forms in the inventory), forms_with_integrations, crawling,
+                  progress, last_crawl_at, last_crawl_summary, last_error and path.
+        """
+        with self._lock:
+            scanned = len(self._forms)
+            with_integrations = sum(1 for entry in self._forms.values() if entry['detections'])
+        return {
+            'scanned': scanned,
+            'forms_with_integrations': with_integrations,
+            'crawling': self.crawling,
+            'progress': dict(self.progress),
+            'last_crawl_at': self.last_crawl_at,
+            'last_crawl_summary': self.last_crawl_summary,
+            'last_error': str(self.last_error) if self.last_error else None,
+            'path': self.path or None
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self):
+        """
+        Writes the inventory to its JSON file (no-op for in-memory inventories).
+        The file is replaced atomically, so a crash never leaves a partial inventory.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            data = {
+                'version': self.FILE_VERSION,
+                'saved_at': time.time(),
+                'last_crawl_at': self.last_crawl_at,
+                'indicators': self.detector.indicators,
+                'forms': {form_id: {'name': entry['name'], 'updated': entry['updated'],
+                                    'detections': [[detection['type'], detection['field_id'], detection['field_name']]
+                                                   for detection in entry['detections']]}
+                          for form_id, entry in self._forms.items()}
+            }
+        temporary_path = f"{self.path}.tmp"
+        try:
+            with open(temporary_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(temporary_path, self.path)
+        except OSError as e:
+            print(f"Error saving integration inventory to {self.path}: {e}")
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get('version') != self.FILE_VERSION:
+                print(f"Ignoring integration inventory {self.path}: unsupported version {data.get('version')}")
+                return
+            if data.get('indicators') != self.detector.indicators:
+                print(f"Ignoring integration inventory {self.path}: it was built with other indicators")
+                return
+            for form_id, entry in data['forms'].items():
+                detections = [{'type': integration_type, 'field_id': field_id, 'field_name': field_name,
+                               'detected_from': 'field_analysis',
+                               'confidence': self.detector.indicators.get(integration_type)}
+                              for integration_type, field_id, field_name in entry['detections']]
+                self._set_detections(form_id, detections, entry.get('name'), entry.get('updated'))
+            self.last_crawl_at = data.get('last_crawl_at')
+            print(f"Loaded integration inventory with {len(self._forms)} forms from {self.path}")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Error loading integration inventory from {self.path}: {e}")
+            self._forms = {}
+            self._forms_by_type = {}
+
+
+# Example Usage: build the inventory from the command line
+if __name__ == "__main__":
+    from src.api.formstack_client import FormstackClient
+    from src.storage.field_catalog import FieldCatalog
+    try:
+        catalog = FieldCatalog()
+        catalog.update(FormstackClient())
+        inventory = IntegrationInventory()
+        inventory.update(catalog)
+        for entry in inventory.types():
+            print(f"  {entry['type']}: {entry['forms']} forms, {entry['fields']} fields")
+    except Exception as e:
+        print(f"An error occurred while building the integration inventory: {e}")
@@ -0,0 +1,359 @@
+# src/analysis/search_index.py
+import heapq
+import re
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from itertools import islice
+
+class FormSearchIndex:
+    """
+    An in-memory inverted index for searching forms by name, folder path and ID.
+
+    Each field has a token index (token -> form IDs) with a sorted vocabulary for
+    prefix lookups, and a trigram index (3-character substring -> form IDs) for
+    substring lookups. Every query token must match a form in at
+    least one field; forms are ranked by how well each token matched (exact ID
+    first, then ID prefix, exact name word, name word prefix, substrings, ...).
+
+    The index is updated incrementally: update() only re-indexes forms whose name
+    or folder path changed and drops forms that no longer exist.
+    """
+    # Score of each kind of match for one query token; the best match per token counts
+    MATCH_WEIGHTS = {
+        'id_exact': 100,
+        'id_prefix': 60,
+        'name_exact': 50,
+        'name_prefix': 40,
+        'id_substring': 30,
+        'name_substring': 20,
+        'folder_exact': 15,
+        'folder_prefix': 10,
+        'folder_substring': 5,
+    }
+
+    # Substring matches need at least this many characters (the n-gram size)
+    NGRAM_SIZE = 3
+
+    # Default and maximum number of results returned by search()
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 200
+
+    # Number of recent query results kept until the index changes
+    RESULT_CACHE_SIZE = 256
+
+    # Prefixes up to this length match large parts of the index; their matches are
+    # kept until the index changes
+    CACHED_PREFIX_LENGTH = 2
+
+    FIELDS = ('id', 'name', 'folder')
+
+    _TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+    def __init__(self):
+        self._docs = {}  # form ID -> (name, folder_path)
+        self._texts = {field: {} for field in self.FIELDS}  # field -> form ID -> normalized text
+        self._postings = {field: {} for field in self.FIELDS}
+        self._vocabulary = {field: [] for field in self.FIELDS}
+        self._trigrams = {field: {} for field in self.FIELDS}
+        self._doc_terms = {}  # form ID -> {field: (tokens, trigrams)}
+        # Forms in tie-break order (shorter, then alphabetically smaller names first) and
+        # each form's position in it, rebuilt lazily after changes
+        self._order = None
+        self._ranks = None
+        self._prefixes = {}  # (field, prefix) -> form IDs, for short prefixes
+        self._results = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._docs)
+
+    @classmethod
+    def tokenize(cls, text):
+        """
+        Splits text into lower-case alphanumeric tokens.
+        """
+        return cls._TOKEN_PATTERN.findall(str(text or '').lower())
+
+    @classmethod
+    def _ngrams(cls, text):
+        return {text[i:i + cls.NGRAM_SIZE] for i in range(len(text) - cls.NGRAM_SIZE + 1)}
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def add(self, form_id, name, folder_path=''):
+        """
+        Adds a form to the index, replacing any previous entry with the same ID.
+
+        Args:
+            form_id (str or int): The form ID.
+            name (str): The form name.
+            folder_path (str, optional): The folder path (e.g. "Parent > Child").
+        """
+        form_id = str(form_id)
+        name = name or ''
+        folder_path = folder_path or ''
+        texts = {'id': form_id.lower(), 'name': str(name).lower(), 'folder': str(folder_path).lower()}
+        terms = {
+            'id': ({texts['id']}, self._ngrams(texts['id'])),
+            'name': (set(self.tokenize(texts['name'])), self._ngrams(texts['name'])),
+            'folder': (set(self.tokenize(texts['folder'])), self._ngrams(texts['folder'])),
+        }
+
+        with self._lock:
+            self.remove(form_id)
+            self._docs[form_id] = (name, folder_path)
+            self._doc_terms[form_id] = terms
+            for field, (tokens, trigrams) in terms.items():
+                self._texts[field][form_id] = texts[field]
+                postings = self._postings[field]
+                for token in tokens:
+                    if token not in postings:
+                        postings[token] = set()
+                        insort(self._vocabulary[field], token)
+                    postings[token].add(form_id)
+                trigram_postings = self._trigrams[field]
+                for trigram in trigrams:
+                    trigram_postings.setdefault(trigram, set()).add(form_id)
+            self._changed()
+
+    def remove(self, form_id):
+        """
+        Removes a form from the index (no-op if it is not indexed).
+        """
+        form_id = str(form_id)
+        with self._lock:
+            terms = self._doc_terms.pop(form_id, None)
+            if terms is None:
+                return
+            del self._docs[form_id]
+            for field, (tokens, trigrams) in terms.items():
+                del self._texts[field][form_id]
+                postings = self._postings[field]
+                for token in tokens:
+                    postings[token].discard(form_id)
+                    if not postings[token]:
+                        del postings[token]
+                        vocabulary = self._vocabulary[field]
+                        del vocabulary[bisect_left(vocabulary, token)]
+                trigram_postings = self._trigrams[field]
+                for trigram in trigrams:
+                    trigram_postings[trigram].discard(form_id)
+                    if not trigram_postings[trigram]:
+                        del trigram_postings[trigram]
+            self._changed()
+
+    def _changed(self):
+        # Cached results and tie-break ranks are no longer valid
+        self._order = None
+        self._ranks = None
+        self._prefixes.clear()
+        self._results.clear()
+
+    def update(self, forms, folder_paths=None):
+        """
+        Brings the index in line with the current forms: new and changed forms are
+        (re-)indexed, forms that are no longer present are removed, and unchanged
+        forms are left alone.
+
+        Args:
+            forms (iterable): Form dictionaries with 'id', 'name' and 'folder_id'
+                              (e.g. FormQuery.records).
+            folder_paths (dict, optional): Mapping of folder ID to folder path.
+
+        Returns:
+            dict: Number of forms 'indexed' (new or changed) and 'removed'.
+        """
+        folder_paths = folder_paths or {}
+        current = {}
+        for form in forms:
+            if form.get('id') is None:
+                continue
+            folder_id = form.get('folder_id')
+            folder_path = folder_paths.get(str(folder_id), form.get('folder_name') or '') if folder_id is not None else ''
+            current[str(form['id'])] = (form.get('name') or '', folder_path)
+
+        indexed = 0
+        with self._lock:
+            removed_ids = [form_id for form_id in self._docs if form_id not in current]
+            for form_id in removed_ids:
+                self.remove(form_id)
+            for form_id, (name, folder_path) in current.items():
+                existing = self._docs.get(form_id)
+                if existing is None or existing[0] != name or existing[1] != folder_path:
+                    self.add(form_id, name, folder_path)
+                    indexed += 1
+            # Rebuild the tie-break ranks and single character prefix matches now
+            # rather than on the next (typeahead) search
+            self._tie_break_ranks()
+            for field in self.FIELDS:
+                for character in {token[0] for token in self._vocabulary[field]}:
+                    self._prefix_matches(field, character)
+        return {'indexed': indexed, 'removed': len(removed_ids)}
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _prefix_matches(self, field, prefix):
+        """
+        Returns the IDs of forms with a token in field starting with prefix.
+        """
+        cache_key = (field, prefix)
+        if cache_key in self._prefixes:
+            return self._prefixes[cache_key]
+        vocabulary = self._vocabulary[field]
+        # Tokens only contain [a-z0-9], so every token starting with prefix sorts below prefix + '~'
+        start = bisect_left(vocabulary, prefix)
+        end = bisect_left(vocabulary, prefix + '~', start)
+        matches = set().union(*map(self._postings[field].__getitem__, vocabulary[start:end]))
+        if len(prefix) <= self.CACHED_PREFIX_LENGTH:
+            self._prefixes[cache_key] = matches
+        return matches
+
+    def _substring_matches(self, field, token, exclude):
+        """
+        Returns the IDs of forms, other than those in exclude, whose field contains
+        token as a substring.
+        """
+        postings = [self._trigrams[field].get(trigram) for trigram in self._ngrams(token)]
+        if not all(postings):
+            return set()
+        postings.sort(key=len)
+        candidates = set.intersection(*postings) - exclude
+        if len(postings) == 1:
+            # A token of exactly NGRAM_SIZE characters is its own trigram: no verification needed
+            return candidates
+        texts = self._texts[field]
+        return {form_id for form_id in candidates if token in texts[form_id]}
+
+    def _token_matches(self, token):
+        """
+        Yields (score, form IDs) for one query token, best matches first. Every form
+        is yielded once, with the score of its best match.
+        """
+        weights = self.MATCH_WEIGHTS
+        postings = self._postings
+        substrings = len(token) >= self.NGRAM_SIZE
+        assigned = set()
+        signals = [
+            ('id_exact', lambda: postings['id'].get(token, set())),
+            ('id_prefix', lambda: self._prefix_matches('id', token)),
+            ('name_exact', lambda: postings['name'].get(token, set())),
+            ('name_prefix', lambda: self._prefix_matches('name', token)),
+            ('id_substring', lambda: self._substring_matches('id', token, assigned) if substrings else set()),
+            ('name_substring', lambda: self._substring_matches('name', token, assigned) if substrings else set()),
+            ('folder_exact', lambda: postings['folder'].get(token, set())),
+            ('folder_prefix', lambda: self._prefix_matches('folder', token)),
+            ('folder_substring', lambda: self._substring_matches('folder', token, assigned) if substrings else set()),
+        ]
+        for signal, matches in signals:
+            new_ids = matches() - assigned
+            if new_ids:
+                assigned.update(new_ids)
+                yield weights[signal], new_ids
+
+    def _token_scores(self, token):
+        """
+        Returns {form ID: best match score} for one query token.
+        """
+        scores = {}
+        for weight, form_ids in self._token_matches(token):
+            scores.update(dict.fromkeys(form_ids, weight))
+        return scores
+
+    def _tie_break_ranks(self):
+        if self._ranks is None:
+            names = self._texts['name']
+            self._order = sorted(self._docs, key=lambda form_id: (len(names[form_id]), names[form_id], form_id))
+            self._ranks = {form_id: position for position, form_id in enumerate(self._order)}
+        return self._ranks
+
+    def _first_ranked(self, form_ids, count):
+        """
+        Returns the first count of form_ids in tie-break order.
+        """
+        ranks = self._tie_break_ranks()
+        if len(form_ids) * 8 > len(self._order):
+            # Broad queries (e.g. a single letter) tie on a large share of the index:
+            # walking the global tie-break order stops after the first few hits
+            return list(islice((form_id for form_id in self._order if form_id in form_ids), count))
+        return heapq.nsmallest(count, form_ids, key=ranks.__getitem__)
+
+    def _top(self, totals, limit):
+        """
+        Returns the IDs of the limit best scored forms, best first.
+        """
+        if len(totals) <= limit:
+            selected = list(totals)
+        else:
+            # Everything above the limit-th best score is in; the rest is filled from
+            # the forms tied at that score, in tie-break order
+            threshold = heapq.nlargest(limit, totals.values())[-1]
+            selected = [form_id for form_id, score in totals.items() if score > threshold]
+            tied = {form_id for form_id, score in totals.items() if score == threshold}
+            selected += self._first_ranked(tied, limit - len(selected))
+        ranks = self._tie_break_ranks()
+        selected.sort(key=lambda form_id: (-totals[form_id], ranks[form_id]))
+        return selected
+
+    def search(self, query, limit=None):
+        """
+        Searches the index. Each whitespace/punctuation separated query token must
+        match a form's ID, name or folder path, as a whole word, a word prefix or
+        (for tokens of at least NGRAM_SIZE characters) a substring.
+
+        Args:
+            query (str): The search text.
+            limit (int, optional): Maximum number of results. Defaults to DEFAULT_LIMIT.
+
+        Returns:
+            list: Up to limit dictionaries with 'id', 'name', 'folder_path' and 'score',
+                  best matches first (ties: shorter names first, then alphabetical).
+        """
+        limit = min(max(1, limit or self.DEFAULT_LIMIT), self.MAX_LIMIT)
+        tokens = list(dict.fromkeys(self.tokenize(query)))
+        if not tokens:
+            return []
+
+        with self._lock:
+            cache_key = (tuple(tokens), limit)
+            if cache_key in self._results:
+                self._results.move_to_end(cache_key)
+                return self._results[cache_key]
+
+            if len(tokens) == 1:
+                # Matches come in score tiers: stop as soon as the best tiers fill the page
+                selected = []
+                for weight, form_ids in self._token_matches(tokens[0]):
+                    selected += [(form_id, weight) for form_id in self._first_ranked(form_ids, limit - len(selected))]
+                    if len(selected) >= limit:
+                        break
+                return self._cache_results(cache_key, selected)
+
+            # A form's score is the sum of its per-token scores; it must match every token
+            totals = self._token_scores(tokens[0])
+            for token in tokens[1:]:
+                if not totals:
+                    break
+                matched = {}
+                for weight, form_ids in self._token_matches(token):
+                    for form_id in form_ids & totals.keys():
+                        matched[form_id] = totals[form_id] + weight
+                totals = matched
+
+            return self._cache_results(cache_key, [(form_id, totals[form_id]) for form_id in self._top(totals, limit)])
+
+    def _cache_results(self, cache_key, scored_ids):
+        """
+        Turns ranked (form ID, score) pairs into result dictionaries and caches them.
+        """
+        docs = self._docs
+        results = [{'id': form_id, 'name': docs[form_id][0], 'folder_path': docs[form_id][1], 'score': score}
+                   for form_id, score in scored_ids]
+        self._results[cache_key] = results
+        while len(self._results) > self.RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return results
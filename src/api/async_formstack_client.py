@@ -0,0 +1,847 @@
+# src/api/async_formstack_client.py
+import asyncio
+import os
+from dotenv import load_dotenv
+from src.api.formstack_client import FormstackClient
+from src.api.smartlist_cache import SmartListCache
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only needed by the async client
+    aiohttp = None
+
+# Load environment variables from .env file.
+# This ensures that the API_KEY is available when
+# AsyncFormstackClient is instantiated.
+load_dotenv()
+
+class AsyncFormstackClient:
+    """
+    An asyncio-native client for the Formstack API.
+    Exposes the read methods of FormstackClient as coroutines (and its iter_*
+    methods as async generators), sharing one pooled aiohttp session and a
+    semaphore that bounds the number of requests in flight at any time.
+
+    Only the API surface is mirrored. The sync client's response cache, negative
+    cache, SmartList cache, single-flight deduplication, rate limiter, request
+    priorities and job cancellation are not implemented, so every call goes to the
+    API and cache_stats, invalidate_cache and rate_limit_stats do not exist.
+
+    Usage:
+        async with AsyncFormstackClient() as client:
+            forms = await client.get_all_forms()
+    """
+    # Base URL for Formstack API v2 (can be overridden, e.g. to point at a local mock server)
+    BASE_URL = os.getenv("FORMSTACK_API_BASE_URL", "https://www.formstack.com/api/v2")
+
+    # Retrieve the API key from environment variables
+    API_KEY = os.getenv("FORMSTACK_API_KEY")
+
+    # Maximum number of pooled connections to the Formstack host
+    DEFAULT_POOL_SIZE = 100
+
+    # Maximum number of requests in flight at the same time
+    DEFAULT_CONCURRENCY = 50
+
+    # Default total timeout in seconds for a single API call
+    DEFAULT_TIMEOUT = 30
+
+    # Number of items requested per page from list endpoints, shared with the sync client
+    DEFAULT_PAGE_SIZE = FormstackClient.DEFAULT_PAGE_SIZE
+
+    # Configuration types, form bundle sub-resources and their fetch methods, shared with the sync client
+    FORM_CONFIG_FETCHERS = FormstackClient.FORM_CONFIG_FETCHERS
+    FORM_BUNDLE_FETCHERS = FormstackClient.FORM_BUNDLE_FETCHERS
+
+    def __init__(self, pool_size=None, concurrency=None, timeout=None):
+        """
+        Initializes the AsyncFormstackClient.
+        Raises ValueError if FORMSTACK_API_KEY is not set and ImportError
+        if aiohttp is not installed.
+
+        Args:
+            pool_size (int, optional): Maximum number of pooled connections.
+                                       Defaults to DEFAULT_POOL_SIZE.
+            concurrency (int, optional): Maximum number of requests in flight.
+                                         Defaults to DEFAULT_CONCURRENCY.
+            timeout (float, optional): Default total timeout in seconds for every call.
+                                       Defaults to DEFAULT_TIMEOUT.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncFormstackClient. "
+                "Install it with 'pip install aiohttp'."
+            )
+        if not self.API_KEY:
+            raise ValueError(
+                "FORMSTACK_API_KEY not found in environment variables. "
+                "Please set it in your .env file in the project root."
+            )
+        # Headers required for authentication and content type
+        self.headers = {
+            "Authorization": f"Bearer {self.API_KEY}",
+            "Content-Type": "application/json"
+        }
+        self.pool_size = pool_size or self.DEFAULT_POOL_SIZE
+        self.concurrency = concurrency or self.DEFAULT_CONCURRENCY
+        self.timeout = timeout or self.DEFAULT_TIMEOUT
+
+        # The session and semaphore are bound to the running event loop,
+        # so they are created lazily on the first request.
+        self._session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _get_session(self):
+        """
+        Returns the pooled aiohttp session, creating it on first use.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._session
+
+    async def close(self):
+        """
+        Closes the pooled aiohttp session and releases its connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _make_request(self, method, endpoint, params=None, timeout=None):
+        """
+        Internal coroutine to make an HTTP request to the Formstack API.
+
+        Args:
+            method (str): The HTTP method (e.g., "GET", "POST").
+            endpoint (str): The API endpoint (e.g., "form", "form/123/submission").
+            params (dict, optional): Dictionary of parameters for the request.
+                                     For GET, these are query parameters.
+                                     For POST/PUT, these are JSON body. Defaults to None.
+            timeout (float, optional): Timeout for this call only.
+                                       Defaults to the client's timeout.
+
+        Returns:
+            dict: The JSON response from the API.
+
+        Raises:
+            aiohttp.ClientError: For any HTTP or connection errors.
+            asyncio.TimeoutError: If the request times out.
+            ValueError: If the response is not valid JSON.
+        """
+        url = f"{self.BASE_URL}/{endpoint}"
+        print(f"Making {method} request to: {url}") # Log the request URL
+
+        if method not in ("GET", "POST", "PUT", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        session = await self._get_session()
+        request_kwargs = {}
+        if params is not None:
+            # GET/DELETE send query parameters, POST/PUT send a JSON body
+            request_kwargs['params' if method in ("GET", "DELETE") else 'json'] = params
+        if timeout is not None:
+            request_kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+        body = b""
+        try:
+            async with self._semaphore:
+                async with session.request(method, url, **request_kwargs) as response:
+                    body = await response.read()
+                    if response.status >= 400:
+                        print(f"HTTP Error: {response.status} - {body.decode(errors='replace')}")
+                    # Raise a ClientResponseError for bad responses (4xx or 5xx status codes)
+                    response.raise_for_status()
+
+                    # Some successful API calls (e.g., DELETE) might return no content
+                    if not body:
+                        return {}
+                    return await response.json(content_type=None)
+
+        except aiohttp.ClientResponseError:
+            raise
+        except aiohttp.ClientConnectionError as e:
+            print(f"Connection Error: Could not connect to Formstack API: {e}")
+            raise
+        except asyncio.TimeoutError as e:
+            print(f"Timeout Error: Request to Formstack API timed out: {e}")
+            raise
+        except aiohttp.ClientError as e:
+            # Catch all other aiohttp-related exceptions
+            print(f"An unexpected request error occurred: {e}")
+            raise
+        except ValueError as e:
+            print(f"JSON decoding error: {e}. Response content: {body}")
+            raise
+
+    async def _get_pages(self, endpoint, result_key, params=None, per_page=None):
+        """
+        Fetches every page of a list endpoint using the API's page/per_page parameters,
+        with the same stop rules as FormstackClient._iter_pages: a page shorter than
+        per_page, the reported 'total' or 'pages', or an endpoint that ignores paging
+        and returns more items than requested. When the first page reports the number
+        of pages, the remaining pages are fetched concurrently.
+
+        Args:
+            endpoint (str): The API endpoint (e.g., "form.json").
+            result_key (str): The key holding the list of items in each response.
+            params (dict, optional): Extra query parameters sent with every page.
+            per_page (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+
+        Returns:
+            list: The items of every page, in order.
+
+        Raises:
+            aiohttp.ClientError: If fetching a page fails.
+            ValueError: If a page does not hold a result_key list, so a malformed
+                        response is never mistaken for the end of the list.
+        """
+        per_page = per_page or self.DEFAULT_PAGE_SIZE
+        base_params = dict(params or {})
+
+        async def fetch(page):
+            response_data = await self._make_request("GET", endpoint, params={**base_params, "page": page, "per_page": per_page})
+            if not (isinstance(response_data, dict) and isinstance(response_data.get(result_key), list)):
+                # Handle unexpected response structure
+                print(f"Unexpected response format for GET /{endpoint}: {response_data}")
+                raise ValueError(f"Unexpected response format for GET /{endpoint} (page {page})")
+            return response_data
+
+        def page_count(response_data):
+            # Number of pages reported by the response, or None if it reports neither total nor pages
+            if response_data.get('pages') is not None:
+                return int(response_data['pages'])
+            if response_data.get('total') is not None:
+                return -(-int(response_data['total']) // per_page)
+            return None
+
+        response_data = await fetch(1)
+        items = list(response_data[result_key])
+        if len(response_data[result_key]) != per_page:
+            return items
+
+        pages = page_count(response_data)
+        if pages is not None:
+            # Every remaining page is known up front: fetch them all at once
+            for response_data in await asyncio.gather(*(fetch(page) for page in range(2, pages + 1))):
+                items.extend(response_data[result_key])
+            return items
+
+        page = 1
+        while True:
+            page += 1
+            response_data = await fetch(page)
+            items.extend(response_data[result_key])
+            if len(response_data[result_key]) != per_page:
+                return items
+
+    async def _iter_pages(self, endpoint, result_key, params=None, per_page=None, prefetch=True):
+        """
+        Lazily pages through a list endpoint, like FormstackClient._iter_pages.
+        While the caller works on one page, the next page can be fetched in the background.
+
+        Args:
+            endpoint (str): The API endpoint (e.g., "form.json").
+            result_key (str): The key holding the list of items in each response.
+            params (dict, optional): Extra query parameters sent with every page.
+            per_page (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page while the current one is consumed.
+                                       Defaults to True.
+
+        Yields:
+            list: One page of items at a time.
+
+        Raises:
+            aiohttp.ClientError: If fetching a page fails.
+            ValueError: If a page does not hold a result_key list.
+        """
+        per_page = per_page or self.DEFAULT_PAGE_SIZE
+        base_params = dict(params or {})
+
+        def fetch(page):
+            return self._make_request("GET", endpoint, params={**base_params, "page": page, "per_page": per_page})
+
+        next_page = None
+        try:
+            page = 1
+            items_seen = 0
+            response_data = await fetch(page)
+            while True:
+                if not (isinstance(response_data, dict) and isinstance(response_data.get(result_key), list)):
+                    # Handle unexpected response structure
+                    print(f"Unexpected response format for GET /{endpoint}: {response_data}")
+                    raise ValueError(f"Unexpected response format for GET /{endpoint} (page {page})")
+
+                items = response_data[result_key]
+                items_seen += len(items)
+                total = response_data.get('total')
+                pages = response_data.get('pages')
+                has_more = (
+                    len(items) == per_page
+                    and (total is None or items_seen < int(total))
+                    and (pages is None or page < int(pages))
+                )
+
+                next_page = None
+                if has_more and prefetch:
+                    next_page = asyncio.ensure_future(fetch(page + 1))
+
+                yield items
+
+                if not has_more:
+                    return
+                page += 1
+                response_data = await (next_page if next_page else fetch(page))
+        finally:
+            # A prefetched page nobody will read is dropped
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+                await asyncio.gather(next_page, return_exceptions=True)
+
+    async def iter_forms(self, per_page=None, prefetch=True):
+        """
+        Lazily iterates over all forms in the Formstack account, one page at a time.
+
+        Args:
+            per_page (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+
+        Yields:
+            dict: One form at a time.
+
+        Raises:
+            aiohttp.ClientError: If fetching a page fails.
+        """
+        pages = self._iter_pages("form.json", "forms", params={"folders": "false"},
+                                 per_page=per_page, prefetch=prefetch)
+        try:
+            async for page in pages:
+                for form in page:
+                    yield form
+        finally:
+            # Async generators are not closed by the loop that drives them: close the
+            # pages here, so a prefetched page does not outlive this generator
+            await pages.aclose()
+
+    async def iter_folders(self, per_page=None, prefetch=True):
+        """
+        Lazily iterates over the account's (top-level) folders, one page at a time.
+
+        Args:
+            per_page (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+
+        Yields:
+            dict: One folder at a time.
+
+        Raises:
+            aiohttp.ClientError: If fetching a page fails.
+        """
+        pages = self._iter_pages("folder.json", "folders", per_page=per_page, prefetch=prefetch)
+        try:
+            async for page in pages:
+                for folder in page:
+                    yield folder
+        finally:
+            await pages.aclose()
+
+    async def iter_smartlists(self, per_page=None, prefetch=True):
+        """
+        Lazily iterates over all SmartLists, one page at a time.
+
+        Args:
+            per_page (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+
+        Yields:
+            dict: One normalized SmartList at a time (see FormstackClient._process_smartlist).
+
+        Raises:
+            aiohttp.ClientError: If fetching a page fails.
+        """
+        # The API returns results in a 'results' array, not 'smartlists'
+        pages = self._iter_pages("smartlist", "results", per_page=per_page, prefetch=prefetch)
+        try:
+            async for page in pages:
+                for smartlist in page:
+                    yield FormstackClient._process_smartlist(smartlist)
+        finally:
+            await pages.aclose()
+
+    async def get_all_forms(self):
+        """
+        Fetches all forms from the Formstack account, one page at a time.
+
+        Returns:
+            list: A list of dictionaries, where each dictionary represents a form.
+                  Returns an empty list if no forms are found or an error occurs.
+        """
+        print("Fetching all forms...")
+        try:
+            # We are adding 'folders=false' to explicitly get forms without nesting.
+            return await self._get_pages("form.json", "forms", params={"folders": "false"})
+        except Exception as e:
+            print(f"Error fetching all forms: {e}")
+            return []
+
+    async def get_folder_details(self, folder_id):
+        """
+        Fetches detailed information for a specific folder.
+
+        Args:
+            folder_id (str or int): The ID of the folder to fetch.
+
+        Returns:
+            dict: The folder details or None if error occurs.
+        """
+        print(f"Fetching folder details for ID: {folder_id}")
+        try:
+            return await self._make_request("GET", f"folder/{folder_id}.json")
+        except Exception as e:
+            print(f"Error fetching folder {folder_id}: {e}")
+            return None
+
+    async def get_all_folders(self):
+        """
+        Fetches all folders from the Formstack account (only top-level folders).
+
+        Returns:
+            list: A list of dictionaries, where each dictionary represents a folder.
+                  Returns an empty list if no folders are found or an error occurs.
+        """
+        print("Fetching all folders...")
+        try:
+            return await self._get_pages("folder.json", "folders")
+        except Exception as e:
+            print(f"Error fetching all folders: {e}")
+            return []
+
+    async def get_form_details(self, form_id):
+        """
+        Fetches detailed information for a specific form.
+
+        Args:
+            form_id (str or int): The ID of the form to fetch.
+
+        Returns:
+            dict: The form details or None if error occurs.
+        """
+        print(f"Fetching form details for ID: {form_id}")
+        try:
+            return await self._make_request("GET", f"form/{form_id}.json")
+        except Exception as e:
+            print(f"Error fetching form {form_id}: {e}")
+            return None
+
+    async def get_complete_folder_hierarchy(self):
+        """
+        Fetches the complete folder hierarchy: the top-level folders plus every
+        folder referenced by a form, crawled breadth-first with every folder of a
+        level fetched concurrently and subfolders queued for the next level.
+
+        Returns:
+            list: A list of dictionaries with complete folder hierarchy information.
+                  Returns an empty list if no folders are found or an error occurs.
+        """
+        print("Fetching complete folder hierarchy...")
+        try:
+            basic_folders, forms_data = await asyncio.gather(self.get_all_folders(), self.get_all_forms())
+            if not basic_folders:
+                print("No basic folders found")
+                return []
+
+            discovered_folder_ids = set(folder.get('id') for folder in basic_folders if folder.get('id'))
+            form_folder_ids = set(form.get('folder') for form in forms_data
+                                  if form.get('folder') and form.get('folder') != '0')
+            additional_folder_ids = form_folder_ids - discovered_folder_ids
+            print(f"Found {len(discovered_folder_ids)} top-level and {len(additional_folder_ids)} additional folder IDs")
+            discovered_folder_ids.update(additional_folder_ids)
+
+            detailed_folders = []
+            visited_folder_ids = set(str(folder_id) for folder_id in discovered_folder_ids)
+            frontier = list(discovered_folder_ids)
+            while frontier:
+                frontier_details = await asyncio.gather(*(self.get_folder_details(folder_id) for folder_id in frontier))
+                next_frontier = []
+                for folder_details in frontier_details:
+                    if not folder_details:
+                        continue
+                    detailed_folders.append(folder_details)
+                    for subfolder_id in FormstackClient._subfolder_ids(folder_details):
+                        if str(subfolder_id) not in visited_folder_ids:
+                            visited_folder_ids.add(str(subfolder_id))
+                            next_frontier.append(subfolder_id)
+                frontier = next_frontier
+
+            print(f"Successfully fetched details for {len(detailed_folders)} folders")
+            return detailed_folders
+
+        except Exception as e:
+            print(f"Error fetching complete folder hierarchy: {e}")
+            return []
+
+    async def _get_form_list(self, form_id, resource, result_key):
+        """
+        Fetches a list-valued sub-resource of a form (e.g. webhooks, notifications).
+
+        Args:
+            form_id (str or int): The ID of the form.
+            resource (str): The sub-resource name in the endpoint (e.g. "webhook").
+            result_key (str): The key holding the list in the response.
+
+        Returns:
+            list: The list from the response, or an empty list if none found or an error occurs.
+        """
+        try:
+            return await self._fetch_form_list(form_id, f"{resource}.json", result_key)
+        except Exception as e:
+            print(f"Error fetching {result_key} for form {form_id}: {e}")
+            return []
+
+    async def _fetch_form_list(self, form_id, resource, result_key):
+        """
+        Fetches one list sub-resource of a form (e.g. "webhook.json"). Unlike the
+        get_form_* methods, failures raise instead of returning an empty list.
+
+        Raises:
+            aiohttp.ClientError: If the call fails.
+        """
+        response_data = await self._make_request("GET", f"form/{form_id}/{resource}")
+        return response_data.get(result_key, []) if response_data else []
+
+    async def _fetch_form_fields(self, form_id):
+        """
+        Fetches a form's fields. Unlike get_form_fields, failures raise.
+
+        Raises:
+            aiohttp.ClientError: If the call fails.
+        """
+        response_data = await self._make_request("GET", f"form/{form_id}/field.json")
+        # Handle both dict and list responses
+        if isinstance(response_data, list):
+            return response_data
+        elif isinstance(response_data, dict):
+            return response_data.get('fields', response_data.get('data', []))
+        else:
+            return []
+
+    async def _fetch_form_fields_or_none(self, form_id):
+        try:
+            return await self._fetch_form_fields(form_id)
+        except Exception as e:
+            print(f"Error fetching fields for form {form_id}: {e}")
+            return None
+
+    async def _fetch_form_config(self, form_id, config_type):
+        """
+        Fetches one configuration type of a form for the batch methods
+        (get_forms_configuration, iter_forms_configuration).
+
+        Returns:
+            list: The items returned by the API, or None if the fetch failed, so that
+                  callers which persist results can tell "unknown" from "none".
+        """
+        try:
+            if config_type in FormstackClient.FORM_CONFIG_ENDPOINTS:
+                return await self._fetch_form_list(form_id, *FormstackClient.FORM_CONFIG_ENDPOINTS[config_type])
+            if config_type == 'integrations':
+                integrations = await self._get_integration_endpoint(form_id)
+                if integrations is not None:
+                    return integrations
+                return FormstackClient._detect_integrations_from_fields(await self._fetch_form_fields(form_id))
+            return await getattr(self, self.FORM_CONFIG_FETCHERS[config_type])(form_id)
+        except Exception as e:
+            print(f"Error fetching {config_type} for form {form_id}: {e}")
+            return None
+
+    async def get_form_partial_submissions(self, form_id):
+        """
+        Fetches partial submissions for a specific form.
+
+        Returns:
+            list: A list of partial submission data, or an empty list if none found.
+        """
+        return await self._get_form_list(form_id, "partialsubmission", "partialsubmissions")
+
+    async def get_form_confirmations(self, form_id):
+        """
+        Fetches confirmation settings for a specific form.
+
+        Returns:
+            list: A list of confirmation data, or an empty list if none found.
+        """
+        return await self._get_form_list(form_id, "confirmation", "confirmations")
+
+    async def get_form_notifications(self, form_id):
+        """
+        Fetches notification settings for a specific form.
+
+        Returns:
+            list: A list of notification data, or an empty list if none found.
+        """
+        return await self._get_form_list(form_id, "notification", "notifications")
+
+    async def get_form_webhooks(self, form_id):
+        """
+        Fetches webhook settings for a specific form.
+
+        Returns:
+            list: A list of webhook data, or an empty list if none found.
+        """
+        return await self._get_form_list(form_id, "webhook", "webhooks")
+
+    async def get_form_integrations(self, form_id, fields=None):
+        """
+        Fetches integration settings for a specific form, falling back to
+        field analysis when the integration endpoint is not available.
+
+        Args:
+            form_id (str or int): The ID of the form.
+            fields (list, optional): The form's fields, if already fetched.
+
+        Returns:
+            list: A list of integration data, or an empty list if none found.
+        """
+        integrations = await self._get_integration_endpoint(form_id)
+        if integrations is not None:
+            return integrations
+        return await self._detect_form_integrations(form_id, fields)
+
+    async def _get_integration_endpoint(self, form_id):
+        """
+        Fetches a form's integrations from the integration endpoint.
+
+        Returns:
+            list: The integrations, or None if the endpoint is not available.
+        """
+        try:
+            response_data = await self._make_request("GET", f"form/{form_id}/integration.json")
+            return response_data.get('integrations', []) if response_data else []
+        except Exception as e:
+            print(f"Integration endpoint not available for form {form_id}, trying alternative detection: {e}")
+            return None
+
+    async def _detect_form_integrations(self, form_id, fields=None):
+        """
+        Detects a form's integrations from its fields, fetching them unless given.
+        """
+        try:
+            if fields is None:
+                fields = await self.get_form_fields(form_id)
+            return FormstackClient._detect_integrations_from_fields(fields)
+        except Exception as inner_e:
+            print(f"Alternative integration detection failed for form {form_id}: {inner_e}")
+            return []
+
+    async def get_form_fields(self, form_id):
+        """
+        Fetches field details for a specific form.
+
+        Returns:
+            list: A list of field data, or an empty list if none found.
+        """
+        try:
+            return await self._fetch_form_fields(form_id)
+        except Exception as e:
+            print(f"Error fetching fields for form {form_id}: {e}")
+            return []
+
+    async def get_forms_fields(self, form_ids):
+        """
+        Fetches the fields of many forms concurrently.
+        Concurrency is bounded by the client's semaphore.
+
+        Args:
+            form_ids (list): The IDs of the forms.
+
+        Returns:
+            list: The field list of each form, in the same order as form_ids, or None
+                  for a form whose fields could not be fetched.
+        """
+        return list(await asyncio.gather(*(self._fetch_form_fields_or_none(form_id) for form_id in form_ids)))
+
+    async def get_form_bundle(self, form_id):
+        """
+        Fetches a form's details and all of its sub-resources concurrently, sharing
+        the fields response with the integration detection (see FormstackClient.get_form_bundle).
+
+        Returns:
+            dict: 'form' (or None) and one list per sub-resource.
+        """
+        keys = list(self.FORM_BUNDLE_FETCHERS)
+        results = dict(zip(keys, await asyncio.gather(*(
+            getattr(self, self.FORM_BUNDLE_FETCHERS[key])(form_id) for key in keys
+        ))))
+
+        bundle = {key: result or [] for key, result in results.items()}
+        bundle['form'] = results['form']
+        if results['integrations'] is None:
+            bundle['integrations'] = await self._detect_form_integrations(form_id, bundle['fields'])
+        return bundle
+
+    def _config_types(self, config_types):
+        # The requested configuration types, in FORM_CONFIG_FETCHERS order
+        if config_types is None:
+            return list(self.FORM_CONFIG_FETCHERS)
+        return [config_type for config_type in self.FORM_CONFIG_FETCHERS if config_type in set(config_types)]
+
+    async def _fetch_form_configuration(self, form_id, config_types):
+        results = await asyncio.gather(*(self._fetch_form_config(form_id, config_type) for config_type in config_types))
+        return dict(zip(config_types, results))
+
+    async def get_forms_configuration(self, form_ids, config_types=None):
+        """
+        Fetches configuration details for many forms concurrently.
+        Concurrency is bounded by the client's semaphore.
+
+        Args:
+            form_ids (list): The IDs of the forms to fetch configuration for.
+            config_types (iterable, optional): Keys of FORM_CONFIG_FETCHERS to fetch.
+                                               Defaults to all types.
+
+        Returns:
+            list: One dictionary per form, in the same order as form_ids, mapping
+                  each requested configuration type to the list returned by the API,
+                  or to None if fetching it failed.
+        """
+        config_types = self._config_types(config_types)
+        return list(await asyncio.gather(*(self._fetch_form_configuration(form_id, config_types)
+                                           for form_id in form_ids)))
+
+    async def iter_forms_configuration(self, form_ids, config_types=None):
+        """
+        Fetches configuration details for many forms concurrently, like
+        get_forms_configuration, but yields each form as soon as all of its
+        configuration types are fetched instead of waiting for every form.
+        Closing the generator early cancels the fetches still pending.
+
+        Args:
+            form_ids (list): The IDs of the forms to fetch configuration for.
+            config_types (iterable, optional): Keys of FORM_CONFIG_FETCHERS to fetch. Defaults to all types.
+
+        Yields:
+            tuple: (form_id, configuration), in completion order; configuration maps
+                   each requested configuration type to the list returned by the API,
+                   or to None if fetching it failed.
+        """
+        config_types = self._config_types(config_types)
+
+        async def fetch(form_id):
+            return form_id, await self._fetch_form_configuration(form_id, config_types)
+
+        tasks = [asyncio.ensure_future(fetch(form_id)) for form_id in form_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancellations, so no request outlives the generator
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_all_smartlists(self):
+        """
+        Fetches all SmartLists from the Formstack API.
+
+        Returns:
+            list: A list of SmartList dictionaries containing SmartList information.
+        """
+        try:
+            # The API returns results in a 'results' array, not 'smartlists'
+            smartlists = await self._get_pages("smartlist", "results")
+
+            print(f"Found {len(smartlists)} SmartLists in API response")
+            return [FormstackClient._process_smartlist(smartlist) for smartlist in smartlists]
+
+        except Exception as e:
+            print(f"Error fetching SmartLists: {e}")
+            return []
+
+    async def get_smartlist_details(self, smartlist_id):
+        """
+        Fetches detailed information for a specific SmartList.
+
+        Args:
+            smartlist_id (str): The ID of the SmartList to fetch details for.
+
+        Returns:
+            dict: SmartList details including fields, items, and settings.
+        """
+        try:
+            return await self._make_request("GET", f"smartlist/{smartlist_id}")
+        except Exception as e:
+            print(f"Error fetching SmartList details for ID {smartlist_id}: {e}")
+            return {}
+
+    async def iter_smartlist_items(self, smartlist_id, updated=None):
+        """
+        Iterates over the items of a SmartList, one at a time.
+
+        Args:
+            smartlist_id (str): The ID of the SmartList.
+            updated (str, optional): Accepted for compatibility with FormstackClient;
+                                     the details are always fetched from the API.
+
+        Yields:
+            dict: One item at a time.
+        """
+        for item in SmartListCache.items_of(await self.get_smartlist_details(smartlist_id)):
+            yield item
+
+    async def get_smartlist_items_page(self, smartlist_id, page=1, per_page=None, updated=None, search=None):
+        """
+        Returns one page of a SmartList's items, like FormstackClient.get_smartlist_items_page.
+        Without a SmartList cache, every call fetches the SmartList details (all items).
+
+        Args:
+            smartlist_id (str): The ID of the SmartList.
+            page (int, optional): 1-based page number. Defaults to 1.
+            per_page (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            updated (str, optional): Accepted for compatibility with FormstackClient.
+            search (str, optional): Only count and return items whose label or value
+                                    contains this text (case-insensitive).
+
+        Returns:
+            dict: smartlist_id, updated, page, per_page, total (matching items), pages
+                  and items, or None if the SmartList could not be fetched.
+        """
+        per_page = per_page or self.DEFAULT_PAGE_SIZE
+        page = max(int(page), 1)
+        details = await self.get_smartlist_details(smartlist_id)
+        if not isinstance(details, dict) or not details:
+            return None
+        items = SmartListCache.items_of(details)
+        if search:
+            items = SmartListCache.filter_items(items, search)
+        return FormstackClient._smartlist_items_page(smartlist_id, details, items, page, per_page)
+
+
+# Example Usage (for testing purposes when running this file directly)
+if __name__ == "__main__":
+    async def main():
+        async with AsyncFormstackClient() as client:
+            forms, folders, smartlists = await asyncio.gather(
+                client.get_all_forms(),
+                client.get_all_folders(),
+                client.get_all_smartlists()
+            )
+            print(f"\nFound {len(forms)} forms, {len(folders)} basic folders and {len(smartlists)} SmartLists.")
+
+    try:
+        asyncio.run(main())
+    except (ValueError, ImportError) as ve:
+        print(f"Configuration error during client test: {ve}")
+    except Exception as e:
+        print(f"An unexpected error occurred during client test: {e}")
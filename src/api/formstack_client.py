@@ -1,7 +1,19 @@
 # src/api/formstack_client.py
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
+from src.api.integration_detector import IntegrationDetector
+from src.api.negative_cache import NegativeCache
+from src.api.response_cache import ResponseCache
+from src.api.smartlist_cache import SmartListCache
+from src.api.single_flight import SingleFlight
+from src.api.rate_limiter import (
+    RateLimiter, PRIORITY_FANOUT, backoff_delay, current_priority, parse_retry_after, request_priority
+)
+from src.api.job_progress import JobCancelled, current_job, job_context
 
 # Load environment variables from .env file.
 # This ensures that the API_KEY is available when
@@ -13,16 +25,92 @@ class FormstackClient:
     A client for interacting with the Formstack API.
     Handles authentication and making HTTP requests.
     """
-    # Base URL for Formstack API v2
-    BASE_URL = "https://www.formstack.com/api/v2"
+    # Base URL for Formstack API v2 (can be overridden, e.g. to point at a local mock server)
+    BASE_URL = os.getenv("FORMSTACK_API_BASE_URL", "https://www.formstack.com/api/v2")
     
     # Retrieve the API key from environment variables
     API_KEY = os.getenv("FORMSTACK_API_KEY")
 
-    def __init__(self):
+    # Number of keep-alive connections kept open to the Formstack host
+    DEFAULT_POOL_SIZE = 10
+
+    # Default (connect, read) timeout in seconds for a single API call
+    DEFAULT_TIMEOUT = (5, 30)
+
+    # Number of items requested per page from paginated list endpoints
+    DEFAULT_PAGE_SIZE = 100
+
+    # Default number of worker threads used for concurrent per-form fan-outs
+    DEFAULT_MAX_WORKERS = 8
+
+    # Retries of a call that failed with a retryable status, and the base/cap in
+    # seconds of the jittered exponential backoff between attempts
+    DEFAULT_MAX_RETRIES = 4
+    RETRY_BACKOFF_BASE = 0.5
+    RETRY_BACKOFF_CAP = 30
+
+    # 429 is always retried (the call was not processed); 5xx only for idempotent methods
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    IDEMPOTENT_METHODS = {"GET", "PUT", "DELETE"}
+
+    # Maps each per-form configuration type to the client method that fetches it
+    FORM_CONFIG_FETCHERS = {
+        'webhooks': 'get_form_webhooks',
+        'confirmations': 'get_form_confirmations',
+        'notifications': 'get_form_notifications',
+        'partial_submissions': 'get_form_partial_submissions',
+        'integrations': 'get_form_integrations',
+    }
+
+    # Endpoint and result key of the list configuration types, fetched by _fetch_form_config
+    FORM_CONFIG_ENDPOINTS = {
+        'webhooks': ('webhook.json', 'webhooks'),
+        'confirmations': ('confirmation.json', 'confirmations'),
+        'notifications': ('notification.json', 'notifications'),
+        'partial_submissions': ('partialsubmission.json', 'partialsubmissions'),
+    }
+
+    # Sub-resources fetched together by get_form_bundle, mapped to the client method for each
+    FORM_BUNDLE_FETCHERS = {
+        'form': 'get_form_details',
+        'partial_submissions': 'get_form_partial_submissions',
+        'confirmations': 'get_form_confirmations',
+        'notifications': 'get_form_notifications',
+        'webhooks': 'get_form_webhooks',
+        'integrations': '_get_integration_endpoint',
+        'fields': 'get_form_fields',
+    }
+
+    # Detector of field names/types that suggest a form is connected to a third-party
+    # service; replace it with an IntegrationDetector over another indicator set to customize
+    INTEGRATION_DETECTOR = IntegrationDetector()
+
+    def __init__(self, pool_size=None, timeout=None, max_workers=None, cache=None,
+                 rate_limiter=None, max_retries=None, negative_cache=None, smartlist_cache=None):
         """
         Initializes the FormstackClient.
         Raises ValueError if FORMSTACK_API_KEY is not set.
+
+        Args:
+            pool_size (int, optional): Maximum number of pooled keep-alive
+                                       connections. Defaults to DEFAULT_POOL_SIZE.
+            timeout (float or tuple, optional): Default timeout for every call,
+                                                either a single number of seconds or a
+                                                (connect, read) tuple. Defaults to DEFAULT_TIMEOUT.
+            max_workers (int, optional): Number of worker threads for concurrent fan-outs.
+                                         Defaults to DEFAULT_MAX_WORKERS.
+            cache (ResponseCache or bool, optional): Cache for GET responses. Defaults to a
+                                                     new ResponseCache; pass False to disable caching.
+            rate_limiter (RateLimiter or bool, optional): Token bucket every API call waits on.
+                                                          Defaults to a new RateLimiter; pass False
+                                                          to disable rate limiting.
+            max_retries (int, optional): Retries for 429/5xx responses. Defaults to DEFAULT_MAX_RETRIES.
+            negative_cache (NegativeCache or bool, optional): Record of missing forms and unsupported
+                                                              endpoints. Defaults to a new NegativeCache;
+                                                              pass False to disable it.
+            smartlist_cache (SmartListCache or bool, optional): Cache of SmartList details validated
+                                                                against 'updated'. Defaults to a new
+                                                                SmartListCache; pass False to disable it.
         """
         if not self.API_KEY:
             raise ValueError(
@@ -34,10 +122,108 @@ class FormstackClient:
             "Authorization": f"Bearer {self.API_KEY}",
             "Content-Type": "application/json"
         }
+        self.pool_size = pool_size or self.DEFAULT_POOL_SIZE
+        self.timeout = timeout or self.DEFAULT_TIMEOUT
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+
+        # A single long-lived session reuses TCP/TLS connections across calls
+        # instead of opening a new connection to formstack.com for every request.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # In-process TTL + LRU cache of GET responses
+        if cache is False:
+            self.cache = None
+        else:
+            self.cache = cache or ResponseCache()
+
+        # Concurrent identical GETs share a single in-flight HTTP call
+        self._single_flight = SingleFlight()
+
+        # GETs known to fail (404 objects, unsupported endpoints) skip the round trip
+        if negative_cache is False:
+            self.negative_cache = None
+        else:
+            self.negative_cache = negative_cache or NegativeCache()
+
+        # SmartList details (with their items) stay cached until the SmartList's 'updated' changes
+        if smartlist_cache is False:
+            self.smartlist_cache = None
+        else:
+            self.smartlist_cache = smartlist_cache or SmartListCache()
+
+        # Client-side rate limiting and retries of throttled/failed calls
+        if rate_limiter is False:
+            self.rate_limiter = None
+        else:
+            self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_retries = self.DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+
+    def close(self):
+        """
+        Closes the pooled HTTP session and releases its connections.
+        """
+        self.session.close()
+
+    def invalidate_cache(self, endpoint_prefix=None):
+        """
+        Removes cached GET responses, cached SmartLists and negative cache entries
+        so the next call goes to the API.
+
+        Args:
+            endpoint_prefix (str, optional): Only invalidate endpoints starting with this
+                                             prefix (e.g. "folder" or "form/123").
+                                             Invalidates everything when omitted.
+
+        Returns:
+            int: The number of cached responses, SmartLists and negative entries removed.
+        """
+        removed = 0
+        if self.cache is not None:
+            removed += self.cache.invalidate(endpoint_prefix)
+        if self.smartlist_cache is not None:
+            if endpoint_prefix is None or "smartlist".startswith(endpoint_prefix):
+                removed += self.smartlist_cache.invalidate()
+            elif endpoint_prefix.startswith("smartlist/"):
+                removed += self.smartlist_cache.invalidate(endpoint_prefix.split('/')[1].split('.')[0])
+        if self.negative_cache is not None:
+            removed += self.negative_cache.invalidate(endpoint_prefix)
+        return removed
+
+    def cache_stats(self):
+        """
+        Returns hit/miss counters of the response cache and the number of
+        GETs that were coalesced into another caller's in-flight request.
 
-    def _make_request(self, method, endpoint, params=None):
+        Returns:
+            dict: Cache statistics (see ResponseCache.stats) plus 'coalesced', 'in_flight',
+                  'negative' (see NegativeCache.stats) and 'smartlists' (see SmartListCache.stats).
+        """
+        stats = self.cache.stats() if self.cache is not None else {}
+        stats['coalesced'] = self._single_flight.coalesced
+        stats['in_flight'] = self._single_flight.in_flight()
+        stats['negative'] = self.negative_cache.stats() if self.negative_cache is not None else None
+        stats['smartlists'] = self.smartlist_cache.stats() if self.smartlist_cache is not None else None
+        return stats
+
+    def rate_limit_stats(self):
+        """
+        Returns the state of the client's rate limiter (see RateLimiter.stats),
+        or an empty dictionary if rate limiting is disabled.
+        """
+        return self.rate_limiter.stats() if self.rate_limiter is not None else {}
+
+    def _make_request(self, method, endpoint, params=None, timeout=None, use_cache=True):
         """
         Internal method to make an HTTP request to the Formstack API.
+        Successful GET responses are served from and stored in the response cache,
+        and concurrent identical GETs are coalesced into one HTTP call. GETs that the
+        negative cache knows to fail (missing forms, unsupported endpoints) raise
+        CachedHTTPError without a call.
+        Any other method invalidates the cached responses of the resource it changes.
 
         Args:
             method (str): The HTTP method (e.g., "GET", "POST").
@@ -45,28 +231,120 @@ class FormstackClient:
             params (dict, optional): Dictionary of parameters for the request.
                                      For GET, these are query parameters.
                                      For POST/PUT, these are JSON body. Defaults to None.
+            timeout (float or tuple, optional): Timeout for this call only.
+                                                Defaults to the client's timeout.
+            use_cache (bool, optional): Whether a GET may be served from the cache. Defaults to True.
 
         Returns:
-            dict: The JSON response from the API.
+            dict: The JSON response from the API. Cached responses are shared and must not be modified.
 
         Raises:
             requests.exceptions.RequestException: For any HTTP or connection errors.
             ValueError: If the response is not valid JSON.
         """
+        if method == "GET" and self.negative_cache is not None:
+            self.negative_cache.check(endpoint)
+
+        cacheable = method == "GET" and use_cache and self.cache is not None
+        if cacheable:
+            hit, cached_response = self.cache.get(endpoint, params)
+            if hit:
+                return cached_response
+
+        if method != "GET":
+            response_data = self._send_request(method, endpoint, params, timeout)
+            if self.cache is not None:
+                # e.g. "form/123/webhook.json" invalidates everything cached under "form"
+                self.cache.invalidate(endpoint.split('/')[0].split('.')[0])
+            if self.smartlist_cache is not None and endpoint.startswith("smartlist"):
+                self.smartlist_cache.invalidate()
+            return response_data
+
+        def fetch():
+            if cacheable:
+                # A call for the same key may have completed and been cached
+                # between our cache lookup and becoming the leader
+                hit, cached_response = self.cache.get(endpoint, params, record_stats=False)
+                if hit:
+                    return cached_response
+            try:
+                response_data = self._send_request(method, endpoint, params, timeout)
+            except requests.exceptions.HTTPError as e:
+                if self.negative_cache is not None:
+                    self.negative_cache.record_failure(endpoint, e.response.status_code)
+                raise
+            if self.negative_cache is not None:
+                self.negative_cache.record_success(endpoint)
+            if cacheable:
+                self.cache.set(endpoint, params, response_data)
+            return response_data
+
+        # Identical GETs that arrive while this one is in flight wait for its result, unless
+        # it runs at a lower priority. A call stopped by its own job's cancellation is made
+        # again by the callers that were waiting for it.
+        return self._single_flight.do(ResponseCache.make_key(endpoint, params), fetch,
+                                      priority=current_priority(), retry_on=(JobCancelled,))
+
+    def _send_request(self, method, endpoint, params=None, timeout=None):
+        """
+        Sends a single HTTP request to the Formstack API over the pooled session.
+        Every attempt waits for a token from the rate limiter (at the priority of the
+        current context), and 429/5xx responses are retried with jittered exponential
+        backoff, honouring the Retry-After header.
+        Requests made for a job (see job_progress.current_job) are counted on the job,
+        failures are recorded as job errors, and a cancelled job raises JobCancelled
+        before its next request.
+        Arguments and exceptions are the same as for _make_request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
         url = f"{self.BASE_URL}/{endpoint}"
         print(f"Making {method} request to: {url}") # Log the request URL
+        timeout = timeout or self.timeout
+        job = current_job()
 
         try:
-            if method == "GET":
-                response = requests.get(url, headers=self.headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=params)
-            elif method == "PUT":
-                response = requests.put(url, headers=self.headers, json=params)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=self.headers, params=params)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            attempt = 0
+            while True:
+                if job is not None:
+                    job.raise_if_cancelled()
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+
+                if method == "GET":
+                    response = self.session.get(url, params=params, timeout=timeout)
+                elif method == "POST":
+                    response = self.session.post(url, json=params, timeout=timeout)
+                elif method == "PUT":
+                    response = self.session.put(url, json=params, timeout=timeout)
+                elif method == "DELETE":
+                    response = self.session.delete(url, params=params, timeout=timeout)
+                else:
+                    raise ValueError(f"Unsupported HTTP method: {method}")
+
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update_from_headers(response.headers)
+                if job is not None:
+                    job.record_request()
+
+                retryable = response.status_code == 429 or (
+                    response.status_code in self.RETRY_STATUS_CODES and method in self.IDEMPOTENT_METHODS
+                )
+                if not retryable or attempt >= self.max_retries:
+                    break
+
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                delay = backoff_delay(attempt, self.RETRY_BACKOFF_BASE, self.RETRY_BACKOFF_CAP)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                if response.status_code == 429 and self.rate_limiter is not None:
+                    # Throttling applies to the whole account, so every caller backs off
+                    self.rate_limiter.pause(delay)
+                attempt += 1
+                print(f"HTTP {response.status_code} from {url}, retrying in {delay:.2f}s "
+                      f"(attempt {attempt} of {self.max_retries})")
+                time.sleep(delay)
 
             # Raise an HTTPError for bad responses (4xx or 5xx status codes)
             response.raise_for_status()
@@ -81,21 +359,166 @@ class FormstackClient:
         except requests.exceptions.HTTPError as e:
             # Detailed error message for HTTP errors
             print(f"HTTP Error: {e.response.status_code} - {e.response.text}")
+            # A 404 is an answer (the resource does not exist), not a failure of the job
+            if job is not None and e.response.status_code != 404:
+                job.error(f"HTTP {e.response.status_code} from {endpoint}")
             raise
         except requests.exceptions.ConnectionError as e:
             print(f"Connection Error: Could not connect to Formstack API: {e}")
+            if job is not None:
+                job.error(f"Connection error for {endpoint}: {e}")
             raise
         except requests.exceptions.Timeout as e:
             print(f"Timeout Error: Request to Formstack API timed out: {e}")
+            if job is not None:
+                job.error(f"Timeout for {endpoint}")
             raise
         except requests.exceptions.RequestException as e:
             # Catch all other requests-related exceptions
             print(f"An unexpected request error occurred: {e}")
+            if job is not None:
+                job.error(f"Request error for {endpoint}: {e}")
             raise
         except ValueError as e:
             print(f"JSON decoding error: {e}. Response content: {response.text}")
+            if job is not None:
+                job.error(f"Invalid JSON from {endpoint}")
             raise
 
+    def _iter_pages(self, endpoint, result_key, params=None, per_page=None, prefetch=True):
+        """
+        Lazily pages through a list endpoint using the API's page/per_page parameters.
+        While the caller works on one page, the next page can be fetched in the background.
+
+        Paging stops when a page is shorter than per_page, when the reported 'total'
+        or 'pages' is reached, or when the endpoint ignores paging and returns more
+        items than requested.
+
+        Args:
+            endpoint (str): The API endpoint (e.g., "form.json").
+            result_key (str): The key holding the list of items in each response.
+            params (dict, optional): Extra query parameters sent with every page.
+            per_page (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page while the current one is consumed.
+                                       Defaults to True.
+
+        Yields:
+            list: One page of items at a time.
+
+        Raises:
+            requests.exceptions.RequestException: If fetching a page fails.
+            ValueError: If a page does not hold a result_key list, so a malformed
+                        response is never mistaken for the end of the list.
+        """
+        per_page = per_page or self.DEFAULT_PAGE_SIZE
+        base_params = dict(params or {})
+
+        # Prefetched pages run on another thread but keep the caller's priority and job
+        priority = current_priority()
+        job = current_job()
+
+        def fetch(page):
+            with request_priority(priority), job_context(job):
+                return self._make_request("GET", endpoint, params={**base_params, "page": page, "per_page": per_page})
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        next_page = None
+        try:
+            page = 1
+            items_seen = 0
+            response_data = fetch(page)
+            while True:
+                if not (isinstance(response_data, dict) and isinstance(response_data.get(result_key), list)):
+                    # Handle unexpected response structure
+                    print(f"Unexpected response format for GET /{endpoint}: {response_data}")
+                    raise ValueError(f"Unexpected response format for GET /{endpoint} (page {page})")
+
+                items = response_data[result_key]
+                items_seen += len(items)
+                total = response_data.get('total')
+                pages = response_data.get('pages')
+                has_more = (
+                    len(items) == per_page
+                    and (total is None or items_seen < int(total))
+                    and (pages is None or page < int(pages))
+                )
+
+                next_page = None
+                if has_more and executor:
+                    next_page = executor.submit(fetch, page + 1)
+
+                yield items
+
+                if not has_more:
+                    return
+                page += 1
+                response_data = next_page.result() if next_page else fetch(page)
+        finally:
+            if executor:
+                # A prefetched page nobody will read is dropped if it has not started yet
+                # (shutdown's cancel_futures needs Python 3.9)
+                if next_page is not None:
+                    next_page.cancel()
+                executor.shutdown(wait=False)
+
+    def iter_forms(self, per_page=None, prefetch=True):
+        """
+        Lazily iterates over all forms in the Formstack account, one page at a time.
+
+        Args:
+            per_page (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+
+        Yields:
+            dict: One form at a time.
+
+        Raises:
+            requests.exceptions.RequestException: If fetching a page fails.
+        """
+        # We are adding 'folders=false' to explicitly get forms without nesting.
+        for page in self._iter_pages("form.json", "forms", params={"folders": "false"},
+                                     per_page=per_page, prefetch=prefetch):
+            yield from page
+
+    def iter_folders(self, per_page=None, prefetch=True):
+        """
+        Lazily iterates over the account's (top-level) folders, one page at a time.
+
+        Args:
+            per_page (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+
+        Yields:
+            dict: One folder at a time.
+
+        Raises:
+            requests.exceptions.RequestException: If fetching a page fails.
+        """
+        for page in self._iter_pages("folder.json", "folders", per_page=per_page, prefetch=prefetch):
+            yield from page
+
+    def iter_smartlists(self, per_page=None, prefetch=True):
+        """
+        Lazily iterates over all SmartLists, one page at a time.
+        Cached SmartList details whose 'updated' value changed are dropped on the way.
+
+        Args:
+            per_page (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+
+        Yields:
+            dict: One normalized SmartList at a time (see _process_smartlist).
+
+        Raises:
+            requests.exceptions.RequestException: If fetching a page fails.
+        """
+        # The API returns results in a 'results' array, not 'smartlists'
+        for page in self._iter_pages("smartlist", "results", per_page=per_page, prefetch=prefetch):
+            for smartlist in page:
+                if self.smartlist_cache is not None:
+                    self.smartlist_cache.discard_stale(smartlist.get('id'), smartlist.get('updated'))
+                yield self._process_smartlist(smartlist)
+
     def get_all_forms(self):
         """
         Fetches all forms from the Formstack account, including creation and
@@ -107,17 +530,7 @@ class FormstackClient:
         """
         print("Fetching all forms...")
         try:
-            # The Formstack API's GET /form endpoint returns a dictionary
-            # with a 'forms' key containing the list of forms.
-            # We are also adding 'folders=false' to the URL to explicitly get forms without nesting.
-            response_data = self._make_request("GET", "form.json", params={"folders": "false"})
-            
-            if isinstance(response_data, dict) and 'forms' in response_data and isinstance(response_data['forms'], list):
-                return response_data['forms']
-            else:
-                # Handle unexpected response structure
-                print(f"Unexpected response format for GET /form: {response_data}")
-                return []
+            return list(self.iter_forms())
         except Exception as e:
             print(f"Error fetching all forms: {e}")
             return []
@@ -151,16 +564,7 @@ class FormstackClient:
         """
         print("Fetching all folders...")
         try:
-            # The Formstack API's GET /folder endpoint returns a dictionary
-            # with a 'folders' key containing the list of folders.
-            response_data = self._make_request("GET", "folder.json")
-            
-            if isinstance(response_data, dict) and 'folders' in response_data and isinstance(response_data['folders'], list):
-                return response_data['folders']
-            else:
-                # Handle unexpected response structure
-                print(f"Unexpected response format for GET /folder: {response_data}")
-                return []
+            return list(self.iter_folders())
         except Exception as e:
             print(f"Error fetching all folders: {e}")
             return []
@@ -183,19 +587,58 @@ class FormstackClient:
             print(f"Error fetching form {form_id}: {e}")
             return None
 
-    def get_complete_folder_hierarchy(self):
+    @staticmethod
+    def _subfolder_ids(folder_details):
+        """
+        Extracts the IDs of the subfolders listed in a folder's details.
+
+        Args:
+            folder_details (dict): A folder as returned by get_folder_details.
+
+        Returns:
+            list: Subfolder IDs (the API may list subfolders as objects or as bare IDs).
+        """
+        subfolders = folder_details.get('subfolders') or []
+        if isinstance(subfolders, dict):
+            subfolders = subfolders.get('folders') or list(subfolders.values())
+        subfolder_ids = []
+        for subfolder in subfolders:
+            subfolder_id = subfolder.get('id') if isinstance(subfolder, dict) else subfolder
+            if subfolder_id:
+                subfolder_ids.append(subfolder_id)
+        return subfolder_ids
+
+    def get_complete_folder_hierarchy(self, basic_folders=None, forms_data=None, max_workers=None, strict=False):
         """
         Fetches the complete folder hierarchy by first getting all top-level folders,
         then recursively discovering subfolders and fetching detailed information.
 
+        Folder details are crawled breadth-first: all folders of one level are fetched
+        concurrently, and the subfolders listed in their details form the next level.
+
+        Args:
+            basic_folders (list, optional): Already fetched result of get_all_folders.
+                                            Fetched from the API when omitted.
+            forms_data (list, optional): Already fetched result of get_all_forms.
+                                         Fetched from the API when omitted.
+            max_workers (int, optional): Maximum number of concurrent folder detail calls.
+                                         Defaults to the client's max_workers.
+            strict (bool, optional): Raise instead of returning a partial (or empty) hierarchy
+                                     when a folder cannot be fetched. Folders that no longer
+                                     exist (404) are skipped either way. Defaults to False.
+
         Returns:
             list: A list of dictionaries with complete folder hierarchy information.
                   Returns an empty list if no folders are found or an error occurs.
+
+        Raises:
+            requests.exceptions.RequestException: With strict, if a folder cannot be fetched.
         """
         print("Fetching complete folder hierarchy...")
         try:
             # First, get the basic folder list (top-level folders)
-            basic_folders = self.get_all_folders()
+            if basic_folders is None:
+                basic_folders = self.get_all_folders()
             if not basic_folders:
                 print("No basic folders found")
                 return []
@@ -206,7 +649,8 @@ class FormstackClient:
 
             # Also check all forms to find folder IDs that might reference subfolders
             print("Checking forms for additional folder references...")
-            forms_data = self.get_all_forms()
+            if forms_data is None:
+                forms_data = self.get_all_forms()
             form_folder_ids = set()
             for form in forms_data:
                 folder_id = form.get('folder')
@@ -220,18 +664,58 @@ class FormstackClient:
             # Add these to our discovery list
             discovered_folder_ids.update(additional_folder_ids)
 
-            # Fetch detailed information for each discovered folder
+            # Fetch detailed information for each discovered folder, one
+            # breadth-first frontier at a time
             detailed_folders = []
-            for folder_id in discovered_folder_ids:
-                folder_details = self.get_folder_details(folder_id)
-                if folder_details:
+            visited_folder_ids = set(str(folder_id) for folder_id in discovered_folder_ids)
+            frontier = list(discovered_folder_ids)
+            job = current_job()
+
+            def fetch_folder_details(folder_id):
+                if strict:
+                    try:
+                        folder_details = self._make_request("GET", f"folder/{folder_id}.json")
+                    except requests.exceptions.HTTPError as e:
+                        # CachedHTTPError carries its status without a response
+                        status_code = e.response.status_code if e.response is not None else getattr(e, 'status_code', None)
+                        if status_code != 404:
+                            raise
+                        folder_details = None
+                else:
+                    folder_details = self.get_folder_details(folder_id)
+                if job is not None:
+                    job.advance()
+                return folder_details
+
+            while frontier:
+                if job is not None:
+                    # Subfolders found on this level grow the job's total
+                    job.add_total(len(frontier))
+                    job.set_message(f"Fetching folder details ({len(frontier)} folders on this level)")
+                frontier_details = self._run_concurrently(fetch_folder_details, frontier, max_workers=max_workers)
+                next_frontier = []
+                for folder_details in frontier_details:
+                    if not folder_details:
+                        continue
                     detailed_folders.append(folder_details)
+                    # Queue subfolders we have not seen yet for the next frontier
+                    for subfolder_id in self._subfolder_ids(folder_details):
+                        if str(subfolder_id) not in visited_folder_ids:
+                            visited_folder_ids.add(str(subfolder_id))
+                            next_frontier.append(subfolder_id)
+                if next_frontier:
+                    print(f"Found {len(next_frontier)} more subfolders to fetch")
+                frontier = next_frontier
 
             print(f"Successfully fetched details for {len(detailed_folders)} folders")
             return detailed_folders
 
+        except JobCancelled:
+            raise
         except Exception as e:
             print(f"Error fetching complete folder hierarchy: {e}")
+            if strict:
+                raise
             return []
 
     def get_form_partial_submissions(self, form_id):
@@ -245,8 +729,7 @@ class FormstackClient:
             list: A list of partial submission data, or an empty list if none found.
         """
         try:
-            response_data = self._make_request("GET", f"form/{form_id}/partialsubmission.json")
-            return response_data.get('partialsubmissions', []) if response_data else []
+            return self._fetch_form_list(form_id, "partialsubmission.json", 'partialsubmissions')
         except Exception as e:
             print(f"Error fetching partial submissions for form {form_id}: {e}")
             return []
@@ -262,8 +745,7 @@ class FormstackClient:
             list: A list of confirmation data, or an empty list if none found.
         """
         try:
-            response_data = self._make_request("GET", f"form/{form_id}/confirmation.json")
-            return response_data.get('confirmations', []) if response_data else []
+            return self._fetch_form_list(form_id, "confirmation.json", 'confirmations')
         except Exception as e:
             print(f"Error fetching confirmations for form {form_id}: {e}")
             return []
@@ -279,8 +761,7 @@ class FormstackClient:
             list: A list of notification data, or an empty list if none found.
         """
         try:
-            response_data = self._make_request("GET", f"form/{form_id}/notification.json")
-            return response_data.get('notifications', []) if response_data else []
+            return self._fetch_form_list(form_id, "notification.json", 'notifications')
         except Exception as e:
             print(f"Error fetching notifications for form {form_id}: {e}")
             return []
@@ -296,13 +777,12 @@ class FormstackClient:
             list: A list of webhook data, or an empty list if none found.
         """
         try:
-            response_data = self._make_request("GET", f"form/{form_id}/webhook.json")
-            return response_data.get('webhooks', []) if response_data else []
+            return self._fetch_form_list(form_id, "webhook.json", 'webhooks')
         except Exception as e:
             print(f"Error fetching webhooks for form {form_id}: {e}")
             return []
 
-    def get_form_integrations(self, form_id):
+    def get_form_integrations(self, form_id, fields=None):
         """
         Fetches integration settings for a specific form.
         Note: The integration endpoint may not be available in all Formstack API versions.
@@ -310,46 +790,68 @@ class FormstackClient:
 
         Args:
             form_id (str or int): The ID of the form to get integrations for.
+            fields (list, optional): The form's fields (get_form_fields), if already fetched.
+                                     Used instead of fetching them again when the
+                                     integration endpoint is not available.
 
         Returns:
             list: A list of integration data, or an empty list if none found.
         """
+        # Try the integrations endpoint first
+        integrations = self._get_integration_endpoint(form_id)
+        if integrations is not None:
+            return integrations
+        # If integration endpoint fails, try to detect integrations from form fields
+        return self._detect_form_integrations(form_id, fields)
+
+    def _get_integration_endpoint(self, form_id):
+        """
+        Fetches a form's integrations from the integration endpoint.
+
+        Returns:
+            list: The integrations, or None if the endpoint is not available.
+        """
+        endpoint = f"form/{form_id}/integration.json"
+        if self.negative_cache is not None and self.negative_cache.is_unsupported(endpoint):
+            # Known to fail for this account; go straight to the fallback
+            return None
         try:
-            # Try the integrations endpoint first
-            response_data = self._make_request("GET", f"form/{form_id}/integration.json")
+            response_data = self._make_request("GET", endpoint)
             return response_data.get('integrations', []) if response_data else []
+        except JobCancelled:
+            raise
         except Exception as e:
-            # If integration endpoint fails, try to detect integrations from form fields
             print(f"Integration endpoint not available for form {form_id}, trying alternative detection: {e}")
-            try:
-                # Get form fields and look for integration-related fields
+            return None
+
+    def _detect_form_integrations(self, form_id, fields=None):
+        """
+        Detects a form's integrations from its fields, fetching them unless given.
+        """
+        try:
+            # Get form fields and look for integration-related fields
+            if fields is None:
                 fields = self.get_form_fields(form_id)
-                integrations = []
-                
-                # Look for common integration field types or names
-                integration_indicators = [
-                    'salesforce', 'hubspot', 'mailchimp', 'zapier', 'webhook',
-                    'crm', 'email_marketing', 'payment', 'stripe', 'paypal'
-                ]
-                
-                for field in fields:
-                    field_name = str(field.get('name', '')).lower()
-                    field_type = str(field.get('type', '')).lower()
-                    
-                    for indicator in integration_indicators:
-                        if indicator in field_name or indicator in field_type:
-                            integrations.append({
-                                'type': indicator,
-                                'field_id': field.get('id'),
-                                'field_name': field.get('name'),
-                                'detected_from': 'field_analysis'
-                            })
-                            break
-                
-                return integrations
-            except Exception as inner_e:
-                print(f"Alternative integration detection failed for form {form_id}: {inner_e}")
-                return []
+            return self._detect_integrations_from_fields(fields)
+        except JobCancelled:
+            raise
+        except Exception as inner_e:
+            print(f"Alternative integration detection failed for form {form_id}: {inner_e}")
+            return []
+
+    @classmethod
+    def _detect_integrations_from_fields(cls, fields):
+        """
+        Detects likely integrations by looking for common integration
+        field types or names (see INTEGRATION_DETECTOR).
+
+        Args:
+            fields (list): Field dictionaries as returned by get_form_fields.
+
+        Returns:
+            list: One integration dictionary per matching field.
+        """
+        return cls.INTEGRATION_DETECTOR.detect(fields)
 
     def get_form_fields(self, form_id):
         """
@@ -363,18 +865,286 @@ class FormstackClient:
             list: A list of field data, or an empty list if none found.
         """
         try:
-            response_data = self._make_request("GET", f"form/{form_id}/field.json")
-            # Handle both dict and list responses
-            if isinstance(response_data, list):
-                return response_data
-            elif isinstance(response_data, dict):
-                return response_data.get('fields', response_data.get('data', []))
-            else:
-                return []
+            return self._fetch_form_fields(form_id)
         except Exception as e:
             print(f"Error fetching fields for form {form_id}: {e}")
             return []
 
+    def _fetch_form_list(self, form_id, resource, result_key):
+        """
+        Fetches one list sub-resource of a form (e.g. "webhook.json"). Unlike the
+        get_form_* methods, failures raise instead of returning an empty list.
+
+        Raises:
+            requests.exceptions.RequestException: If the call fails.
+        """
+        response_data = self._make_request("GET", f"form/{form_id}/{resource}")
+        return response_data.get(result_key, []) if response_data else []
+
+    def _fetch_form_fields(self, form_id):
+        """
+        Fetches a form's fields. Unlike get_form_fields, failures raise.
+
+        Raises:
+            requests.exceptions.RequestException: If the call fails.
+        """
+        response_data = self._make_request("GET", f"form/{form_id}/field.json")
+        # Handle both dict and list responses
+        if isinstance(response_data, list):
+            return response_data
+        elif isinstance(response_data, dict):
+            return response_data.get('fields', response_data.get('data', []))
+        else:
+            return []
+
+    def _fetch_form_config(self, form_id, config_type):
+        """
+        Fetches one configuration type of a form for the batch methods
+        (get_forms_configuration, iter_forms_configuration).
+
+        Returns:
+            list: The items returned by the API, or None if the fetch failed, so that
+                  callers which persist results can tell "unknown" from "none".
+
+        Raises:
+            JobCancelled: If the current job was cancelled.
+        """
+        try:
+            if config_type in self.FORM_CONFIG_ENDPOINTS:
+                return self._fetch_form_list(form_id, *self.FORM_CONFIG_ENDPOINTS[config_type])
+            if config_type == 'integrations':
+                integrations = self._get_integration_endpoint(form_id)
+                if integrations is not None:
+                    return integrations
+                return self._detect_integrations_from_fields(self._fetch_form_fields(form_id))
+            return getattr(self, self.FORM_CONFIG_FETCHERS[config_type])(form_id)
+        except JobCancelled:
+            raise
+        except Exception as e:
+            print(f"Error fetching {config_type} for form {form_id}: {e}")
+            return None
+
+    def get_form_bundle(self, form_id):
+        """
+        Fetches a form's details and all of its sub-resources (partial submissions,
+        confirmations, notifications, webhooks, integrations and fields) concurrently,
+        so the whole bundle takes about one round trip instead of one per resource.
+
+        The fields are fetched once and shared: when the integration endpoint is not
+        available, integrations are detected from the same fields response.
+
+        Args:
+            form_id (str or int): The ID of the form.
+
+        Returns:
+            dict: 'form' (the form details, or None if the form could not be retrieved)
+                  and one list per sub-resource: 'partial_submissions', 'confirmations',
+                  'notifications', 'webhooks', 'integrations' and 'fields'.
+        """
+        # The bundle serves a page, so the calls keep the caller's priority
+        priority = current_priority()
+        job = current_job()
+
+        def fetch(method_name):
+            with request_priority(priority), job_context(job):
+                return getattr(self, method_name)(form_id)
+
+        workers = min(self.max_workers, len(self.FORM_BUNDLE_FETCHERS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {key: executor.submit(fetch, method_name)
+                       for key, method_name in self.FORM_BUNDLE_FETCHERS.items()}
+            results = {key: future.result() for key, future in futures.items()}
+
+        bundle = {key: result or [] for key, result in results.items()}
+        bundle['form'] = results['form']
+        if results['integrations'] is None:
+            bundle['integrations'] = self._detect_form_integrations(form_id, bundle['fields'])
+        return bundle
+
+    def get_forms_fields(self, form_ids, max_workers=None):
+        """
+        Fetches the fields of many forms concurrently.
+
+        Args:
+            form_ids (list): The IDs of the forms.
+            max_workers (int, optional): Maximum number of concurrent API calls.
+                                         Defaults to the client's max_workers.
+
+        Returns:
+            list: The field list of each form, in the same order as form_ids. A form
+                  whose fields could not be fetched gets None rather than an empty
+                  list, so that callers which persist results can skip it.
+        """
+        return self._run_concurrently(self._fetch_form_fields_or_none, form_ids, max_workers=max_workers)
+
+    def _fetch_form_fields_or_none(self, form_id):
+        try:
+            return self._fetch_form_fields(form_id)
+        except JobCancelled:
+            raise
+        except Exception as e:
+            print(f"Error fetching fields for form {form_id}: {e}")
+            return None
+
+    def _run_concurrently(self, func, items, max_workers=None):
+        """
+        Applies func to every item on a bounded thread pool.
+
+        Args:
+            func (callable): Function called with a single item.
+            items (iterable): Items to process.
+            max_workers (int, optional): Maximum number of concurrent calls.
+                                         Defaults to the client's max_workers.
+
+        Returns:
+            list: The results of func, in the same order as items.
+        """
+        items = list(items)
+        if not items:
+            return []
+        workers = min(max_workers or self.max_workers, len(items))
+        # Fan-out calls queue behind interactive calls (and keep a lower priority if already set)
+        priority = max(current_priority(), PRIORITY_FANOUT)
+        # Pool threads report to the caller's job, and stop taking items once it is cancelled
+        job = current_job()
+
+        def run(item):
+            with request_priority(priority), job_context(job):
+                if job is not None:
+                    job.raise_if_cancelled()
+                return func(item)
+
+        if workers <= 1:
+            return [run(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, items))
+
+    def get_forms_configuration(self, form_ids, config_types=None, max_workers=None):
+        """
+        Fetches configuration details for many forms concurrently.
+        Only the requested configuration types are fetched, and every
+        (form, type) pair is an independent task on the same bounded pool.
+
+        Args:
+            form_ids (list): The IDs of the forms to fetch configuration for.
+            config_types (iterable, optional): Keys of FORM_CONFIG_FETCHERS to fetch
+                                               (e.g. ['webhooks', 'notifications']).
+                                               Defaults to all types.
+            max_workers (int, optional): Maximum number of concurrent API calls.
+                                         Defaults to the client's max_workers.
+
+        Returns:
+            list: One dictionary per form, in the same order as form_ids, mapping
+                  each requested configuration type to the list returned by the API,
+                  or to None if fetching it failed.
+        """
+        form_ids = list(form_ids)
+        if config_types is None:
+            config_types = list(self.FORM_CONFIG_FETCHERS)
+        else:
+            config_types = [config_type for config_type in self.FORM_CONFIG_FETCHERS if config_type in set(config_types)]
+
+        tasks = [(index, form_id, config_type)
+                 for index, form_id in enumerate(form_ids)
+                 for config_type in config_types]
+
+        def fetch(task):
+            _, form_id, config_type = task
+            return self._fetch_form_config(form_id, config_type)
+
+        print(f"Fetching {', '.join(config_types) or 'no'} configuration for {len(form_ids)} forms...")
+        results = self._run_concurrently(fetch, tasks, max_workers=max_workers)
+
+        configurations = [{} for _ in form_ids]
+        for (index, _, config_type), result in zip(tasks, results):
+            configurations[index][config_type] = result
+        return configurations
+
+    def iter_forms_configuration(self, form_ids, config_types=None, max_workers=None):
+        """
+        Fetches configuration details for many forms concurrently, like
+        get_forms_configuration, but yields each form as soon as all of its
+        configuration types are fetched instead of waiting for every form.
+        Tasks are queued form by form, so the first forms complete first.
+        Closing the generator early cancels the tasks that have not started.
+
+        Args:
+            form_ids (list): The IDs of the forms to fetch configuration for.
+            config_types (iterable, optional): Keys of FORM_CONFIG_FETCHERS to fetch. Defaults to all types.
+            max_workers (int, optional): Maximum number of concurrent API calls.
+                                         Defaults to the client's max_workers.
+
+        Yields:
+            tuple: (form_id, configuration), in completion order; configuration maps
+                   each requested configuration type to the list returned by the API,
+                   or to None if fetching it failed.
+        """
+        form_ids = list(form_ids)
+        if config_types is None:
+            config_types = list(self.FORM_CONFIG_FETCHERS)
+        else:
+            config_types = [config_type for config_type in self.FORM_CONFIG_FETCHERS if config_type in set(config_types)]
+        if not form_ids:
+            return
+        if not config_types:
+            for form_id in form_ids:
+                yield form_id, {}
+            return
+
+        # Fan-out calls queue behind interactive calls (and keep a lower priority if already set)
+        priority = max(current_priority(), PRIORITY_FANOUT)
+        job = current_job()
+
+        def fetch(form_id, config_type):
+            with request_priority(priority), job_context(job):
+                if job is not None:
+                    job.raise_if_cancelled()
+                return self._fetch_form_config(form_id, config_type)
+
+        workers = min(max_workers or self.max_workers, len(form_ids) * len(config_types))
+        configurations = [{} for _ in form_ids]
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = {}
+        try:
+            for index, form_id in enumerate(form_ids):
+                for config_type in config_types:
+                    futures[executor.submit(fetch, form_id, config_type)] = (index, config_type)
+            for future in as_completed(futures):
+                index, config_type = futures[future]
+                configurations[index][config_type] = future.result()
+                if len(configurations[index]) == len(config_types):
+                    yield form_ids[index], configurations[index]
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _process_smartlist(smartlist):
+        """
+        Normalizes a raw SmartList from the API into a consistent data structure.
+
+        Args:
+            smartlist (dict): A SmartList as returned by the API.
+
+        Returns:
+            dict: The SmartList with defaults filled in for missing keys.
+        """
+        return {
+            'id': smartlist.get('id'),
+            'name': smartlist.get('name', 'Unnamed SmartList'),
+            'description': smartlist.get('description', ''),
+            'created': smartlist.get('created'),
+            'updated': smartlist.get('updated'),
+            'items_count': smartlist.get('items_count', 0),
+            'is_active': smartlist.get('is_active', True),
+            'folder': smartlist.get('folder'),
+            'sharing': smartlist.get('sharing', {}),
+            'fields': smartlist.get('fields', []),
+            'useImages': smartlist.get('useImages', False),
+            'useSeparateValues': smartlist.get('useSeparateValues', False)
+        }
+
     def get_all_smartlists(self):
         """
         Fetches all SmartLists from the Formstack API.
@@ -383,54 +1153,108 @@ class FormstackClient:
             list: A list of SmartList dictionaries containing SmartList information.
         """
         try:
-            response = self._make_request("GET", "smartlist")
-            # The API returns results in a 'results' array, not 'smartlists'
-            smartlists = response.get("results", [])
-            
-            print(f"Found {len(smartlists)} SmartLists in API response")
-            
-            # Process each smartlist to ensure consistent data structure
-            processed_smartlists = []
-            for smartlist in smartlists:
-                processed_smartlist = {
-                    'id': smartlist.get('id'),
-                    'name': smartlist.get('name', 'Unnamed SmartList'),
-                    'description': smartlist.get('description', ''),
-                    'created': smartlist.get('created'),
-                    'updated': smartlist.get('updated'),
-                    'items_count': smartlist.get('items_count', 0),
-                    'is_active': smartlist.get('is_active', True),
-                    'folder': smartlist.get('folder'),
-                    'sharing': smartlist.get('sharing', {}),
-                    'fields': smartlist.get('fields', []),
-                    'useImages': smartlist.get('useImages', False),
-                    'useSeparateValues': smartlist.get('useSeparateValues', False)
-                }
-                processed_smartlists.append(processed_smartlist)
-            
+            processed_smartlists = list(self.iter_smartlists())
+            print(f"Found {len(processed_smartlists)} SmartLists in API response")
             return processed_smartlists
             
         except Exception as e:
             print(f"Error fetching SmartLists: {e}")
             return []
 
-    def get_smartlist_details(self, smartlist_id):
+    def get_smartlist_details(self, smartlist_id, updated=None):
         """
         Fetches detailed information for a specific SmartList.
-        
+        Details are served from the SmartList cache while it holds them for the
+        SmartList's current 'updated' value.
+
         Args:
             smartlist_id (str): The ID of the SmartList to fetch details for.
-            
+            updated (str, optional): The SmartList's current 'updated' value (e.g. from
+                                     iter_smartlists). Cached details for another value are refetched.
+
         Returns:
             dict: SmartList details including fields, items, and settings.
+                  Cached details are shared and must not be modified.
         """
+        if self.smartlist_cache is not None:
+            cached = self.smartlist_cache.get(smartlist_id, updated)
+            if cached is not None:
+                return cached
         try:
-            response = self._make_request("GET", f"smartlist/{smartlist_id}")
+            # The SmartList cache replaces the response cache for this endpoint
+            response = self._make_request("GET", f"smartlist/{smartlist_id}", use_cache=self.smartlist_cache is None)
+            if self.smartlist_cache is not None and isinstance(response, dict):
+                self.smartlist_cache.set(smartlist_id, response)
             return response
         except Exception as e:
             print(f"Error fetching SmartList details for ID {smartlist_id}: {e}")
             return {}
 
+    def iter_smartlist_items(self, smartlist_id, updated=None):
+        """
+        Iterates over the items of a SmartList, one at a time.
+
+        The API returns every item with the SmartList itself, so the items are read
+        from the (cached) SmartList details rather than copied into a new list.
+
+        Args:
+            smartlist_id (str): The ID of the SmartList.
+            updated (str, optional): The SmartList's current 'updated' value.
+
+        Yields:
+            dict: One item at a time.
+        """
+        yield from SmartListCache.items_of(self.get_smartlist_details(smartlist_id, updated))
+
+    def get_smartlist_items_page(self, smartlist_id, page=1, per_page=None, updated=None, search=None):
+        """
+        Returns one page of a SmartList's items.
+
+        Args:
+            smartlist_id (str): The ID of the SmartList.
+            page (int, optional): 1-based page number. Defaults to 1.
+            per_page (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            updated (str, optional): The SmartList's 'updated' value the caller is paging
+                                     through; cached details for another value are refetched.
+            search (str, optional): Only count and return items whose label or value
+                                    contains this text (case-insensitive).
+
+        Returns:
+            dict: smartlist_id, updated (of the details the page was cut from), page,
+                  per_page, total (matching items), pages and items, or None if the
+                  SmartList could not be fetched.
+        """
+        per_page = per_page or self.DEFAULT_PAGE_SIZE
+        page = max(int(page), 1)
+        details = self.get_smartlist_details(smartlist_id, updated)
+        if not isinstance(details, dict) or not details:
+            return None
+        if not search:
+            items = SmartListCache.items_of(details)
+        elif self.smartlist_cache is not None:
+            # Filtered once per cached details and search, not on every page request
+            items = self.smartlist_cache.search(smartlist_id, details, search)
+        else:
+            items = SmartListCache.filter_items(SmartListCache.items_of(details), search)
+        return self._smartlist_items_page(smartlist_id, details, items, page, per_page)
+
+    @staticmethod
+    def _smartlist_items_page(smartlist_id, details, items, page, per_page):
+        """
+        Cuts one page out of a SmartList's (possibly filtered) items, in the format
+        returned by get_smartlist_items_page.
+        """
+        start = (page - 1) * per_page
+        return {
+            'smartlist_id': str(smartlist_id),
+            'updated': details.get('updated'),
+            'page': page,
+            'per_page': per_page,
+            'total': len(items),
+            'pages': (len(items) + per_page - 1) // per_page,
+            'items': items[start:start + per_page]
+        }
+
 
 # Example Usage (for testing purposes when running this file directly)
 if __name__ == "__main__":
@@ -0,0 +1,345 @@
+# src/api/job_progress.py
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+class JobCancelled(Exception):
+    """
+    Raised inside a job's work once the job has been cancelled.
+    """
+
+# Job that the work running in the current thread/context reports to
+_current_job = ContextVar('formstack_current_job', default=None)
+
+def current_job():
+    """
+    Returns the Job that the current context reports progress to, or None.
+    """
+    return _current_job.get()
+
+@contextmanager
+def job_context(job):
+    """
+    Context manager that makes work inside it report to job (None reports nowhere).
+
+    Example:
+        with job_context(registry.start("Folder crawl")):
+            client.get_complete_folder_hierarchy()
+    """
+    token = _current_job.set(job)
+    try:
+        yield job
+    finally:
+        _current_job.reset(token)
+
+class Job:
+    """
+    Progress of one long-running job: items done out of total, the current item
+    and API request rates, the estimated time left, recent errors and a
+    cancellation flag that the job's work checks between items.
+
+    Jobs are created by JobRegistry.start(); every change is published to the
+    registry's subscribers.
+    """
+    # Seconds of history used for the current rates
+    RATE_WINDOW = 10
+
+    # Number of most recent errors kept
+    MAX_ERRORS = 20
+
+    def __init__(self, registry, job_id, name, total=None):
+        self.registry = registry
+        self.id = job_id
+        self.name = name
+        self.total = total
+        self.done = 0
+        self.requests = 0
+        self.error_count = 0
+        self.errors = deque(maxlen=self.MAX_ERRORS)
+        self.message = None
+        self.status = 'running'
+        self.started_at = time.time()
+        self.finished_at = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        # (monotonic time, done, requests) samples for the current rates
+        self._samples = deque([(time.monotonic(), 0, 0)])
+
+    def _sample(self):
+        now = time.monotonic()
+        self._samples.append((now, self.done, self.requests))
+        while len(self._samples) > 2 and self._samples[1][0] < now - self.RATE_WINDOW:
+            self._samples.popleft()
+
+    def set_total(self, total):
+        """
+        Sets the number of items the job will process.
+        """
+        with self._lock:
+            self.total = total
+        self.registry.publish(self)
+
+    def add_total(self, count):
+        """
+        Adds items discovered while the job runs (e.g. subfolders) to its total.
+        """
+        with self._lock:
+            self.total = (self.total or 0) + count
+        self.registry.publish(self)
+
+    def advance(self, count=1, message=None):
+        """
+        Marks count more items as done.
+
+        Args:
+            count (int): Number of items finished.
+            message (str, optional): Description of what the job is doing now.
+        """
+        with self._lock:
+            self.done += count
+            if message is not None:
+                self.message = message
+            self._sample()
+        self.registry.publish(self)
+
+    def set_message(self, message):
+        """
+        Describes what the job is doing now (e.g. "Fetching folder details").
+        """
+        with self._lock:
+            self.message = message
+        self.registry.publish(self)
+
+    def record_request(self):
+        """
+        Counts one API request made for the job.
+        """
+        with self._lock:
+            self.requests += 1
+            self._sample()
+        self.registry.publish(self)
+
+    def error(self, message):
+        """
+        Records an error that did not stop the job.
+        """
+        with self._lock:
+            self.error_count += 1
+            self.errors.append({'at': time.time(), 'message': str(message)})
+        self.registry.publish(self, force=True)
+
+    def cancel(self):
+        """
+        Asks the job to stop. Its work raises JobCancelled at the next check.
+        """
+        self._cancel.set()
+        self.registry.publish(self, force=True)
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def raise_if_cancelled(self):
+        """
+        Raises JobCancelled if the job has been cancelled.
+        """
+        if self._cancel.is_set():
+            raise JobCancelled(f"Job '{self.name}' was cancelled")
+
+    def finish(self, error=None):
+        """
+        Marks the job as finished: 'cancelled' if it was cancelled, 'failed' if
+        error is given, 'done' otherwise.
+        """
+        with self._lock:
+            if self._cancel.is_set():
+                self.status = 'cancelled'
+            elif error is not None:
+                self.status = 'failed'
+                self.error_count += 1
+                self.errors.append({'at': time.time(), 'message': str(error)})
+            else:
+                self.status = 'done'
+            self.finished_at = time.time()
+        self.registry.publish(self, force=True)
+
+    def snapshot(self):
+        """
+        Returns the job's state as a JSON-serializable dictionary.
+
+        Returns:
+            dict: id, name, status, message, done, total, percent, rate (items per
+                  second), request_rate (API requests per second), requests,
+                  eta_seconds, elapsed_seconds, cancel_requested, error_count,
+                  errors, started_at and finished_at.
+        """
+        with self._lock:
+            first_time, first_done, first_requests = self._samples[0]
+            last_time, last_done, last_requests = self._samples[-1]
+            if self.status == 'running' and time.monotonic() - last_time > self.RATE_WINDOW:
+                # Nothing happened for a while
+                rate = request_rate = 0.0
+            elif last_time > first_time:
+                rate = (last_done - first_done) / (last_time - first_time)
+                request_rate = (last_requests - first_requests) / (last_time - first_time)
+            else:
+                rate = request_rate = 0.0
+            remaining = self.total - self.done if self.total is not None else None
+            eta = remaining / rate if self.status == 'running' and remaining is not None and rate > 0 else None
+            end = self.finished_at or time.time()
+            return {
+                'id': self.id,
+                'name': self.name,
+                'status': self.status,
+                'message': self.message,
+                'done': self.done,
+                'total': self.total,
+                'percent': round(min(100.0, self.done / self.total * 100), 1) if self.total else None,
+                'rate': round(rate, 2),
+                'request_rate': round(request_rate, 2),
+                'requests': self.requests,
+                'eta_seconds': round(max(0.0, eta), 1) if eta is not None else None,
+                'elapsed_seconds': round(end - self.started_at, 1),
+                'cancel_requested': self._cancel.is_set(),
+                'error_count': self.error_count,
+                'errors': list(self.errors),
+                'started_at': self.started_at,
+                'finished_at': self.finished_at
+            }
+
+class JobRegistry:
+    """
+    Keeps the running and recently finished jobs of the process and publishes
+    their progress to subscribers (e.g. a Server-Sent Events stream).
+
+    Updates of one job are published at most every PUBLISH_INTERVAL seconds,
+    except status changes and errors, which are always published.
+    """
+    # Minimum seconds between two published updates of the same job
+    PUBLISH_INTERVAL = 0.5
+
+    # Number of finished jobs kept for late subscribers
+    MAX_FINISHED_JOBS = 20
+
+    # Updates buffered per subscriber before the oldest are dropped
+    SUBSCRIBER_QUEUE_SIZE = 1000
+
+    def __init__(self):
+        self._jobs = {}
+        self._ids = itertools.count(1)
+        self._subscribers = []
+        self._published_at = {}
+        self._lock = threading.Lock()
+
+    def start(self, name, total=None):
+        """
+        Registers a new running job.
+
+        Args:
+            name (str): Human-readable job name (e.g. "Configuration index crawl").
+            total (int, optional): Number of items, if known up front.
+
+        Returns:
+            Job: The new job.
+        """
+        with self._lock:
+            job = Job(self, str(next(self._ids)), name, total)
+            self._jobs[job.id] = job
+            # Forget the oldest finished jobs
+            finished = [job_id for job_id, other in self._jobs.items() if other.status != 'running']
+            for job_id in finished[:max(0, len(finished) - self.MAX_FINISHED_JOBS)]:
+                del self._jobs[job_id]
+                self._published_at.pop(job_id, None)
+        print(f"Job {job.id} started: {name}")
+        self.publish(job, force=True)
+        return job
+
+    @contextmanager
+    def run(self, name, total=None):
+        """
+        Context manager that starts a job, makes it the current job and finishes it
+        on exit (as failed if an exception other than JobCancelled escapes).
+        """
+        job = self.start(name, total)
+        try:
+            with job_context(job):
+                yield job
+        except JobCancelled:
+            job.finish()
+            print(f"Job {job.id} cancelled: {name}")
+            raise
+        except Exception as e:
+            job.finish(error=e)
+            raise
+        else:
+            job.finish()
+
+    def get(self, job_id):
+        """
+        Returns a job by ID, or None.
+        """
+        return self._jobs.get(str(job_id))
+
+    def jobs(self):
+        """
+        Returns the snapshots of all known jobs, oldest first.
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job.snapshot() for job in jobs]
+
+    def cancel(self, job_id):
+        """
+        Cancels a running job.
+
+        Returns:
+            bool: False if there is no running job with this ID.
+        """
+        job = self.get(job_id)
+        if job is None or job.status != 'running':
+            return False
+        job.cancel()
+        return True
+
+    def subscribe(self):
+        """
+        Returns a queue that receives a job snapshot for every published update.
+        Call unsubscribe() with it when done.
+        """
+        subscriber = queue.Queue(maxsize=self.SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def publish(self, job, force=False):
+        """
+        Sends the job's snapshot to every subscriber (throttled unless force is True).
+        """
+        now = time.monotonic()
+        with self._lock:
+            if not self._subscribers:
+                return
+            if not force and now - self._published_at.get(job.id, 0) < self.PUBLISH_INTERVAL:
+                return
+            self._published_at[job.id] = now
+            subscribers = list(self._subscribers)
+        snapshot = job.snapshot()
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(snapshot)
+            except queue.Full:
+                # A slow subscriber loses its oldest update rather than blocking the job
+                try:
+                    subscriber.get_nowait()
+                    subscriber.put_nowait(snapshot)
+                except (queue.Empty, queue.Full):
+                    pass
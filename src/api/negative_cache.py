@@ -0,0 +1,231 @@
+# src/api/negative_cache.py
+import re
+import threading
+import time
+import requests
+
+class CachedHTTPError(requests.exceptions.HTTPError):
+    """
+    Raised instead of calling the API when the negative cache already knows the
+    answer: the object does not exist (404) or the account does not support the endpoint.
+    """
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.status_code = status_code
+
+class NegativeCache:
+    """
+    A thread-safe, in-memory record of API calls that are known to fail, so they
+    can be answered without a round trip:
+
+    - Missing objects: a 404 for an object endpoint (e.g. "form/123.json") marks
+      that object as missing for MISSING_TTL seconds. Calls to the object and to
+      its sub-resources (e.g. "form/123/webhook.json") then fail immediately.
+    - Unsupported endpoints: when a sub-resource endpoint (e.g.
+      "form/{id}/integration.json") fails with one of UNSUPPORTED_STATUS_CODES for
+      UNSUPPORTED_THRESHOLD different objects in a row, it is marked unsupported
+      for the account for UNSUPPORTED_TTL seconds. Any success clears the mark.
+      A 404 only counts once the object is known to exist (another call about it
+      succeeded, before or after the 404), so 404s caused by deleted or
+      inaccessible objects never mark an endpoint unsupported. 405 and 501 always count.
+
+    Only GET calls are recorded. Once an entry expires the next call goes to the
+    API again, so a restored object or a newly enabled endpoint is picked up.
+    """
+    # Statuses that suggest the account does not support an endpoint
+    UNSUPPORTED_STATUS_CODES = {404, 405, 501}
+
+    # Statuses that only count when the object itself is known to exist
+    AMBIGUOUS_STATUS_CODES = {404}
+
+    # Consecutive failures (on different objects) before an endpoint is marked unsupported
+    UNSUPPORTED_THRESHOLD = 5
+
+    # Seconds an endpoint stays marked unsupported
+    UNSUPPORTED_TTL = 3600
+
+    # Seconds an object stays marked missing after a 404
+    MISSING_TTL = 600
+
+    # Maximum number of missing objects remembered (the oldest are dropped first)
+    MAX_MISSING = 10000
+
+    # Maximum number of objects remembered as existing, or as having pending 404s
+    MAX_OBJECTS = 10000
+
+    # "form/123.json" (object) or "form/123/webhook.json" (sub-resource)
+    ENDPOINT_PATTERN = re.compile(r'^(?P<kind>[a-z]+)/(?P<id>\d+)(?:\.json|/(?P<resource>[a-z_]+)\.json)$')
+
+    def __init__(self, unsupported_ttl=None, missing_ttl=None, unsupported_threshold=None):
+        """
+        Initializes the NegativeCache.
+
+        Args:
+            unsupported_ttl (float, optional): Defaults to UNSUPPORTED_TTL.
+            missing_ttl (float, optional): Defaults to MISSING_TTL.
+            unsupported_threshold (int, optional): Defaults to UNSUPPORTED_THRESHOLD.
+        """
+        self.unsupported_ttl = unsupported_ttl if unsupported_ttl is not None else self.UNSUPPORTED_TTL
+        self.missing_ttl = missing_ttl if missing_ttl is not None else self.MISSING_TTL
+        self.unsupported_threshold = unsupported_threshold or self.UNSUPPORTED_THRESHOLD
+        self._missing = {}       # "form/123" -> expires_at (insertion ordered)
+        self._unsupported = {}   # "form/{id}/integration.json" -> expires_at
+        self._failures = {}      # endpoint template -> set of object keys failing in a row
+        self._existing = {}      # "form/123" -> True, for objects a call succeeded for (insertion ordered)
+        self._pending = {}       # "form/123" -> templates that returned 404 before the object was known to exist
+        self._lock = threading.Lock()
+        # Calls answered from the cache instead of the API
+        self.hits = 0
+
+    @classmethod
+    def parse(cls, endpoint):
+        """
+        Splits an endpoint into the object it belongs to and its endpoint template.
+
+        Returns:
+            tuple: (object key, template), e.g. ("form/123", "form/{id}/webhook.json"),
+                   with template None for the object endpoint itself, or (None, None)
+                   for endpoints that are not about a single object.
+        """
+        match = cls.ENDPOINT_PATTERN.match(endpoint)
+        if not match:
+            return None, None
+        object_key = f"{match.group('kind')}/{match.group('id')}"
+        resource = match.group('resource')
+        template = f"{match.group('kind')}/{{id}}/{resource}.json" if resource else None
+        return object_key, template
+
+    def check(self, endpoint):
+        """
+        Raises CachedHTTPError if a call to endpoint is known to fail.
+
+        Raises:
+            CachedHTTPError: If the object is missing or the endpoint is unsupported.
+        """
+        object_key, template = self.parse(endpoint)
+        if object_key is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if self._missing.get(object_key, 0) > now:
+                self.hits += 1
+                raise CachedHTTPError(f"404 Not Found (cached): {object_key} does not exist", 404)
+            if template is not None and self._unsupported.get(template, 0) > now:
+                self.hits += 1
+                raise CachedHTTPError(f"Endpoint {template} is not supported for this account (cached)", 404)
+
+    def is_unsupported(self, endpoint):
+        """
+        Returns True if the endpoint (e.g. "form/123/integration.json") is marked unsupported.
+        """
+        _, template = self.parse(endpoint)
+        if template is None:
+            return False
+        with self._lock:
+            if self._unsupported.get(template, 0) > time.monotonic():
+                self.hits += 1
+                return True
+            return False
+
+    def record_success(self, endpoint):
+        """
+        Records a successful call: the object exists and the endpoint is supported.
+        """
+        object_key, template = self.parse(endpoint)
+        if object_key is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._missing.pop(object_key, None)
+            self._existing.pop(object_key, None)
+            self._existing[object_key] = True
+            while len(self._existing) > self.MAX_OBJECTS:
+                del self._existing[next(iter(self._existing))]
+            if template is not None:
+                self._failures.pop(template, None)
+                self._unsupported.pop(template, None)
+            # 404s of other endpoints of this object now count (the object exists)
+            for pending_template in self._pending.pop(object_key, ()):
+                if pending_template != template:
+                    self._count_failure(pending_template, object_key, now)
+
+    def record_failure(self, endpoint, status_code):
+        """
+        Records a failed call.
+
+        Args:
+            endpoint (str): The API endpoint.
+            status_code (int): The HTTP status of the response.
+        """
+        object_key, template = self.parse(endpoint)
+        if object_key is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if template is None:
+                if status_code == 404:
+                    self._existing.pop(object_key, None)
+                    self._pending.pop(object_key, None)
+                    self._missing.pop(object_key, None)
+                    self._missing[object_key] = now + self.missing_ttl
+                    while len(self._missing) > self.MAX_MISSING:
+                        del self._missing[next(iter(self._missing))]
+                return
+            if status_code not in self.UNSUPPORTED_STATUS_CODES:
+                return
+            if status_code in self.AMBIGUOUS_STATUS_CODES and object_key not in self._existing:
+                # The object may be gone: only count the 404 once another call proves it exists
+                self._pending.setdefault(object_key, set()).add(template)
+                while len(self._pending) > self.MAX_OBJECTS:
+                    del self._pending[next(iter(self._pending))]
+                return
+            self._count_failure(template, object_key, now)
+
+    def _count_failure(self, template, object_key, now):
+        # Called with the lock held
+        failures = self._failures.setdefault(template, set())
+        failures.add(object_key)
+        if len(failures) >= self.unsupported_threshold:
+            self._unsupported[template] = now + self.unsupported_ttl
+            del self._failures[template]
+            print(f"Endpoint {template} failed for {self.unsupported_threshold} different objects in a row; "
+                  f"treating it as unsupported for {self.unsupported_ttl}s")
+
+    def invalidate(self, endpoint_prefix=None):
+        """
+        Forgets negative entries.
+
+        Args:
+            endpoint_prefix (str, optional): Only forget objects and endpoint templates
+                                             starting with this prefix (e.g. "form/123").
+                                             Forgets everything when omitted.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with self._lock:
+            removed = 0
+            for entries in (self._missing, self._unsupported, self._failures, self._existing, self._pending):
+                keys = [key for key in entries if endpoint_prefix is None or key.startswith(endpoint_prefix)]
+                for key in keys:
+                    del entries[key]
+                if entries is self._missing or entries is self._unsupported:
+                    removed += len(keys)
+            return removed
+
+    def stats(self):
+        """
+        Returns the number of answered calls and the current entries.
+
+        Returns:
+            dict: hits, missing (number of objects marked missing) and unsupported
+                  (templates marked unsupported, with seconds until they expire).
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'missing': sum(1 for expires_at in self._missing.values() if expires_at > now),
+                'unsupported': {template: round(expires_at - now, 1)
+                                for template, expires_at in self._unsupported.items() if expires_at > now}
+            }
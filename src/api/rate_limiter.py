@@ -0,0 +1,265 @@
+# src/api/rate_limiter.py
+import heapq
+import itertools
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+
+# Request priorities: lower values are served first when callers wait for a token.
+# Interactive dashboard calls jump ahead of fan-outs (e.g. /api/advanced-search),
+# which in turn jump ahead of background crawls (e.g. snapshot syncs).
+PRIORITY_INTERACTIVE = 0
+PRIORITY_FANOUT = 1
+PRIORITY_BACKGROUND = 2
+
+# Priority of the API calls made in the current thread/context
+_current_priority = ContextVar('formstack_request_priority', default=PRIORITY_INTERACTIVE)
+
+def current_priority():
+    """
+    Returns the priority of API calls made in the current context.
+    """
+    return _current_priority.get()
+
+@contextmanager
+def request_priority(priority):
+    """
+    Context manager that sets the priority of API calls made inside it.
+
+    Example:
+        with request_priority(PRIORITY_BACKGROUND):
+            client.get_all_forms()
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+def backoff_delay(attempt, base, cap):
+    """
+    Returns a "full jitter" exponential backoff delay: a random number of seconds
+    between 0 and min(cap, base * 2 ** attempt).
+
+    Args:
+        attempt (int): The zero-based retry attempt.
+        base (float): Delay ceiling of the first retry in seconds.
+        cap (float): Maximum delay ceiling in seconds.
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+def parse_retry_after(value):
+    """
+    Parses a Retry-After header (either seconds or an HTTP date).
+
+    Returns:
+        float: Seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class RateLimiter:
+    """
+    A thread-safe token bucket shared by every call of a FormstackClient.
+
+    Callers waiting for a token are served in priority order (then in arrival order).
+    The bucket follows the rate-limit headers returned by the API: it never hands
+    out more tokens than X-RateLimit-Remaining reports, pauses until the reported
+    reset time when the limit is exhausted, and pauses after a 429's Retry-After.
+
+    The configured rate and burst are upper bounds. When the API reports its limit,
+    the bucket never holds more than X-RateLimit-Limit tokens, and when it also
+    reports the reset time, the refill rate is the pace that spreads the calls left
+    in the window until the reset. Long crawls then slow down instead of exhausting
+    the quota and stalling every caller until the window resets.
+    """
+    # Maximum sustained request rate (requests per second) and bucket size
+    DEFAULT_RATE = float(os.getenv("FORMSTACK_RATE_LIMIT", "20"))
+    DEFAULT_BURST = 40
+
+    # Pause in seconds when the API reports no remaining calls but no reset time
+    DEFAULT_EXHAUSTED_PAUSE = 60
+
+    def __init__(self, rate=None, burst=None):
+        """
+        Initializes the RateLimiter.
+
+        Args:
+            rate (float, optional): Maximum number of tokens added per second. Defaults to DEFAULT_RATE.
+            burst (int, optional): Maximum number of tokens in the bucket. Defaults to DEFAULT_BURST.
+        """
+        self.max_rate = rate or self.DEFAULT_RATE
+        self.max_burst = burst or self.DEFAULT_BURST
+        # Current rate and bucket size, lowered by the API's rate-limit headers
+        self.rate = self.max_rate
+        self.burst = self.max_burst
+        self._paced_until = 0.0  # the rate goes back to max_rate when the API's window resets
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters = []  # heap of (priority, sequence)
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+        # Last values reported by the API's rate-limit headers
+        self.limit = None
+        self.remaining = None
+
+        # Counters
+        self.acquired = 0
+        self.waited_seconds = 0.0
+        self.throttled = 0
+
+    def _refill(self, now):
+        if self._paced_until and now >= self._paced_until:
+            self._tokens = min(self.burst, self._tokens + (self._paced_until - self._updated_at) * self.rate)
+            self._updated_at = self._paced_until
+            self.rate = self.max_rate
+            self._paced_until = 0.0
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self, priority=None):
+        """
+        Blocks until a token is available for this caller and takes it.
+
+        Args:
+            priority (int, optional): Priority of the call. Defaults to the context's priority.
+        """
+        if priority is None:
+            priority = current_priority()
+        started_at = time.monotonic()
+        with self._condition:
+            entry = (priority, next(self._sequence))
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._waiters[0] != entry:
+                        # Someone with a higher priority (or who arrived first) goes next
+                        self._condition.wait()
+                        continue
+                    if now < self._paused_until:
+                        self._condition.wait(self._paused_until - now)
+                        continue
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self.acquired += 1
+                        self.waited_seconds += now - started_at
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                    if self._paced_until:
+                        wait = min(wait, max(0.0, self._paced_until - now))
+                    self._condition.wait(wait)
+            finally:
+                if self._waiters and self._waiters[0] == entry:
+                    heapq.heappop(self._waiters)
+                else:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def pause(self, seconds):
+        """
+        Stops handing out tokens for the given number of seconds (e.g. after a 429).
+        """
+        with self._condition:
+            self.throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._condition.notify_all()
+
+    def update_from_headers(self, headers):
+        """
+        Adjusts the bucket to the X-RateLimit-* headers of an API response.
+
+        Args:
+            headers (Mapping): Response headers (case-insensitive, as returned by requests).
+        """
+        limit = self._int_header(headers, 'X-RateLimit-Limit')
+        remaining = self._int_header(headers, 'X-RateLimit-Remaining')
+        if limit is None and remaining is None:
+            return
+        reset = self._reset_seconds(headers)
+        with self._condition:
+            self._refill(time.monotonic())
+            if limit is not None:
+                self.limit = limit
+                # The bucket never holds more calls than the API allows per window
+                self.burst = max(1, min(self.max_burst, limit))
+                self._tokens = min(self._tokens, float(self.burst))
+                if reset:
+                    # Spread the calls left in the window evenly until it resets
+                    left = remaining if remaining is not None else limit
+                    if left > 0:
+                        self.rate = min(self.max_rate, left / reset)
+                        self._paced_until = time.monotonic() + reset
+                else:
+                    self.rate = self.max_rate
+                    self._paced_until = 0.0
+            if remaining is None:
+                self._condition.notify_all()
+                return
+            self.remaining = remaining
+            # Never hand out more calls than the API says are left
+            self._tokens = min(self._tokens, float(remaining))
+            if remaining <= 0:
+                wait = self.DEFAULT_EXHAUSTED_PAUSE if reset is None else reset
+                self._paused_until = max(self._paused_until, time.monotonic() + wait)
+            self._condition.notify_all()
+
+    @classmethod
+    def _reset_seconds(cls, headers):
+        # Seconds until the rate-limit window resets, or None if the header is missing
+        reset = cls._int_header(headers, 'X-RateLimit-Reset')
+        if reset is None:
+            return None
+        if reset > 1_000_000_000:
+            # An epoch timestamp rather than a number of seconds
+            return max(0, reset - time.time())
+        return max(0, reset)
+
+    @staticmethod
+    def _int_header(headers, name):
+        try:
+            return int(float(headers.get(name)))
+        except (TypeError, ValueError):
+            return None
+
+    def stats(self):
+        """
+        Returns the limiter's configuration, counters and the last reported limits.
+
+        Returns:
+            dict: rate, burst (current values), max_rate, max_burst, tokens, waiting,
+                  acquired, waited_seconds, throttled, paused_seconds, limit and remaining.
+        """
+        with self._condition:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                'rate': round(self.rate, 3),
+                'burst': self.burst,
+                'max_rate': self.max_rate,
+                'max_burst': self.max_burst,
+                'tokens': round(self._tokens, 2),
+                'waiting': len(self._waiters),
+                'acquired': self.acquired,
+                'waited_seconds': round(self.waited_seconds, 2),
+                'throttled': self.throttled,
+                'paused_seconds': round(max(0.0, self._paused_until - now), 2),
+                'limit': self.limit,
+                'remaining': self.remaining
+            }
@@ -0,0 +1,165 @@
+# src/api/response_cache.py
+import re
+import threading
+import time
+from collections import OrderedDict
+
+class ResponseCache:
+    """
+    A thread-safe, size-bounded in-memory cache for Formstack API GET responses.
+    Entries are keyed by endpoint and query parameters, expire after a TTL that
+    depends on the endpoint, and the least recently used entry is evicted when
+    the cache is full.
+
+    Cached responses are shared between callers and must be treated as read-only.
+    """
+    # Default maximum number of cached responses
+    DEFAULT_MAX_ENTRIES = 1024
+
+    # TTL in seconds for endpoints that match none of the rules below
+    DEFAULT_TTL = 120
+
+    # (endpoint pattern, TTL in seconds) pairs; the first matching pattern wins.
+    # Folder structure rarely changes, while the form list carries submission
+    # counts and last submission times that users expect to be fresh.
+    DEFAULT_TTL_RULES = [
+        (r'^folder', 600),
+        (r'^form\.json$', 60),
+        (r'^form/[^/]+\.json$', 60),
+        (r'^form/[^/]+/', 300),
+        (r'^smartlist', 300),
+    ]
+
+    def __init__(self, max_entries=None, ttl_rules=None, default_ttl=None):
+        """
+        Initializes the ResponseCache.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached responses.
+                                         Defaults to DEFAULT_MAX_ENTRIES.
+            ttl_rules (list, optional): (regex, ttl_seconds) pairs matched against the endpoint.
+                                        Defaults to DEFAULT_TTL_RULES.
+            default_ttl (float, optional): TTL for endpoints matching no rule.
+                                           Defaults to DEFAULT_TTL.
+        """
+        self.max_entries = max_entries or self.DEFAULT_MAX_ENTRIES
+        self.default_ttl = default_ttl if default_ttl is not None else self.DEFAULT_TTL
+        self.ttl_rules = [(re.compile(pattern), ttl)
+                          for pattern, ttl in (ttl_rules if ttl_rules is not None else self.DEFAULT_TTL_RULES)]
+        self._entries = OrderedDict()  # key -> (expires_at, endpoint, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(endpoint, params=None):
+        """
+        Builds the cache key for an endpoint and its query parameters.
+
+        Args:
+            endpoint (str): The API endpoint (e.g., "form.json").
+            params (dict, optional): Query parameters of the request.
+
+        Returns:
+            tuple: A hashable key that does not depend on parameter order.
+        """
+        return (endpoint, tuple(sorted((str(key), str(value)) for key, value in (params or {}).items())))
+
+    def ttl_for(self, endpoint):
+        """
+        Returns the TTL in seconds that applies to an endpoint.
+        """
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(endpoint):
+                return ttl
+        return self.default_ttl
+
+    def get(self, endpoint, params=None, record_stats=True):
+        """
+        Looks up a cached response.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (dict, optional): Query parameters of the request.
+            record_stats (bool, optional): Whether the lookup counts towards hits/misses.
+                                           Defaults to True.
+
+        Returns:
+            tuple: (True, response) on a hit, (False, None) on a miss or expired entry.
+        """
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                if record_stats:
+                    self.hits += 1
+                return True, entry[2]
+            if entry is not None:
+                # Expired entries are dropped on access
+                del self._entries[key]
+            if record_stats:
+                self.misses += 1
+            return False, None
+
+    def set(self, endpoint, params, value):
+        """
+        Stores a response, evicting the least recently used entries if the cache is full.
+        Endpoints with a TTL of 0 are never cached.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (dict): Query parameters of the request (may be None).
+            value: The parsed JSON response.
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, endpoint, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint_prefix=None):
+        """
+        Removes cached responses.
+
+        Args:
+            endpoint_prefix (str, optional): Only remove entries whose endpoint starts
+                                             with this prefix (e.g. "folder" or "form/123").
+                                             Removes everything when omitted.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with self._lock:
+            if endpoint_prefix is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key, (_, endpoint, _) in self._entries.items() if endpoint.startswith(endpoint_prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self):
+        """
+        Returns hit/miss counters and the current size of the cache.
+
+        Returns:
+            dict: hits, misses, hit_rate, evictions, size and max_entries.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'max_entries': self.max_entries
+            }
@@ -0,0 +1,91 @@
+# src/api/single_flight.py
+import threading
+
+class _Call:
+    """
+    An in-flight call whose result is shared by every caller with the same key.
+    """
+    def __init__(self, priority=None):
+        self.done = threading.Event()
+        self.priority = priority
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: while a call for a key is in flight,
+    other callers with the same key wait for it and receive its result
+    (or its exception) instead of starting their own call.
+
+    Calls can carry a priority (lower values are more urgent, as in rate_limiter).
+    A caller only joins an in-flight call that is at least as urgent as itself,
+    so an interactive call never waits behind a background call queued for a
+    rate-limit token; it starts its own call instead.
+    """
+    def __init__(self):
+        self._calls = {}  # key -> {priority: _Call}
+        self._lock = threading.Lock()
+        # Number of callers that were served by another caller's in-flight call
+        self.coalesced = 0
+
+    def do(self, key, func, priority=None, retry_on=()):
+        """
+        Runs func once for all concurrent callers with the same key.
+
+        Args:
+            key: A hashable key identifying the call.
+            func (callable): Function with no arguments performing the call.
+            priority (int, optional): Priority of this caller. Callers without a
+                                      priority join any in-flight call for the key.
+            retry_on (tuple, optional): Exception types that only concern the caller that
+                                        ran the call (e.g. its job was cancelled). Waiting
+                                        callers do not receive them; they make the call again.
+
+        Returns:
+            The result of func, shared by all callers that joined the call.
+
+        Raises:
+            Exception: Whatever func raised, re-raised in every waiting caller
+                       (except for retry_on exceptions).
+        """
+        while True:
+            with self._lock:
+                calls = self._calls.setdefault(key, {})
+                joinable = [call for call_priority, call in calls.items()
+                            if priority is None or call_priority is None or call_priority <= priority]
+                call = min(joinable, key=lambda c: -1 if c.priority is None else c.priority) if joinable else None
+                is_leader = call is None
+                if is_leader:
+                    call = calls[priority] = _Call(priority)
+                else:
+                    self.coalesced += 1
+
+            if is_leader:
+                break
+            call.done.wait()
+            if call.error is None:
+                return call.result
+            if not isinstance(call.error, retry_on):
+                raise call.error
+            # The leader's failure was its own (e.g. its job was cancelled): try again
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                calls = self._calls[key]
+                del calls[priority]
+                if not calls:
+                    del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        """
+        Returns the number of distinct calls currently in flight.
+        """
+        with self._lock:
+            return sum(len(calls) for calls in self._calls.values())
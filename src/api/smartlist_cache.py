@@ -0,0 +1,227 @@
+# src/api/smartlist_cache.py
+import threading
+import time
+from collections import OrderedDict
+
+class SmartListCache:
+    """
+    A thread-safe, in-memory cache of SmartList details (items included), keyed by
+    SmartList ID and validated against the SmartList's 'updated' value.
+
+    The SmartList endpoint returns every item in one response, and large SmartLists
+    hold tens of thousands of items. Caching the details lets callers page through
+    the items without refetching them: an entry is served while it is younger than
+    the TTL and, when the caller knows the SmartList's current 'updated' value,
+    only if it matches the cached one. Listing the SmartLists (which reports
+    'updated' for each) drops entries for SmartLists that changed.
+
+    Searches over cached details are memoized too: the lowercased label and value
+    of every item are computed once per cached details, and the most recent
+    results are kept per SmartList, so paging through a filtered SmartList does
+    not rescan every item on each page.
+
+    The cache is bounded by the total number of cached items; the least recently
+    used SmartLists are evicted first. Cached details are shared between callers
+    and must be treated as read-only.
+    """
+    # Seconds a cached SmartList is served without checking the API
+    DEFAULT_TTL = 900
+
+    # Maximum number of items held across all cached SmartLists
+    DEFAULT_MAX_ITEMS = 500000
+
+    # Number of search results remembered per cached SmartList
+    MAX_SEARCHES = 8
+
+    def __init__(self, ttl=None, max_items=None):
+        """
+        Initializes the SmartListCache.
+
+        Args:
+            ttl (float, optional): Defaults to DEFAULT_TTL.
+            max_items (int, optional): Defaults to DEFAULT_MAX_ITEMS.
+        """
+        self.ttl = ttl if ttl is not None else self.DEFAULT_TTL
+        self.max_items = max_items or self.DEFAULT_MAX_ITEMS
+        self._entries = OrderedDict()  # SmartList ID -> (expires_at, updated, details, item count)
+        self._item_count = 0
+        self._searches = {}  # SmartList ID -> (details, lowercased item texts, OrderedDict search -> items)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def items_of(details):
+        """
+        Returns the items of a SmartList details response (an empty list if it has none).
+        """
+        items = details.get('items') if isinstance(details, dict) else None
+        return items if isinstance(items, list) else []
+
+    @staticmethod
+    def filter_items(items, search):
+        """
+        Returns the items whose label or value contains search (case-insensitive),
+        without memoization.
+        """
+        search = str(search).lower()
+        return [item for item in items if isinstance(item, dict)
+                and any(search in str(item.get(key, '')).lower() for key in ('label', 'value'))]
+
+    @staticmethod
+    def _search_text(item):
+        # The NUL separator keeps a search from matching across the label and the value
+        if not isinstance(item, dict):
+            return None
+        return f"{item.get('label', '')}\x00{item.get('value', '')}".lower()
+
+    def search(self, smartlist_id, details, search):
+        """
+        Returns the items of SmartList details whose label or value contains search
+        (case-insensitive), like filter_items. When details are the ones cached for
+        the SmartList, the lowercased item texts and the result are memoized with them.
+
+        Args:
+            smartlist_id (str or int): The SmartList ID.
+            details (dict): The SmartList details (e.g. from get).
+            search (str): The text to look for.
+
+        Returns:
+            list: The matching items, shared between callers and read-only.
+        """
+        smartlist_id = str(smartlist_id)
+        search = str(search).lower()
+        items = self.items_of(details)
+        if '\x00' in search:
+            return self.filter_items(items, search)
+        with self._lock:
+            entry = self._entries.get(smartlist_id)
+            if entry is None or entry[2] is not details:
+                state = None
+            else:
+                state = self._searches.get(smartlist_id)
+                if state is not None and search in state[2]:
+                    state[2].move_to_end(search)
+                    return state[2][search]
+        if entry is None or entry[2] is not details:
+            return self.filter_items(items, search)
+
+        texts = state[1] if state is not None else [self._search_text(item) for item in items]
+        matches = [item for item, text in zip(items, texts) if text is not None and search in text]
+        with self._lock:
+            entry = self._entries.get(smartlist_id)
+            # The details may have been replaced or evicted meanwhile: only memoize for the cached ones
+            if entry is not None and entry[2] is details:
+                state = self._searches.get(smartlist_id)
+                if state is None:
+                    state = self._searches[smartlist_id] = (details, texts, OrderedDict())
+                state[2][search] = matches
+                while len(state[2]) > self.MAX_SEARCHES:
+                    state[2].popitem(last=False)
+        return matches
+
+    def get(self, smartlist_id, updated=None):
+        """
+        Looks up cached SmartList details.
+
+        Args:
+            smartlist_id (str or int): The SmartList ID.
+            updated (str, optional): The SmartList's current 'updated' value. When given,
+                                     an entry cached for another value is a miss.
+
+        Returns:
+            dict: The cached details, or None on a miss.
+        """
+        smartlist_id = str(smartlist_id)
+        with self._lock:
+            entry = self._entries.get(smartlist_id)
+            if (entry is not None and entry[0] > time.monotonic()
+                    and (updated is None or entry[1] == str(updated))):
+                self._entries.move_to_end(smartlist_id)
+                self.hits += 1
+                return entry[2]
+            if entry is not None:
+                # Expired or outdated entries are dropped on access
+                self._remove(smartlist_id)
+            self.misses += 1
+            return None
+
+    def set(self, smartlist_id, details):
+        """
+        Stores SmartList details, evicting the least recently used SmartLists if
+        the cache holds more than max_items items. SmartLists larger than max_items
+        are not cached.
+        """
+        smartlist_id = str(smartlist_id)
+        item_count = len(self.items_of(details))
+        updated = details.get('updated')
+        with self._lock:
+            self._remove(smartlist_id)
+            if item_count > self.max_items:
+                return
+            self._entries[smartlist_id] = (time.monotonic() + self.ttl, None if updated is None else str(updated),
+                                           details, item_count)
+            self._item_count += item_count
+            while self._item_count > self.max_items:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def discard_stale(self, smartlist_id, updated):
+        """
+        Drops the cached details of a SmartList if its 'updated' value changed.
+
+        Returns:
+            bool: True if an entry was dropped.
+        """
+        smartlist_id = str(smartlist_id)
+        with self._lock:
+            entry = self._entries.get(smartlist_id)
+            if entry is None or updated is None or entry[1] == str(updated):
+                return False
+            self._remove(smartlist_id)
+            return True
+
+    def invalidate(self, smartlist_id=None):
+        """
+        Removes cached SmartLists.
+
+        Args:
+            smartlist_id (str or int, optional): Only remove this SmartList.
+                                                 Removes everything when omitted.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with self._lock:
+            if smartlist_id is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._searches.clear()
+                self._item_count = 0
+                return removed
+            return 1 if self._remove(str(smartlist_id)) else 0
+
+    def _remove(self, smartlist_id):
+        self._searches.pop(smartlist_id, None)
+        entry = self._entries.pop(smartlist_id, None)
+        if entry is not None:
+            self._item_count -= entry[3]
+        return entry is not None
+
+    def stats(self):
+        """
+        Returns hit/miss counters and the current size of the cache.
+
+        Returns:
+            dict: hits, misses, evictions, smartlists, items and max_items.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'smartlists': len(self._entries),
+                'items': self._item_count,
+                'max_items': self.max_items
+            }
@@ -1,10 +1,27 @@
 # src/dashboard/app.py
-from flask import Flask, render_template, request
+from flask import Flask, Response, g, render_template, request, stream_with_context
 from src.api.formstack_client import FormstackClient
+from src.api.response_cache import ResponseCache
+from src.api.smartlist_cache import SmartListCache
 from src.analysis.form_analyzer import FormAnalyzer
 from src.analysis.folder_analyzer import FolderAnalyzer
+from src.analysis.data_context import RequestDataContext
+from src.analysis.form_query import FormQuery
+from src.analysis.search_index import FormSearchIndex
+from src.analysis.config_index import FormConfigIndex
+from src.analysis.integration_inventory import IntegrationInventory
+from src.analysis.audit_stats import AuditStats
+from src.storage.snapshot_store import SnapshotStore
+from src.storage.field_catalog import FieldCatalog
+from src.api.rate_limiter import PRIORITY_BACKGROUND, request_priority
+from src.api.job_progress import JobCancelled, JobRegistry
+from src.dashboard.summary_refresher import DashboardSummary, SummaryRefresher
 import pandas as pd
+import json
 import os
+import queue
+import threading
+import time
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -15,50 +32,309 @@ load_dotenv()
 # template_folder specifies where Flask should look for HTML templates.
 app = Flask(__name__, template_folder='templates')
 
+# A single FormstackClient is shared by every request so that its pooled
+# keep-alive connections are reused across page loads.
+app.config['FORMSTACK_POOL_SIZE'] = int(os.getenv('FORMSTACK_POOL_SIZE', FormstackClient.DEFAULT_POOL_SIZE))
+
+# Maximum number of API responses kept in the shared client's response cache
+app.config['RESPONSE_CACHE_SIZE'] = int(os.getenv('FORMSTACK_CACHE_SIZE', ResponseCache.DEFAULT_MAX_ENTRIES))
+
+# Number of concurrent API calls used when fetching per-form configuration
+app.config['CONFIG_FETCH_WORKERS'] = int(os.getenv('FORMSTACK_CONFIG_WORKERS', FormstackClient.DEFAULT_MAX_WORKERS))
+
+# Path of the local SQLite snapshot. When set, the dashboard pages read forms,
+# folders and per-form configuration from the snapshot instead of the live API.
+app.config['SNAPSHOT_PATH'] = os.getenv('FORMSTACK_SNAPSHOT_PATH')
+
+# Path of the per-form configuration index (webhooks, notifications, ...) used by
+# the advanced search filters. An empty value keeps the index in memory only.
+app.config['CONFIG_INDEX_PATH'] = os.getenv('FORMSTACK_CONFIG_INDEX_PATH', FormConfigIndex.DEFAULT_PATH)
+
+# Path of the account-wide integration inventory built from form fields.
+# An empty value keeps the inventory in memory only.
+app.config['INTEGRATION_INVENTORY_PATH'] = os.getenv('FORMSTACK_INTEGRATION_INVENTORY_PATH', IntegrationInventory.DEFAULT_PATH)
+
+# Path of the account-wide SQLite field catalog used by /api/fields.
+# An empty value keeps the catalog in memory only.
+app.config['FIELD_CATALOG_PATH'] = os.getenv('FORMSTACK_FIELD_CATALOG_PATH', FieldCatalog.DEFAULT_PATH)
+
+# Default and maximum number of SmartList items served per page by /api/smartlists/<id>/items
+SMARTLIST_ITEMS_PAGE_SIZE = 100
+SMARTLIST_ITEMS_MAX_PAGE_SIZE = 1000
+
+# Seconds between two refreshes of the running jobs' progress on /api/jobs/events
+JOB_EVENTS_HEARTBEAT = 2
+
+# The dashboard pages serve summaries computed on a background thread. They are
+# recomputed every SUMMARY_REFRESH_INTERVAL seconds, and earlier when a page is
+# served from a summary older than SUMMARY_STALE_AFTER seconds.
+app.config['SUMMARY_REFRESH_INTERVAL'] = float(os.getenv('FORMSTACK_SUMMARY_REFRESH_INTERVAL', SummaryRefresher.DEFAULT_REFRESH_INTERVAL))
+app.config['SUMMARY_STALE_AFTER'] = float(os.getenv('FORMSTACK_SUMMARY_STALE_AFTER', SummaryRefresher.DEFAULT_STALE_AFTER))
+
+# Maps each advanced search filter to the per-form configuration type it needs,
+# and the (flag, count) keys reported for that configuration type
+SEARCH_FILTER_CONFIG_TYPES = {
+    'webhook_filter': 'webhooks',
+    'confirmation_filter': 'confirmations',
+    'notification_filter': 'notifications',
+    'partial_filter': 'partial_submissions',
+    'integration_filter': 'integrations',
+}
+CONFIG_RESULT_KEYS = {
+    'webhooks': ('has_webhooks', 'webhook_count'),
+    'confirmations': ('has_confirmations', 'confirmation_count'),
+    'notifications': ('has_notifications', 'notification_count'),
+    'partial_submissions': ('has_partial_submissions', 'partial_submission_count'),
+    'integrations': ('has_integrations', 'integration_count'),
+}
+
+_client = None
+_client_lock = threading.Lock()
+_snapshot_store = None
+_summary_refresher = None
+# Typeahead index over form names, IDs and folder paths, updated with every summary refresh
+_search_index = FormSearchIndex()
+_config_index = None
+_integration_inventory = None
+_field_catalog = None
+# Progress of the long-running jobs (summary refreshes, crawls, syncs), streamed by /api/jobs/events
+_job_registry = JobRegistry()
+
+def get_client():
+    """
+    Returns the process-wide FormstackClient, creating it on first use.
+    Creation is guarded by a lock so concurrent requests never build two clients.
+
+    Raises:
+        ValueError: If FORMSTACK_API_KEY is not set (raised by FormstackClient).
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = FormstackClient(
+                    pool_size=app.config['FORMSTACK_POOL_SIZE'],
+                    max_workers=app.config['CONFIG_FETCH_WORKERS'],
+                    cache=ResponseCache(max_entries=app.config['RESPONSE_CACHE_SIZE'])
+                )
+    return _client
+
+def get_snapshot_store():
+    """
+    Returns the process-wide SnapshotStore, or None if FORMSTACK_SNAPSHOT_PATH is not set.
+    """
+    global _snapshot_store
+    if _snapshot_store is None and app.config['SNAPSHOT_PATH']:
+        with _client_lock:
+            if _snapshot_store is None:
+                _snapshot_store = SnapshotStore(app.config['SNAPSHOT_PATH'])
+    return _snapshot_store
+
+def get_data_context():
+    """
+    Returns the data context of the current request, creating it on first use.
+    Analyzers sharing it fetch each account-wide resource at most once per request.
+    The context reads from the snapshot store when one is configured, otherwise from the API.
+    """
+    if 'data_context' not in g:
+        g.data_context = RequestDataContext(get_snapshot_store() or get_client())
+    return g.data_context
+
+def build_dashboard_summary():
+    """
+    Computes the form and folder summaries served by the dashboard pages.
+    Runs on the refresher's thread, at background priority, with its own data context,
+    as a job reporting the folder hierarchy crawl's progress.
+
+    Raises:
+        JobCancelled: If the job was cancelled (the previous summary is kept).
+    """
+    with request_priority(PRIORITY_BACKGROUND), _job_registry.run("Dashboard summary refresh") as job:
+        data_context = RequestDataContext(get_snapshot_store() or get_client())
+        job.set_message("Fetching forms")
+        form_frame = FormAnalyzer(data_context).get_form_summary_frame()
+        folder_analyzer = FolderAnalyzer(data_context)
+        folder_summary = folder_analyzer.get_folder_summary_data()
+        folder_stats = folder_analyzer.get_folder_stats()
+        # Calls interrupted by a cancellation return empty results: never serve those
+        job.raise_if_cancelled()
+    form_query = FormQuery(form_frame, get_config_index())
+    # Only forms that were added, renamed or moved are re-indexed
+    _search_index.update(form_query.records, {str(folder['id']): folder['folder_path'] for folder in folder_summary})
+    # Fetch the configuration of new and changed forms in the background
+    start_config_index_crawl()
+    return DashboardSummary(form_frame, folder_summary, folder_stats, form_query, AuditStats(form_frame))
+
+def get_config_index():
+    """
+    Returns the process-wide FormConfigIndex, loading it from disk on first use.
+    """
+    global _config_index
+    if _config_index is None:
+        with _client_lock:
+            if _config_index is None:
+                _config_index = FormConfigIndex(app.config['CONFIG_INDEX_PATH'])
+    return _config_index
+
+def start_config_index_crawl(full=False):
+    """
+    Updates the configuration index on a background thread, at background priority.
+
+    Args:
+        full (bool): If True, refetch the configuration of every form instead of
+                     only new and changed forms.
+
+    Returns:
+        bool: False if a crawl is already running.
+    """
+    config_index = get_config_index()
+    if config_index.crawling:
+        return False
+
+    def crawl():
+        try:
+            with request_priority(PRIORITY_BACKGROUND), _job_registry.run("Configuration index crawl"):
+                config_index.update(RequestDataContext(get_snapshot_store() or get_client()), full=full)
+        except Exception as e:
+            print(f"Configuration index crawl failed: {e}")
+
+    threading.Thread(target=crawl, name='config-index-crawl', daemon=True).start()
+    return True
+
+def get_integration_inventory():
+    """
+    Returns the process-wide IntegrationInventory, loading it from disk on first use.
+    """
+    global _integration_inventory
+    if _integration_inventory is None:
+        with _client_lock:
+            if _integration_inventory is None:
+                _integration_inventory = IntegrationInventory(app.config['INTEGRATION_INVENTORY_PATH'])
+    return _integration_inventory
+
+def start_integration_inventory_crawl(full=False):
+    """
+    Updates the integration inventory on a background thread. The inventory is
+    built from the field catalog, so this runs a field catalog crawl, which
+    rescans the inventory when it finishes (see start_field_catalog_crawl).
+
+    Args:
+        full (bool): If True, refetch and rescan the fields of every form instead
+                     of only new and changed forms.
+
+    Returns:
+        bool: False if a crawl is already running.
+    """
+    if get_integration_inventory().crawling:
+        return False
+    return start_field_catalog_crawl(full=full)
+
+def get_field_catalog():
+    """
+    Returns the process-wide FieldCatalog, opening it on first use.
+    """
+    global _field_catalog
+    if _field_catalog is None:
+        with _client_lock:
+            if _field_catalog is None:
+                _field_catalog = FieldCatalog(app.config['FIELD_CATALOG_PATH'])
+    return _field_catalog
+
+def start_field_catalog_crawl(full=False):
+    """
+    Updates the field catalog on a background thread, at background priority,
+    then updates the integration inventory from the catalog.
+    Form fields are not part of the snapshot, so the crawl always uses the live API.
+
+    Args:
+        full (bool): If True, refetch the fields of every form instead of
+                     only new and changed forms.
+
+    Returns:
+        bool: False if a crawl is already running.
+    """
+    catalog = get_field_catalog()
+    if catalog.crawling:
+        return False
+    inventory = get_integration_inventory()
+
+    def crawl():
+        try:
+            with request_priority(PRIORITY_BACKGROUND):
+                with _job_registry.run("Field catalog crawl"):
+                    catalog.update(RequestDataContext(get_client()), full=full)
+                with _job_registry.run("Integration inventory update"):
+                    inventory.update(catalog, full=full)
+        except Exception as e:
+            print(f"Field catalog crawl failed: {e}")
+
+    threading.Thread(target=crawl, name='field-catalog-crawl', daemon=True).start()
+    return True
+
+def get_summary_refresher():
+    """
+    Returns the process-wide SummaryRefresher, creating it on first use.
+    """
+    global _summary_refresher
+    if _summary_refresher is None:
+        with _client_lock:
+            if _summary_refresher is None:
+                _summary_refresher = SummaryRefresher(
+                    build_dashboard_summary,
+                    refresh_interval=app.config['SUMMARY_REFRESH_INTERVAL'],
+                    stale_after=app.config['SUMMARY_STALE_AFTER']
+                )
+    return _summary_refresher
+
+def get_dashboard_summary():
+    """
+    Returns the latest dashboard summary without waiting for Formstack
+    (only the very first call of the process waits for the initial refresh).
+
+    Raises:
+        Exception: The error of the last refresh if no summary could be computed yet
+                   (e.g. ValueError when FORMSTACK_API_KEY is not set).
+    """
+    refresher = get_summary_refresher()
+    summary = refresher.get()
+    if summary is None:
+        raise refresher.last_error or RuntimeError("Dashboard data is still loading, please try again shortly.")
+    return summary
+
+@app.template_filter('format_age')
+def format_age(seconds):
+    """
+    Formats a data age in seconds for display (e.g. "3 min ago").
+    """
+    if seconds is None:
+        return 'unknown'
+    if seconds < 60:
+        return 'just now'
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    return f"{int(seconds // 3600)} h ago"
+
 @app.route('/')
 def index():
     """
     Renders the main dashboard page, displaying a summary of Formstack forms.
-    Fetches data from Formstack API, analyzes it, and passes it to the HTML template.
+    The dashboard totals are computed on the server; the full inventory is
+    available page by page from /api/forms instead of being embedded in the page.
     """
     forms_for_template = []
+    form_stats = {}
     error_message = None
+    data_age = None
 
     try:
-        # Initialize Formstack client and analyzer
-        client = FormstackClient()
-        analyzer = FormAnalyzer(client)
-        
-        # Get the summary data from the analyzer
-        form_summary_data = analyzer.get_form_summary_data()
+        # Serve the summary computed in the background
+        summary = get_dashboard_summary()
+        data_age = summary.age_seconds()
 
-        if form_summary_data:
-            # Create a Pandas DataFrame for easier manipulation and formatting
-            df = pd.DataFrame(form_summary_data)
-            
-            # Sort the DataFrame by creation date in descending order
-            if 'created_at' in df.columns and not df['created_at'].empty:
-                df = df.sort_values(by='created_at', ascending=False, na_position='last')
-            
-            # Keep the full dataset for dashboard stats calculation
-            full_forms_data = df.copy()
-            
-            # Limit to top 5 forms only for the home page display
-            df = df.head(5)
-            
-            # Format datetime columns to readable strings for the template
-            # .dt.strftime() works on datetime columns, .fillna() handles NaT (Not a Time) values
-            df['created_at'] = df['created_at'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('N/A')
-            df['last_submission_at'] = df['last_submission_at'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('No Submissions')
-            
-            # Format datetime columns for the full dataset as well (for stats calculation)
-            full_forms_data['created_at'] = full_forms_data['created_at'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('N/A')
-            full_forms_data['last_submission_at'] = full_forms_data['last_submission_at'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('No Submissions')
-            
-            # Convert DataFrame to a list of dictionaries, suitable for Jinja2 template iteration
-            forms_for_template = df.to_dict(orient='records')
-            # Convert full dataset to list for stats calculation
-            full_forms_for_template = full_forms_data.to_dict(orient='records')
+        if summary.form_query.size:
+            # The most recently created forms, and the totals over all forms
+            forms_for_template = summary.form_query.query({'sort': '-created_at', 'per_page': 5})['forms']
+            form_stats = summary.form_query.stats()
         else:
             error_message = "No forms found or unable to retrieve form data from Formstack."
 
@@ -72,7 +348,7 @@ def index():
         print(f"Dashboard Runtime Error: {e}") # Log the error
 
     # Render the index.html template, passing the processed data and any error message
-    return render_template('index.html', forms=forms_for_template, all_forms=full_forms_for_template if 'full_forms_for_template' in locals() else forms_for_template, error=error_message)
+    return render_template('index.html', forms=forms_for_template, form_stats=form_stats, error=error_message, data_age=data_age)
 
 @app.route('/folders')
 def folders():
@@ -83,15 +359,14 @@ def folders():
     folders_for_template = []
     folder_stats = {}
     error_message = None
+    data_age = None
 
     try:
-        # Initialize Formstack client and folder analyzer
-        client = FormstackClient()
-        folder_analyzer = FolderAnalyzer(client)
-        
-        # Get the folder summary data from the analyzer
-        folder_summary_data = folder_analyzer.get_folder_summary_data()
-        folder_stats = folder_analyzer.get_folder_stats()
+        # Serve the folder summary and stats computed in the background
+        summary = get_dashboard_summary()
+        data_age = summary.age_seconds()
+        folder_summary_data = summary.folder_summary
+        folder_stats = summary.folder_stats
 
         if folder_summary_data:
             # Create a Pandas DataFrame for easier manipulation and formatting
@@ -128,7 +403,7 @@ def folders():
         print(f"Full traceback: {traceback.format_exc()}") # Print full stack trace
 
     # Render the folders.html template, passing the processed data and any error message
-    return render_template('folders.html', folders=folders_for_template, folder_stats=folder_stats, error=error_message)
+    return render_template('folders.html', folders=folders_for_template, folder_stats=folder_stats, error=error_message, data_age=data_age)
 
 @app.route('/form-details')
 @app.route('/form-details/<form_id>')
@@ -149,20 +424,20 @@ def form_details(form_id=None):
 
     if form_id:
         try:
-            # Initialize Formstack client
-            client = FormstackClient()
+            # Get the shared Formstack client
+            client = get_client()
             
-            # Get the specific form details
-            form_data = client.get_form_details(form_id)
+            # Get the form details and all form-related data concurrently
+            bundle = client.get_form_bundle(form_id)
+            form_data = bundle['form']
             
             if form_data:
-                # Fetch additional form-related data
-                partial_submissions = client.get_form_partial_submissions(form_id)
-                confirmations = client.get_form_confirmations(form_id)
-                notifications = client.get_form_notifications(form_id)
-                webhooks = client.get_form_webhooks(form_id)
-                integrations = client.get_form_integrations(form_id)
-                fields = client.get_form_fields(form_id)
+                partial_submissions = bundle['partial_submissions']
+                confirmations = bundle['confirmations']
+                notifications = bundle['notifications']
+                webhooks = bundle['webhooks']
+                integrations = bundle['integrations']
+                fields = bundle['fields']
             else:
                 error_message = f"Form with ID {form_id} not found or could not be retrieved."
 
@@ -192,32 +467,22 @@ def advanced_search():
     """
     Renders the advanced search page where users can search forms based on
     specific configurations like webhooks, confirmations, notifications, etc.
+    The results are loaded page by page from /api/forms.
     """
-    forms_data = []
+    folder_names = []
+    total_forms = 0
     error_message = None
+    data_age = None
 
     try:
-        # Initialize Formstack client and analyzer
-        client = FormstackClient()
-        analyzer = FormAnalyzer(client)
-        
-        # Get all forms data
-        form_summary_data = analyzer.get_form_summary_data()
+        # Serve the form summary computed in the background
+        summary = get_dashboard_summary()
+        data_age = summary.age_seconds()
+        total_forms = summary.form_query.size
 
-        if form_summary_data:
-            # Create a DataFrame for easier manipulation
-            df = pd.DataFrame(form_summary_data)
-            
-            # Sort by creation date in descending order
-            if 'created_at' in df.columns and not df['created_at'].empty:
-                df = df.sort_values(by='created_at', ascending=False, na_position='last')
-            
-            # Format datetime columns
-            df['created_at'] = df['created_at'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('N/A')
-            df['last_submission_at'] = df['last_submission_at'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('No Submissions')
-            
-            # Convert to list of dictionaries
-            forms_data = df.to_dict(orient='records')
+        if total_forms:
+            # Folder names for the folder filter
+            folder_names = summary.form_query.folder_names
         else:
             error_message = "No forms were retrieved from the Formstack API."
 
@@ -228,100 +493,505 @@ def advanced_search():
         error_message = f"An unexpected error occurred: {e}"
         print(f"Advanced Search Runtime Error: {e}")
 
-    return render_template('advanced-search.html', forms=forms_data, error=error_message)
+    return render_template('advanced-search.html', folder_names=folder_names, total_forms=total_forms, error=error_message, data_age=data_age)
+
+def config_flags(counts):
+    """
+    Converts {configuration type: item count} (FormConfigIndex.counts) into the
+    has_*/*_count keys reported by the APIs. Flags are None when counts is None.
+    """
+    flags = {}
+    for config_type, (flag_key, count_key) in CONFIG_RESULT_KEYS.items():
+        count = counts.get(config_type) if counts is not None else None
+        flags[flag_key] = count > 0 if count is not None else None
+        flags[count_key] = count
+    return flags
+
+@app.route('/api/forms', methods=['GET'])
+def api_forms():
+    """
+    API endpoint returning one page of forms, sorted and filtered on the server.
+
+    Query parameters:
+        page, per_page: Pagination (per_page is capped at FormQuery.MAX_PAGE_SIZE).
+        sort: Comma-separated columns, "-" for descending (e.g. "-created_at,name").
+        search, name, id: Case-insensitive substring filters.
+        folder, folder_id: Exact folder name / folder ID.
+        status: "active" or "inactive".
+        has: Comma-separated configuration types the forms must have
+             (webhooks, confirmations, notifications, partial_submissions, integrations).
+        submissions_min, submissions_max: Submission count range.
+        created_from, created_to, last_submission_from, last_submission_to: Date ranges (YYYY-MM-DD).
+    """
+    try:
+        summary = get_dashboard_summary()
+    except Exception as e:
+        print(f"Forms API Error: {e}")
+        return {'error': str(e)}, 500
+
+    try:
+        result = summary.form_query.query(request.args)
+    except ValueError as ve:
+        # Invalid query parameters
+        return {'error': str(ve)}, 400
+
+    # Configuration flags of the forms on the page (None while a form is not indexed yet)
+    config_index = get_config_index()
+    result['forms'] = [dict(form_data, **config_flags(config_index.counts(form_data['id'])))
+                       for form_data in result['forms']]
+    result['config_index'] = {key: value for key, value in config_index.status().items()
+                              if key in ('indexed', 'crawling', 'progress')}
+    result['refreshed_at'] = summary.refreshed_at
+    result['data_age_seconds'] = round(summary.age_seconds(), 1)
+    return result, 200
+
+@app.route('/api/forms/search', methods=['GET'])
+def api_forms_search():
+    """
+    API endpoint for typeahead search over form names, IDs and folder paths.
+
+    Query parameters:
+        q: The search text. Every word must match (as a word, a word prefix or a substring).
+        limit: Maximum number of results (capped at FormSearchIndex.MAX_LIMIT).
+    """
+    try:
+        summary = get_dashboard_summary()
+    except Exception as e:
+        print(f"Form Search API Error: {e}")
+        return {'error': str(e)}, 500
+
+    try:
+        limit = int(request.args.get('limit', FormSearchIndex.DEFAULT_LIMIT))
+    except ValueError:
+        return {'error': 'limit must be an integer'}, 400
+
+    return {
+        'query': request.args.get('q', ''),
+        'results': _search_index.search(request.args.get('q', ''), limit),
+        'refreshed_at': summary.refreshed_at,
+        'data_age_seconds': round(summary.age_seconds(), 1)
+    }, 200
+
+def with_config_flags(form_data, counts, config_types):
+    """
+    Returns a copy of a form record with the has_*/*_count keys of every configuration
+    type; only config_types are filled in from counts (None if still unknown), the
+    others are False/0.
+    """
+    form_data = dict(form_data)
+    for config_type, (flag_key, count_key) in CONFIG_RESULT_KEYS.items():
+        count = (counts or {}).get(config_type) if config_type in config_types else 0
+        form_data[flag_key] = count > 0 if count is not None else None
+        form_data[count_key] = count
+    return form_data
 
 @app.route('/api/advanced-search', methods=['POST'])
 def api_advanced_search():
     """
     API endpoint for advanced search functionality.
     Returns forms with their configuration details (webhooks, confirmations, etc.)
+
+    With {"stream": true} in the body (or ?stream=1) the response is NDJSON instead:
+    one {"type": "form", "form": {...}} line per form, sent as soon as the form's
+    configuration is known, then a {"type": "summary", ...} line. Forms found in the
+    configuration index are sent immediately, the others as their API calls complete.
+    An optional "filters" object takes the /api/forms filter parameters.
     """
     try:
         # Get search parameters from request
-        search_params = request.get_json()
-        
-        # Initialize Formstack client and analyzer
-        client = FormstackClient()
-        analyzer = FormAnalyzer(client)
+        search_params = request.get_json(silent=True) or {}
+        stream = bool(search_params.get('stream')) or request.args.get('stream') in ('1', 'true')
         
-        # Get all forms data
-        form_summary_data = analyzer.get_form_summary_data()
+        # Serve the form summary computed in the background
+        summary = get_dashboard_summary()
         
-        if not form_summary_data:
+        if not summary.form_query.size:
             return {'error': 'No forms found'}, 404
-            
-        # Create DataFrame for easier manipulation
-        df = pd.DataFrame(form_summary_data)
         
-        # Format datetime columns
-        df['created_at'] = df['created_at'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('N/A')
-        df['last_submission_at'] = df['last_submission_at'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('No Submissions')
+        try:
+            # JSON-ready form records, narrowed by the optional /api/forms filters
+            forms = summary.form_query.matching_records(search_params.get('filters') or {})
+        except ValueError as ve:
+            return {'error': str(ve)}, 400
+        
+        # Only look up the configuration types that the active filters need
+        needed_config_types = [config_type for filter_name, config_type in SEARCH_FILTER_CONFIG_TYPES.items()
+                               if search_params.get(filter_name)]
         
-        # Replace NaN and NaT values with JSON-serializable defaults
-        df = df.fillna({
-            'submissions_count': 0,
-            'submissions_unread_count': 0,
-            'views_count': 0,
-            'form_url': '',
-            'folder_name': 'Uncategorized',
-            'name': 'Untitled Form'
-        })
+        # Configuration comes from the configuration index; only the needed types of
+        # the forms it does not know yet are fetched (on a bounded worker pool) and
+        # added to it. The background crawl fills in the other types.
+        config_index = get_config_index()
+        data_context = get_data_context()
+        missing_ids = [form_data['id'] for form_data in forms
+                       if needed_config_types and not config_index.is_indexed(form_data['id'], needed_config_types)]
         
-        # Convert to native Python types to avoid JSON serialization issues
-        df['submissions_count'] = df['submissions_count'].astype(int)
-        df['submissions_unread_count'] = df['submissions_unread_count'].astype(int)
-        df['views_count'] = df['views_count'].astype(int)
-        df['is_inactive'] = df['is_inactive'].astype(bool)
+        if stream:
+            return Response(
+                stream_with_context(stream_advanced_search(summary, forms, needed_config_types, missing_ids, data_context)),
+                mimetype='application/x-ndjson'
+            )
         
-        forms_with_config = []
+        if missing_ids:
+            configurations = data_context.get_forms_configuration(missing_ids, needed_config_types)
+            for form_id, configuration in zip(missing_ids, configurations):
+                config_index.set_configuration(form_id, configuration)
+            config_index.save()
         
-        # For each form, fetch configuration details if needed
-        for _, form in df.iterrows():
-            form_data = form.to_dict()
-            
-            # Check if we need configuration details
-            need_config = (search_params.get('webhook_filter') or 
-                          search_params.get('confirmation_filter') or 
-                          search_params.get('notification_filter') or 
-                          search_params.get('partial_filter'))
-            
-            if need_config:
-                form_id = form_data['id']
-                
-                # Fetch configuration details
-                webhooks = client.get_form_webhooks(form_id)
-                confirmations = client.get_form_confirmations(form_id)
-                notifications = client.get_form_notifications(form_id)
-                partial_submissions = client.get_form_partial_submissions(form_id)
-                
-                # Add configuration flags
-                form_data['has_webhooks'] = len(webhooks) > 0
-                form_data['has_confirmations'] = len(confirmations) > 0
-                form_data['has_notifications'] = len(notifications) > 0
-                form_data['has_partial_submissions'] = len(partial_submissions) > 0
-                form_data['webhook_count'] = len(webhooks)
-                form_data['confirmation_count'] = len(confirmations)
-                form_data['notification_count'] = len(notifications)
-                form_data['partial_submission_count'] = len(partial_submissions)
-            else:
-                # Set default values if not needed
-                form_data['has_webhooks'] = False
-                form_data['has_confirmations'] = False
-                form_data['has_notifications'] = False
-                form_data['has_partial_submissions'] = False
-                form_data['webhook_count'] = 0
-                form_data['confirmation_count'] = 0
-                form_data['notification_count'] = 0
-                form_data['partial_submission_count'] = 0
-            
-            forms_with_config.append(form_data)
+        # Add configuration flags
+        forms_with_config = [with_config_flags(form_data, config_index.counts(form_data['id']), needed_config_types)
+                             for form_data in forms]
         
-        return {'forms': forms_with_config}, 200
+        return {
+            'forms': forms_with_config,
+            'refreshed_at': summary.refreshed_at,
+            'data_age_seconds': round(summary.age_seconds(), 1)
+        }, 200
         
     except Exception as e:
         print(f"Advanced Search API Error: {e}")
         return {'error': str(e)}, 500
 
+def stream_advanced_search(summary, forms, config_types, missing_ids, data_context):
+    """
+    Generates the NDJSON lines of a streamed advanced search (see api_advanced_search).
+    """
+    started_at = time.monotonic()
+    config_index = get_config_index()
+    missing = set(missing_ids)
+    forms_by_id = {}
+    from_index = fetched = 0
+    
+    try:
+        # Forms whose configuration is already known
+        for form_data in forms:
+            if form_data['id'] in missing:
+                forms_by_id[str(form_data['id'])] = form_data
+                continue
+            from_index += 1
+            yield ndjson_line({'type': 'form', 'form': with_config_flags(
+                form_data, config_index.counts(form_data['id']), config_types)})
+        
+        # The other forms, in the order their configuration calls complete
+        if missing_ids:
+            for form_id, configuration in data_context.iter_forms_configuration(missing_ids, config_types):
+                config_index.set_configuration(form_id, configuration)
+                fetched += 1
+                yield ndjson_line({'type': 'form', 'form': with_config_flags(
+                    forms_by_id[str(form_id)], config_index.counts(form_id), config_types)})
+            config_index.save()
+        
+        yield ndjson_line({
+            'type': 'summary',
+            'total': len(forms),
+            'from_index': from_index,
+            'fetched': fetched,
+            'duration_seconds': round(time.monotonic() - started_at, 3),
+            'refreshed_at': summary.refreshed_at,
+            'data_age_seconds': round(summary.age_seconds(), 1)
+        })
+    except Exception as e:
+        print(f"Advanced Search Stream Error: {e}")
+        yield ndjson_line({'type': 'error', 'error': str(e)})
+
+def ndjson_line(data):
+    """
+    Serializes one NDJSON line.
+    """
+    return json.dumps(data, default=str) + '\n'
+
+@app.route('/api/cache', methods=['GET'])
+def api_cache_stats():
+    """
+    API endpoint returning hit/miss statistics of the shared response cache
+    and the state of the client's rate limiter.
+    """
+    try:
+        client = get_client()
+        return {'cache': client.cache_stats(), 'rate_limit': client.rate_limit_stats()}, 200
+    except Exception as e:
+        print(f"Cache Stats API Error: {e}")
+        return {'error': str(e)}, 500
+
+@app.route('/api/cache/invalidate', methods=['POST'])
+def api_cache_invalidate():
+    """
+    API endpoint to invalidate cached API responses.
+    Accepts an optional JSON body {"endpoint_prefix": "folder"}; without it the whole cache is cleared.
+    """
+    try:
+        params = request.get_json(silent=True) or {}
+        removed = get_client().invalidate_cache(params.get('endpoint_prefix'))
+        # Recompute the dashboard summaries from fresh data
+        get_summary_refresher().trigger()
+        return {'invalidated': removed}, 200
+    except Exception as e:
+        print(f"Cache Invalidate API Error: {e}")
+        return {'error': str(e)}, 500
+
+@app.route('/api/snapshot', methods=['GET'])
+def api_snapshot_status():
+    """
+    API endpoint returning when the snapshot store was last synced and how much it holds.
+    """
+    store = get_snapshot_store()
+    if store is None:
+        return {'error': 'Snapshot store is not configured (set FORMSTACK_SNAPSHOT_PATH)'}, 404
+    try:
+        return {'snapshot': store.sync_status()}, 200
+    except Exception as e:
+        print(f"Snapshot Status API Error: {e}")
+        return {'error': str(e)}, 500
+
+@app.route('/api/snapshot/sync', methods=['POST'])
+def api_snapshot_sync():
+    """
+    API endpoint to run an incremental sync of the snapshot store.
+    Accepts an optional JSON body {"include_config": true, "full": false}.
+    """
+    store = get_snapshot_store()
+    if store is None:
+        return {'error': 'Snapshot store is not configured (set FORMSTACK_SNAPSHOT_PATH)'}, 404
+    try:
+        params = request.get_json(silent=True) or {}
+        with _job_registry.run("Snapshot sync"):
+            summary = store.sync(
+                get_client(),
+                include_config=params.get('include_config', True),
+                full=params.get('full', False)
+            )
+        # Recompute the dashboard summaries from the synced snapshot
+        get_summary_refresher().trigger()
+        return {'sync': summary}, 200
+    except JobCancelled as e:
+        return {'error': str(e)}, 409
+    except Exception as e:
+        print(f"Snapshot Sync API Error: {e}")
+        return {'error': str(e)}, 500
+
+@app.route('/api/config-index', methods=['GET'])
+def api_config_index_status():
+    """
+    API endpoint returning how many forms the configuration index covers, how many
+    forms have each configuration type, and the state of the crawl.
+    """
+    return {'config_index': get_config_index().status()}, 200
+
+@app.route('/api/config-index/rebuild', methods=['POST'])
+def api_config_index_rebuild():
+    """
+    API endpoint starting a background crawl of the configuration index.
+    Accepts an optional JSON body {"full": true} to refetch every form, not only changed ones.
+    """
+    params = request.get_json(silent=True) or {}
+    started = start_config_index_crawl(full=bool(params.get('full', False)))
+    return {'started': started, 'config_index': get_config_index().status()}, 202
+
+@app.route('/api/integrations', methods=['GET'])
+def api_integrations():
+    """
+    API endpoint answering integration questions from the integration inventory,
+    without fetching any form fields. The first call starts the initial crawl.
+
+    Query parameters:
+        type: An integration type (e.g. "stripe"). Lists the forms with fields of
+              that type; without it, every detected type is summarized.
+        min_confidence: Only report detections with at least this confidence (0-1).
+    """
+    inventory = get_integration_inventory()
+    status = inventory.status()
+    crawl_started = False
+    if not status['scanned'] and status['last_crawl_at'] is None and not status['crawling']:
+        crawl_started = start_integration_inventory_crawl()
+
+    integration_type = request.args.get('type', '').strip().lower()
+    try:
+        min_confidence = float(request.args['min_confidence']) if request.args.get('min_confidence') else None
+    except ValueError:
+        return {'error': "min_confidence must be a number"}, 400
+
+    result = {'integration_inventory': status, 'crawl_started': crawl_started}
+    if integration_type:
+        forms = inventory.forms_with(integration_type, min_confidence)
+        result.update({'type': integration_type, 'total': len(forms), 'forms': forms})
+    else:
+        types = inventory.types()
+        if min_confidence is not None:
+            types = [entry for entry in types if entry['confidence'] is not None and entry['confidence'] >= min_confidence]
+        result['types'] = types
+    return result, 200
+
+@app.route('/api/integrations/rebuild', methods=['POST'])
+def api_integrations_rebuild():
+    """
+    API endpoint starting a background crawl of the integration inventory.
+    Accepts an optional JSON body {"full": true} to rescan every form, not only changed ones.
+    """
+    params = request.get_json(silent=True) or {}
+    started = start_integration_inventory_crawl(full=bool(params.get('full', False)))
+    return {'started': started, 'integration_inventory': get_integration_inventory().status()}, 202
+
+@app.route('/api/fields', methods=['GET'])
+def api_fields():
+    """
+    API endpoint answering field questions from the field catalog, without
+    fetching any form fields. The first call starts the initial crawl.
+
+    Query parameters:
+        type: A field type (e.g. "file").
+        name: A field name or label (e.g. "ssn"), normalized before matching.
+        match: How name is matched: exact (default), prefix or contains.
+        required: 1 or 0 to only report required or optional fields.
+        group: "forms" (default) lists the matching forms with their fields,
+               "fields" lists the matching fields.
+        limit: Maximum number of fields reported with group=fields.
+    Without type and name, every field type is summarized.
+    """
+    catalog = get_field_catalog()
+    status = catalog.status()
+    crawl_started = False
+    if not status['forms'] and status['last_crawl_at'] is None and not status['crawling']:
+        crawl_started = start_field_catalog_crawl()
+
+    field_type = request.args.get('type', '').strip().lower()
+    name = request.args.get('name', '').strip()
+    match = request.args.get('match', 'exact').strip().lower()
+    group = request.args.get('group', 'forms').strip().lower()
+    required = request.args.get('required', '').strip()
+    if match not in FieldCatalog.MATCH_MODES:
+        return {'error': f"match must be one of {', '.join(FieldCatalog.MATCH_MODES)}"}, 400
+    if group not in ('forms', 'fields'):
+        return {'error': "group must be 'forms' or 'fields'"}, 400
+    if required not in ('', '0', '1'):
+        return {'error': "required must be 0 or 1"}, 400
+    try:
+        limit = int(request.args['limit']) if request.args.get('limit') else None
+    except ValueError:
+        return {'error': "limit must be an integer"}, 400
+
+    result = {'field_catalog': status, 'crawl_started': crawl_started}
+    if field_type or name:
+        required = None if required == '' else required == '1'
+        query = {'type': field_type or None, 'name': name or None, 'match': match, 'required': required}
+        if group == 'fields':
+            fields = catalog.find_fields(field_type or None, name or None, match, required, limit)
+            result.update({'query': query, 'total': len(fields), 'fields': fields})
+        else:
+            forms = catalog.forms_with(field_type or None, name or None, match, required)
+            result.update({'query': query, 'total': len(forms), 'forms': forms})
+    else:
+        result['types'] = catalog.types()
+    return result, 200
+
+@app.route('/api/fields/rebuild', methods=['POST'])
+def api_fields_rebuild():
+    """
+    API endpoint starting a background crawl of the field catalog.
+    Accepts an optional JSON body {"full": true} to refetch every form, not only changed ones.
+    """
+    params = request.get_json(silent=True) or {}
+    started = start_field_catalog_crawl(full=bool(params.get('full', False)))
+    return {'started': started, 'field_catalog': get_field_catalog().status()}, 202
+
+@app.route('/api/smartlists/<smartlist_id>/items', methods=['GET'])
+def api_smartlist_items(smartlist_id):
+    """
+    API endpoint serving a SmartList's items one page at a time, from the
+    client's SmartList cache.
+
+    Query parameters:
+        page: 1-based page number (default 1).
+        per_page: Items per page (default SMARTLIST_ITEMS_PAGE_SIZE, at most SMARTLIST_ITEMS_MAX_PAGE_SIZE).
+        updated: The SmartList 'updated' value the caller is paging through. If the
+                 SmartList changed, the page is cut from the new version and the
+                 response's 'updated' differs from the requested one.
+        q: Only return items whose label or value contains this text.
+    """
+    try:
+        page = int(request.args.get('page', 1))
+        per_page = int(request.args.get('per_page', SMARTLIST_ITEMS_PAGE_SIZE))
+    except ValueError:
+        return {'error': "page and per_page must be integers"}, 400
+    if page < 1 or not 1 <= per_page <= SMARTLIST_ITEMS_MAX_PAGE_SIZE:
+        return {'error': f"page must be at least 1 and per_page between 1 and {SMARTLIST_ITEMS_MAX_PAGE_SIZE}"}, 400
+
+    try:
+        result = get_client().get_smartlist_items_page(
+            smartlist_id, page=page, per_page=per_page,
+            updated=request.args.get('updated') or None, search=request.args.get('q', '').strip() or None
+        )
+    except ValueError as ve:
+        return {'error': f"Configuration error: {ve}"}, 500
+    if result is None:
+        return {'error': f"SmartList with ID {smartlist_id} not found."}, 404
+    return result, 200
+
+@app.route('/api/jobs', methods=['GET'])
+def api_jobs():
+    """
+    API endpoint returning the progress of the running and recently finished jobs.
+    """
+    return {'jobs': _job_registry.jobs()}, 200
+
+@app.route('/api/jobs/events', methods=['GET'])
+def api_job_events():
+    """
+    Server-Sent Events stream of job progress. Every update is a "job" event whose
+    data is the job's snapshot (done/total, rate, request_rate, ETA, errors, status).
+    The current jobs are sent on connect, and running jobs are re-sent every
+    JOB_EVENTS_HEARTBEAT seconds so rates and ETAs stay current.
+    """
+    def generate():
+        subscriber = _job_registry.subscribe()
+        try:
+            for snapshot in _job_registry.jobs():
+                yield sse_event('job', snapshot)
+            while True:
+                try:
+                    yield sse_event('job', subscriber.get(timeout=JOB_EVENTS_HEARTBEAT))
+                except queue.Empty:
+                    running = [snapshot for snapshot in _job_registry.jobs() if snapshot['status'] == 'running']
+                    for snapshot in running:
+                        yield sse_event('job', snapshot)
+                    if not running:
+                        # Comment line that keeps the connection open
+                        yield ': keep-alive\n\n'
+        finally:
+            _job_registry.unsubscribe(subscriber)
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def api_job_cancel(job_id):
+    """
+    API endpoint cancelling a running job. The job stops before its next API call.
+    """
+    if not _job_registry.cancel(job_id):
+        return {'error': f'No running job with ID {job_id}'}, 404
+    return {'job': _job_registry.get(job_id).snapshot()}, 202
+
+def sse_event(event, data):
+    """
+    Serializes one Server-Sent Event.
+    """
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+@app.route('/api/dashboard/status', methods=['GET'])
+def api_dashboard_status():
+    """
+    API endpoint returning the age of the dashboard summaries and whether a refresh is running.
+    """
+    return {'summary': get_summary_refresher().status()}, 200
+
+@app.route('/api/dashboard/refresh', methods=['POST'])
+def api_dashboard_refresh():
+    """
+    API endpoint asking the background worker to recompute the dashboard summaries now.
+    """
+    get_summary_refresher().trigger()
+    return {'summary': get_summary_refresher().status()}, 202
+
 @app.route('/audit')
 def audit():
     """
@@ -329,6 +999,22 @@ def audit():
     """
     return render_template('audit.html')
 
+@app.route('/api/audit/stats', methods=['GET'])
+def api_audit_stats():
+    """
+    API endpoint returning the Form Audit aggregates (usage counts, activity windows,
+    health score) and insights. They are computed once per dashboard summary.
+    """
+    try:
+        summary = get_dashboard_summary()
+        result = summary.audit_stats.to_dict()
+        result['refreshed_at'] = summary.refreshed_at
+        result['data_age_seconds'] = round(summary.age_seconds(), 1)
+        return result, 200
+    except Exception as e:
+        print(f"Audit Stats API Error: {e}")
+        return {'error': str(e)}, 500
+
 @app.route('/smartlists')
 def smartlists():
     """
@@ -338,8 +1024,8 @@ def smartlists():
     error_message = None
 
     try:
-        # Initialize Formstack client
-        client = FormstackClient()
+        # Get the shared Formstack client
+        client = get_client()
         
         # Get all SmartLists
         smartlists = client.get_all_smartlists()
@@ -363,19 +1049,26 @@ def smartlists():
 def smartlist_details(smartlist_id):
     """
     Renders the SmartList details page for a specific SmartList.
+    Items are not rendered with the page: the page loads them one page at a
+    time from /api/smartlists/<id>/items.
     """
     smartlist_data = {}
+    items_total = 0
     error_message = None
 
     try:
-        # Initialize Formstack client
-        client = FormstackClient()
+        # Get the shared Formstack client
+        client = get_client()
         
         # Get SmartList details
         smartlist_data = client.get_smartlist_details(smartlist_id)
         
         if not smartlist_data:
             error_message = f"SmartList with ID {smartlist_id} not found."
+        else:
+            # The cached details are shared: leave them intact and drop the items from the page copy
+            items_total = len(SmartListCache.items_of(smartlist_data))
+            smartlist_data = {key: value for key, value in smartlist_data.items() if key != 'items'}
 
     except ValueError as ve:
         error_message = f"Configuration error: {ve}"
@@ -384,7 +1077,8 @@ def smartlist_details(smartlist_id):
         error_message = f"An unexpected error occurred: {e}"
         print(f"An unexpected error occurred in SmartList details route: {e}")
 
-    return render_template('smartlist-details.html', smartlist=smartlist_data, error=error_message)
+    return render_template('smartlist-details.html', smartlist=smartlist_data, items_total=items_total,
+                           items_page_size=SMARTLIST_ITEMS_PAGE_SIZE, error=error_message)
 
 if __name__ == '__main__':
     # Run the Flask development server
@@ -0,0 +1,175 @@
+# src/dashboard/summary_refresher.py
+import threading
+import time
+
+class DashboardSummary:
+    """
+    One computed set of dashboard summaries. Instances are never modified after
+    they are built, so a route can keep using one while a newer one is swapped in.
+    Routes must copy the form frame before changing it.
+    """
+    def __init__(self, form_frame, folder_summary, folder_stats, form_query=None, audit_stats=None, duration=None):
+        """
+        Args:
+            form_frame (pd.DataFrame): The form summary (FormAnalyzer.get_form_summary_frame).
+            folder_summary (list): The folder summary (FolderAnalyzer.get_folder_summary_data).
+            folder_stats (dict): The folder statistics (FolderAnalyzer.get_folder_stats).
+            form_query (FormQuery, optional): Query index over form_frame for paginated APIs.
+            audit_stats (AuditStats, optional): The Form Audit aggregates over form_frame.
+            duration (float, optional): Seconds it took to compute the summaries.
+        """
+        self.form_frame = form_frame
+        self.folder_summary = folder_summary
+        self.folder_stats = folder_stats
+        self.form_query = form_query
+        self.audit_stats = audit_stats
+        self.duration = duration
+        self.refreshed_at = time.time()
+
+    def age_seconds(self):
+        """
+        Returns how many seconds ago the summaries were computed.
+        """
+        return time.time() - self.refreshed_at
+
+class SummaryRefresher:
+    """
+    Keeps an in-memory DashboardSummary up to date on a background thread
+    (stale-while-revalidate).
+
+    Readers always get the latest completed summary immediately, even while a
+    new one is being computed; the new summary replaces the old one in a single
+    reference assignment once it is complete. Reading a summary older than
+    stale_after wakes the worker up for an early refresh. Only the very first
+    read, before any summary exists, waits for a refresh.
+    """
+    # Seconds between scheduled refreshes
+    DEFAULT_REFRESH_INTERVAL = 300
+
+    # Age in seconds after which a read triggers an early refresh
+    DEFAULT_STALE_AFTER = 120
+
+    def __init__(self, build_summary, refresh_interval=None, stale_after=None):
+        """
+        Initializes the SummaryRefresher. The worker thread starts on the first read
+        (or an explicit start()).
+
+        Args:
+            build_summary (callable): Function with no arguments returning a DashboardSummary.
+            refresh_interval (float, optional): Seconds between refreshes. Defaults to DEFAULT_REFRESH_INTERVAL.
+            stale_after (float, optional): Staleness threshold in seconds. Defaults to DEFAULT_STALE_AFTER.
+        """
+        self.build_summary = build_summary
+        self.refresh_interval = refresh_interval or self.DEFAULT_REFRESH_INTERVAL
+        self.stale_after = stale_after or self.DEFAULT_STALE_AFTER
+        self.last_error = None
+        self._summary = None
+        self._refreshing = False
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        # Set once the first refresh finished (successfully or not)
+        self._first_refresh_done = threading.Event()
+
+    def start(self):
+        """
+        Starts the background worker if it is not running yet.
+        """
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name='summary-refresher', daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background worker after its current refresh.
+        """
+        self._stop.set()
+        self._wake.set()
+
+    def trigger(self):
+        """
+        Asks the worker for a refresh as soon as possible, without waiting for it.
+        A trigger arriving while a refresh is running schedules one more refresh
+        right after it, since the running one may have read the data before the
+        change that caused the trigger.
+        """
+        self.start()
+        self._wake.set()
+
+    def get(self, timeout=None):
+        """
+        Returns the latest summary, triggering a refresh if it is stale.
+
+        Args:
+            timeout (float, optional): How long the first read waits for the initial
+                                       refresh. Waits indefinitely when omitted.
+
+        Returns:
+            DashboardSummary: The latest summary, or None if none could be computed yet
+                              (see last_error).
+        """
+        summary = self._summary
+        if summary is None:
+            self.trigger()
+            self._first_refresh_done.wait(timeout)
+            summary = self._summary
+            if summary is None:
+                # The initial refresh failed (or is taking longer than timeout); try again
+                self.trigger()
+        elif summary.age_seconds() > self.stale_after and not self._refreshing:
+            # A running refresh already replaces this summary
+            self.trigger()
+        return summary
+
+    def refresh(self):
+        """
+        Computes a new summary in the calling thread and swaps it in.
+        On failure the previous summary is kept and the error is recorded in last_error.
+
+        Returns:
+            bool: True if a new summary was swapped in.
+        """
+        with self._refresh_lock:
+            self._refreshing = True
+            started_at = time.monotonic()
+            try:
+                summary = self.build_summary()
+                summary.duration = time.monotonic() - started_at
+                self._summary = summary
+                self.last_error = None
+                print(f"Dashboard summaries refreshed in {summary.duration:.2f}s")
+                return True
+            except Exception as e:
+                self.last_error = e
+                print(f"Error refreshing dashboard summaries: {e}")
+                return False
+            finally:
+                self._refreshing = False
+                self._first_refresh_done.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            # Cleared before refreshing: triggers received during the refresh keep it set
+            self._wake.clear()
+            self.refresh()
+            self._wake.wait(self.refresh_interval)
+
+    def status(self):
+        """
+        Returns the age and state of the current summary.
+
+        Returns:
+            dict: refreshed_at, age_seconds, duration_seconds, refreshing and last_error.
+        """
+        summary = self._summary
+        return {
+            'refreshed_at': summary.refreshed_at if summary else None,
+            'age_seconds': round(summary.age_seconds(), 1) if summary else None,
+            'duration_seconds': round(summary.duration, 2) if summary and summary.duration is not None else None,
+            'refreshing': self._refreshing,
+            'last_error': str(self.last_error) if self.last_error else None
+        }
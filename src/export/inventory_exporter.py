@@ -0,0 +1,331 @@
+# src/export/inventory_exporter.py
+import json
+import os
+import time
+import pandas as pd
+from src.analysis.folder_analyzer import FolderAnalyzer
+from src.analysis.form_analyzer import FormAnalyzer
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is only needed for Parquet and Arrow output
+    pa = None
+    pq = None
+
+class InventoryExporter:
+    """
+    Exports the form inventory as columnar files for BI tools:
+
+    - forms: the form summary (FormAnalyzer.SUMMARY_COLUMNS)
+    - folders: the folder summary (FolderAnalyzer.get_folder_summary_data)
+    - form_configuration: per-form configuration flags and item counts
+
+    Forms are streamed from the data source and written chunk by chunk, so memory
+    use is bounded by the chunk size rather than the number of forms. Each dataset
+    is written to every requested format: Parquet and Arrow IPC (which need pyarrow)
+    and CSV. Files are written under a temporary name and moved into place when
+    complete, so a reader never sees a partial export.
+
+    The data source is a FormstackClient (live API) or a SnapshotStore (no API calls).
+    """
+    # File extension per supported format
+    FORMATS = {'parquet': '.parquet', 'arrow': '.arrow', 'csv': '.csv'}
+
+    # Forms converted and written at a time
+    DEFAULT_CHUNK_SIZE = 5000
+
+    # Date format of datetime columns in CSV output (same as the Formstack API)
+    CSV_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+    # Column types of the exported datasets
+    FORM_COLUMN_TYPES = {
+        'id': 'string', 'name': 'string', 'folder_id': 'string', 'folder_name': 'string',
+        'created_at': 'timestamp', 'last_submission_at': 'timestamp',
+        'submissions_count': 'int', 'submissions_unread_count': 'int', 'views_count': 'int',
+        'form_url': 'string', 'is_inactive': 'bool'
+    }
+    FOLDER_COLUMN_TYPES = {
+        'id': 'string', 'name': 'string', 'parent_id': 'string', 'parent_name': 'string',
+        'is_root_folder': 'bool', 'subfolder_count': 'int', 'form_count': 'int',
+        'total_form_count': 'int', 'created_at': 'timestamp', 'folder_path': 'string',
+        'depth_level': 'int', 'in_cycle': 'bool'
+    }
+
+    # Flag and count columns per configuration type (same names as the dashboard APIs)
+    CONFIG_COLUMNS = {
+        'webhooks': ('has_webhooks', 'webhook_count'),
+        'confirmations': ('has_confirmations', 'confirmation_count'),
+        'notifications': ('has_notifications', 'notification_count'),
+        'partial_submissions': ('has_partial_submissions', 'partial_submission_count'),
+        'integrations': ('has_integrations', 'integration_count'),
+    }
+    CONFIG_COLUMN_TYPES = dict(
+        {'form_id': 'string'},
+        **{column: column_type
+           for flag_column, count_column in CONFIG_COLUMNS.values()
+           for column, column_type in ((flag_column, 'bool'), (count_column, 'int'))}
+    )
+
+    def __init__(self, data_source, config_index=None, chunk_size=None):
+        """
+        Initializes the exporter.
+
+        Args:
+            data_source: A FormstackClient, or a SnapshotStore to export without touching the API.
+            config_index (FormConfigIndex, optional): Source of the configuration flags for a
+                                                      live export. Snapshot exports read the flags
+                                                      stored in the snapshot instead. Without
+                                                      either, the form_configuration dataset is skipped.
+            chunk_size (int, optional): Forms per chunk. Defaults to DEFAULT_CHUNK_SIZE.
+        """
+        self.data_source = data_source
+        self.config_index = config_index
+        self.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+
+    def _has_config_source(self):
+        return self.config_index is not None or hasattr(self.data_source, 'get_config_counts')
+
+    def export(self, output_dir, formats=('parquet',)):
+        """
+        Writes the forms, folders and form_configuration datasets to output_dir, plus
+        a manifest.json describing the export.
+
+        Args:
+            output_dir (str): Directory to write to (created if needed).
+            formats (iterable, optional): Any of FORMATS. Defaults to ('parquet',).
+
+        Returns:
+            dict: The manifest: generated_at, source, formats, chunk_size, duration_seconds
+                  and per dataset the row count and written files.
+
+        Raises:
+            ValueError: If a format is unknown.
+            ImportError: If Parquet or Arrow output is requested and pyarrow is not installed.
+        """
+        formats = list(dict.fromkeys(formats))
+        unknown = [output_format for output_format in formats if output_format not in self.FORMATS]
+        if unknown or not formats:
+            raise ValueError(f"Unknown export format(s): {', '.join(unknown) or 'none given'}. "
+                             f"Valid formats: {', '.join(self.FORMATS)}")
+        if pa is None and any(output_format != 'csv' for output_format in formats):
+            raise ImportError(
+                "pyarrow is required for Parquet and Arrow export. "
+                "Install it with 'pip install pyarrow', or export CSV only."
+            )
+
+        os.makedirs(output_dir, exist_ok=True)
+        started_at = time.monotonic()
+        manifest = {
+            'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'source': getattr(self.data_source, 'path', None) or 'api',
+            'formats': formats,
+            'chunk_size': self.chunk_size,
+            'datasets': {}
+        }
+
+        # Forms and their configuration flags are written chunk by chunk in one pass
+        form_writers = []
+        config_writers = []
+        # Folder of every form, kept to count forms per folder afterwards
+        form_folders = []
+        config_indexed = 0
+        try:
+            form_writers = self._open_writers(output_dir, 'forms', formats, self.FORM_COLUMN_TYPES)
+            if self._has_config_source():
+                config_writers = self._open_writers(output_dir, 'form_configuration', formats,
+                                                    self.CONFIG_COLUMN_TYPES)
+            for frame in FormAnalyzer(self.data_source).iter_form_summary_frames(self.chunk_size):
+                for writer in form_writers:
+                    writer.write(frame)
+                form_folders.extend(frame['folder_id'].tolist())
+                if config_writers:
+                    config_frame = self._config_frame(frame['id'].astype(str).tolist())
+                    count_columns = [count_column for _, count_column in self.CONFIG_COLUMNS.values()]
+                    config_indexed += int(config_frame[count_columns].notna().any(axis=1).sum())
+                    for writer in config_writers:
+                        writer.write(config_frame)
+                print(f"Exported {len(form_folders)} forms...")
+        except Exception:
+            for writer in form_writers + config_writers:
+                writer.abort()
+            raise
+        manifest['datasets']['forms'] = self._close_writers(form_writers)
+        if config_writers:
+            manifest['datasets']['form_configuration'] = self._close_writers(config_writers)
+            manifest['datasets']['form_configuration']['indexed_forms'] = config_indexed
+        else:
+            print("No configuration source available; skipping form_configuration.")
+
+        # Folders are few; they are summarized in one frame
+        folder_frame = self._folder_frame(form_folders)
+        folder_writers = self._open_writers(output_dir, 'folders', formats, self.FOLDER_COLUMN_TYPES)
+        try:
+            for writer in folder_writers:
+                writer.write(folder_frame)
+        except Exception:
+            for writer in folder_writers:
+                writer.abort()
+            raise
+        manifest['datasets']['folders'] = self._close_writers(folder_writers)
+
+        manifest['duration_seconds'] = round(time.monotonic() - started_at, 2)
+        manifest_path = os.path.join(output_dir, 'manifest.json')
+        with open(f"{manifest_path}.tmp", 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+        print(f"Exported {manifest['datasets']['forms']['rows']} forms and "
+              f"{manifest['datasets']['folders']['rows']} folders to {output_dir} "
+              f"in {manifest['duration_seconds']:.2f}s")
+        return manifest
+
+    def _open_writers(self, output_dir, dataset, formats, column_types):
+        """
+        Opens one writer per format. If one cannot be opened, the writers already
+        opened are aborted (their temporary files removed) before the error is raised.
+        """
+        writers = []
+        try:
+            for output_format in formats:
+                writers.append(_DatasetWriter(os.path.join(output_dir, dataset + self.FORMATS[output_format]),
+                                              output_format, column_types, self.CSV_DATE_FORMAT))
+        except Exception:
+            for writer in writers:
+                writer.abort()
+            raise
+        return writers
+
+    @staticmethod
+    def _close_writers(writers):
+        files = [writer.close() for writer in writers]
+        return {'rows': writers[0].rows if writers else 0, 'files': files}
+
+    def _config_frame(self, form_ids):
+        """
+        Returns the configuration flags of a chunk of forms. Flags and counts are
+        missing (null) for forms whose configuration is not known yet.
+        """
+        if hasattr(self.data_source, 'get_config_counts'):
+            known = self.data_source.get_config_counts(form_ids, self.CONFIG_COLUMNS)
+            counts = [known.get(form_id) for form_id in form_ids]
+        else:
+            counts = [self.config_index.counts(form_id) for form_id in form_ids]
+
+        columns = {'form_id': form_ids}
+        for config_type, (flag_column, count_column) in self.CONFIG_COLUMNS.items():
+            values = pd.array([form_counts.get(config_type) if form_counts else None for form_counts in counts],
+                              dtype='Int64')
+            columns[flag_column] = values > 0
+            columns[count_column] = values
+        return pd.DataFrame(columns, columns=list(self.CONFIG_COLUMN_TYPES))
+
+    def _folder_frame(self, form_folders):
+        """
+        Returns the folder summary. Forms are passed as their folder IDs only, so the
+        analyzer does not have to hold (or refetch) every form payload.
+        """
+        source = _FormFolderSource(self.data_source, form_folders)
+        folder_summary = FolderAnalyzer(source).get_folder_summary_data()
+        return pd.DataFrame.from_records(folder_summary, columns=list(self.FOLDER_COLUMN_TYPES))
+
+class _FormFolderSource:
+    """
+    Data source for FolderAnalyzer that serves already-streamed forms as
+    {'folder': folder_id} records and delegates everything else.
+    """
+    def __init__(self, data_source, form_folders):
+        self._data_source = data_source
+        self._form_folders = form_folders
+
+    def __getattr__(self, name):
+        return getattr(self._data_source, name)
+
+    def get_all_forms(self):
+        return [{'folder': folder_id} for folder_id in self._form_folders]
+
+class _DatasetWriter:
+    """
+    Appends frames to one output file in one format and moves it into place on close().
+    """
+    def __init__(self, path, output_format, column_types, csv_date_format):
+        self.path = path
+        self.output_format = output_format
+        self.column_types = column_types
+        self.csv_date_format = csv_date_format
+        self.rows = 0
+        self._temporary_path = f"{path}.tmp"
+        self._schema = self._arrow_schema(column_types) if output_format != 'csv' else None
+        if output_format == 'parquet':
+            self._writer = pq.ParquetWriter(self._temporary_path, self._schema, compression='snappy')
+        elif output_format == 'arrow':
+            self._writer = pa.ipc.new_file(self._temporary_path, self._schema)
+        else:
+            self._writer = open(self._temporary_path, 'w', newline='', encoding='utf-8')
+            # Header only; rows are appended per chunk
+            pd.DataFrame(columns=list(column_types)).to_csv(self._writer, index=False)
+
+    @staticmethod
+    def _arrow_schema(column_types):
+        arrow_types = {
+            'string': pa.string(),
+            'int': pa.int64(),
+            'bool': pa.bool_(),
+            'timestamp': pa.timestamp('us')
+        }
+        return pa.schema([(column, arrow_types[column_type]) for column, column_type in column_types.items()])
+
+    def _normalize(self, frame):
+        # Consistent column types across chunks (e.g. an all-null chunk column)
+        frame = frame.reindex(columns=list(self.column_types))
+        for column, column_type in self.column_types.items():
+            if column_type == 'string':
+                frame[column] = frame[column].astype(object).map(lambda value: None if pd.isna(value) else str(value))
+            elif column_type == 'timestamp':
+                # Floored to microseconds (the Arrow unit) without astype('datetime64[us]'),
+                # which pandas 1.x does not support
+                frame[column] = pd.to_datetime(frame[column], errors='coerce').dt.floor('us')
+        return frame
+
+    def write(self, frame):
+        frame = self._normalize(frame)
+        if self.output_format == 'csv':
+            frame.to_csv(self._writer, header=False, index=False, date_format=self.csv_date_format)
+        else:
+            self._writer.write_table(pa.Table.from_pandas(frame, schema=self._schema, preserve_index=False))
+        self.rows += len(frame)
+
+    def close(self):
+        """
+        Finishes the file and moves it into place.
+
+        Returns:
+            str: The path of the written file.
+        """
+        self._writer.close()
+        os.replace(self._temporary_path, self.path)
+        return self.path
+
+    def abort(self):
+        """
+        Closes and deletes the partial file.
+        """
+        try:
+            self._writer.close()
+        except Exception:
+            pass
+        if os.path.exists(self._temporary_path):
+            os.remove(self._temporary_path)
+
+
+# Example Usage: export the inventory from the local snapshot
+if __name__ == "__main__":
+    import sys
+    from src.storage.snapshot_store import SnapshotStore
+    try:
+        store = SnapshotStore(sys.argv[1] if len(sys.argv) > 1 else None)
+        exporter = InventoryExporter(store)
+        manifest = exporter.export(sys.argv[2] if len(sys.argv) > 2 else 'inventory_export', formats=['csv'])
+        for name, dataset in manifest['datasets'].items():
+            print(f"  {name}: {dataset['rows']} rows -> {', '.join(dataset['files'])}")
+    except Exception as e:
+        print(f"An error occurred during export: {e}")
@@ -0,0 +1,471 @@
+# src/storage/field_catalog.py
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from dotenv import load_dotenv
+from src.api.job_progress import JobCancelled, current_job
+
+# Load environment variables from .env file.
+# This ensures that FORMSTACK_FIELD_CATALOG_PATH is available for the default catalog location.
+load_dotenv()
+
+class FieldCatalog:
+    """
+    An account-wide, on-disk SQLite catalog of form fields: one row per field with
+    its form, type, name, label, required flag and options.
+
+    Fields are indexed by type and by normalized name and label, so questions like
+    "which forms collect SSNs" or "which forms have file upload fields" are answered
+    from the catalog instead of one field.json call per form.
+
+    The catalog is built by crawling the fields of every form and refreshed
+    incrementally: only forms that are new or whose 'updated' value changed are
+    refetched, and forms that no longer exist are dropped.
+    """
+    # Default location of the catalog database
+    DEFAULT_PATH = os.getenv("FORMSTACK_FIELD_CATALOG_PATH", "formstack_field_catalog.db")
+
+    # Number of forms whose fields are fetched between two commits of the catalog
+    CRAWL_BATCH_SIZE = 100
+
+    # Maximum number of IDs bound in a single IN (...) query
+    QUERY_CHUNK_SIZE = 500
+
+    # Ways a name can be matched by find_fields / forms_with
+    MATCH_MODES = ('exact', 'prefix', 'contains')
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS catalog_forms (
+            form_id TEXT PRIMARY KEY,
+            name TEXT,
+            updated TEXT,
+            field_count INTEGER NOT NULL,
+            scanned_at REAL NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS fields (
+            form_id TEXT NOT NULL,
+            field_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            type TEXT,
+            name TEXT,
+            label TEXT,
+            normalized_name TEXT,
+            normalized_label TEXT,
+            required INTEGER NOT NULL DEFAULT 0,
+            options TEXT,
+            PRIMARY KEY (form_id, field_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_fields_type ON fields(type, form_id);
+        CREATE INDEX IF NOT EXISTS idx_fields_normalized_name ON fields(normalized_name, form_id);
+        CREATE INDEX IF NOT EXISTS idx_fields_normalized_label ON fields(normalized_label, form_id);
+
+        CREATE TABLE IF NOT EXISTS catalog_state (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, path=None):
+        """
+        Opens (and if needed creates) the catalog database.
+
+        Args:
+            path (str, optional): Path of the SQLite file. Defaults to DEFAULT_PATH.
+                                  Pass False (or '') to keep the catalog in memory only.
+        """
+        self.path = self.DEFAULT_PATH if path is None else path
+        # One connection shared between threads, serialized by a lock
+        self._conn = sqlite3.connect(self.path or ":memory:", check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        with self._lock:
+            if self.path:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(self.SCHEMA)
+            self._conn.commit()
+
+        self.crawling = False
+        self.progress = {'done': 0, 'total': 0}
+        self.last_error = None
+        self._crawl_lock = threading.Lock()
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def normalize_name(value):
+        """
+        Normalizes a field name or label for lookups: lowercased, with every run of
+        characters other than letters and digits replaced by a single underscore
+        (e.g. "Social Security #" -> "social_security").
+
+        Returns:
+            str: The normalized name, or None if value is empty.
+        """
+        if value is None:
+            return None
+        normalized = re.sub(r'[^a-z0-9]+', '_', str(value).lower()).strip('_')
+        return normalized or None
+
+    @staticmethod
+    def _type_or_none(value):
+        return None if value is None else str(value).lower()
+
+    @staticmethod
+    def _flag(value):
+        # The API reports required as "1"/"0", 1/0 or a boolean
+        return 1 if str(value).strip().lower() in ('1', 'true', 'yes') else 0
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def set_fields(self, form_id, fields, name=None, updated=None):
+        """
+        Stores one form's fields, replacing earlier ones.
+
+        Args:
+            form_id (str or int): The form ID.
+            fields (list): The form's fields, as returned by FormstackClient.get_form_fields.
+            name (str, optional): The form name, reported by queries.
+            updated (str, optional): The form's 'updated' value when the fields were fetched.
+        """
+        self.set_many_fields([{'id': form_id, 'name': name, 'updated': updated}], [fields])
+
+    def set_many_fields(self, forms, fields_per_form):
+        """
+        Stores the fields of many forms in one transaction, replacing earlier ones.
+
+        Args:
+            forms (list): Form dictionaries with 'id' and optionally 'name' and 'updated'.
+            fields_per_form (list): The field list of each form, in the same order.
+        """
+        scanned_at = time.time()
+        form_rows = []
+        field_rows = []
+        for form, fields in zip(forms, fields_per_form):
+            form_id = str(form['id'])
+            count = 0
+            for position, field in enumerate(fields or []):
+                if not isinstance(field, dict) or field.get('id') is None:
+                    continue
+                options = field.get('options')
+                field_rows.append((
+                    form_id, str(field['id']), position, self._type_or_none(field.get('type')),
+                    field.get('name'), field.get('label'),
+                    self.normalize_name(field.get('name')), self.normalize_name(field.get('label')),
+                    self._flag(field.get('required')), json.dumps(options) if options else None
+                ))
+                count += 1
+            updated = form.get('updated')
+            form_rows.append((form_id, form.get('name'), None if updated is None else str(updated), count, scanned_at))
+
+        with self._lock:
+            self._conn.executemany("DELETE FROM fields WHERE form_id = ?", [(row[0],) for row in form_rows])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fields (form_id, field_id, position, type, name, label, "
+                "normalized_name, normalized_label, required, options) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                field_rows
+            )
+            self._conn.executemany(
+                "INSERT INTO catalog_forms (form_id, name, updated, field_count, scanned_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(form_id) DO UPDATE SET name = excluded.name, updated = excluded.updated, "
+                "field_count = excluded.field_count, scanned_at = excluded.scanned_at",
+                form_rows
+            )
+            self._conn.commit()
+
+    def remove(self, form_ids):
+        """
+        Drops forms and their fields from the catalog.
+
+        Args:
+            form_ids (iterable): The IDs of the forms to drop.
+        """
+        rows = [(str(form_id),) for form_id in form_ids]
+        with self._lock:
+            self._conn.executemany("DELETE FROM fields WHERE form_id = ?", rows)
+            self._conn.executemany("DELETE FROM catalog_forms WHERE form_id = ?", rows)
+            self._conn.commit()
+
+    def update(self, data_source, forms=None, full=False):
+        """
+        Fetches the fields of new and changed forms and drops removed forms.
+        Only one crawl runs at a time; a call made while another crawl is running
+        returns None immediately. Progress is reported to the current job
+        (job_progress.current_job), and cancelling the job stops the crawl after
+        committing the forms scanned so far.
+
+        Args:
+            data_source: A FormstackClient or RequestDataContext (anything with
+                         get_all_forms and get_forms_fields).
+            forms (list, optional): The current forms. Fetched from data_source when omitted.
+            full (bool): If True, refetch the fields of every form.
+
+        Returns:
+            dict: Number of forms 'scanned', 'failed' (left for the next crawl), 'removed'
+                  and 'unchanged', or None if
+                  another crawl is running.
+        """
+        if not self._crawl_lock.acquire(blocking=False):
+            return None
+        self.crawling = True
+        try:
+            if forms is None:
+                forms = data_source.get_all_forms()
+            current = {str(form['id']): form for form in forms if form.get('id') is not None}
+
+            stored = {row['form_id']: row['updated']
+                      for row in self._query("SELECT form_id, updated FROM catalog_forms")}
+            removed_ids = [form_id for form_id in stored if form_id not in current]
+            self.remove(removed_ids)
+            to_scan = [form_id for form_id, form in current.items()
+                       if full or form_id not in stored
+                       or stored[form_id] != (None if form.get('updated') is None else str(form['updated']))]
+
+            job = current_job()
+            if job is not None:
+                job.set_total(len(to_scan))
+            self.progress = {'done': 0, 'total': len(to_scan)}
+            failed = 0
+            for start in range(0, len(to_scan), self.CRAWL_BATCH_SIZE):
+                batch = to_scan[start:start + self.CRAWL_BATCH_SIZE]
+                fields_per_form = data_source.get_forms_fields(batch)
+                if job is not None:
+                    # Calls interrupted by a cancellation return empty lists: do not record them
+                    job.raise_if_cancelled()
+                # Forms whose fields could not be fetched (None) are left for the next crawl
+                fetched = [(current[form_id], fields) for form_id, fields in zip(batch, fields_per_form)
+                           if fields is not None]
+                failed += len(batch) - len(fetched)
+                self.set_many_fields([form for form, _ in fetched], [fields for _, fields in fetched])
+                self.progress = {'done': self.progress['done'] + len(batch), 'total': len(to_scan)}
+                if job is not None:
+                    job.advance(len(batch))
+
+            summary = {'scanned': len(to_scan) - failed, 'failed': failed, 'removed': len(removed_ids),
+                       'unchanged': len(current) - len(to_scan)}
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT INTO catalog_state (key, value) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                    [('last_crawl_at', str(time.time())), ('last_crawl_summary', json.dumps(summary))]
+                )
+                self._conn.commit()
+            self.last_error = None
+            print(f"Field catalog updated: {summary['scanned']} scanned, {summary['failed']} failed, "
+                  f"{summary['removed']} removed, {summary['unchanged']} unchanged")
+            return summary
+        except JobCancelled as e:
+            self.last_error = e
+            print(f"Field catalog crawl cancelled after {self.progress['done']} forms")
+            return None
+        except Exception as e:
+            self.last_error = e
+            print(f"Error updating field catalog: {e}")
+            return None
+        finally:
+            self.crawling = False
+            self._crawl_lock.release()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _field_conditions(self, field_type=None, name=None, match='exact', required=None):
+        """
+        Builds the WHERE clause shared by find_fields and forms_with.
+
+        A name matches a field's normalized name or its normalized label. Exact and
+        prefix matches use the name and label indexes; 'contains' scans the catalog.
+
+        Raises:
+            ValueError: If match is not one of MATCH_MODES.
+        """
+        if match not in self.MATCH_MODES:
+            raise ValueError(f"match must be one of {', '.join(self.MATCH_MODES)}")
+        conditions = []
+        params = []
+        if field_type:
+            conditions.append("f.type = ?")
+            params.append(str(field_type).lower())
+        if name:
+            normalized = self.normalize_name(name) or ''
+            if match == 'exact':
+                conditions.append("(f.normalized_name = ? OR f.normalized_label = ?)")
+                params += [normalized, normalized]
+            elif match == 'prefix':
+                # Normalized names only hold [a-z0-9_], so the range covers every name starting with the prefix
+                upper = normalized + '\uffff'
+                conditions.append("((f.normalized_name >= ? AND f.normalized_name < ?) "
+                                  "OR (f.normalized_label >= ? AND f.normalized_label < ?))")
+                params += [normalized, upper, normalized, upper]
+            else:
+                conditions.append("(instr(f.normalized_name, ?) > 0 OR instr(f.normalized_label, ?) > 0)")
+                params += [normalized, normalized]
+        if required is not None:
+            conditions.append("f.required = ?")
+            params.append(1 if required else 0)
+        return (" WHERE " + " AND ".join(conditions)) if conditions else "", params
+
+    @staticmethod
+    def _field_from_row(row):
+        return {
+            'field_id': row['field_id'],
+            'type': row['type'],
+            'name': row['name'],
+            'label': row['label'],
+            'required': bool(row['required']),
+            'options': json.loads(row['options']) if row['options'] else []
+        }
+
+    def find_fields(self, field_type=None, name=None, match='exact', required=None, limit=None):
+        """
+        Looks up fields across every form.
+
+        Args:
+            field_type (str, optional): A field type (e.g. "file", "email").
+            name (str, optional): A field name or label, normalized before matching
+                                  (e.g. "SSN" or "social security number").
+            match (str, optional): How name is matched: 'exact', 'prefix' or 'contains'.
+            required (bool, optional): Only return required (True) or optional (False) fields.
+            limit (int, optional): Maximum number of fields returned.
+
+        Returns:
+            list: Field dictionaries (form_id, form_name, field_id, type, name, label,
+                  required, options), ordered by form and field position.
+
+        Raises:
+            ValueError: If match is not one of MATCH_MODES.
+        """
+        where, params = self._field_conditions(field_type, name, match, required)
+        sql = ("SELECT f.*, c.name AS form_name FROM fields f LEFT JOIN catalog_forms c ON c.form_id = f.form_id"
+               f"{where} ORDER BY f.form_id, f.position")
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        fields = []
+        for row in self._query(sql, params):
+            field = self._field_from_row(row)
+            field.update({'form_id': row['form_id'], 'form_name': row['form_name']})
+            fields.append(field)
+        return fields
+
+    def forms_with(self, field_type=None, name=None, match='exact', required=None):
+        """
+        Returns the forms having at least one matching field (same arguments as find_fields).
+
+        Returns:
+            list: Dictionaries with 'form_id', 'form_name' and 'fields' (the matching
+                  fields), sorted by form name.
+
+        Raises:
+            ValueError: If match is not one of MATCH_MODES.
+        """
+        forms = {}
+        for field in self.find_fields(field_type, name, match, required):
+            form = forms.setdefault(field['form_id'], {'form_id': field['form_id'],
+                                                       'form_name': field['form_name'], 'fields': []})
+            form['fields'].append({key: value for key, value in field.items() if key not in ('form_id', 'form_name')})
+        return sorted(forms.values(), key=lambda form: (str(form['form_name'] or '').lower(), form['form_id']))
+
+    def get_all_forms(self):
+        """
+        Returns the catalogued forms, so the catalog can be the data source of
+        IntegrationInventory.update instead of a second crawl of every form's fields.
+
+        Returns:
+            list: Dictionaries with 'id', 'name' and 'updated' (as of the form's last scan).
+        """
+        return [{'id': row['form_id'], 'name': row['name'], 'updated': row['updated']}
+                for row in self._query("SELECT form_id, name, updated FROM catalog_forms ORDER BY form_id")]
+
+    def get_form_fields(self, form_id):
+        """
+        Returns the catalogued fields of one form (same keys as find_fields),
+        or None if the form has not been scanned.
+        """
+        form_id = str(form_id)
+        if not self._query("SELECT 1 FROM catalog_forms WHERE form_id = ?", (form_id,)):
+            return None
+        return [self._field_from_row(row)
+                for row in self._query("SELECT * FROM fields WHERE form_id = ? ORDER BY position", (form_id,))]
+
+    def get_forms_fields(self, form_ids):
+        """
+        Returns the catalogued fields of many forms, in the same order as form_ids
+        (None for forms that have not been scanned).
+        """
+        form_ids = [str(form_id) for form_id in form_ids]
+        scanned = set()
+        fields_by_form = {}
+        for start in range(0, len(form_ids), self.QUERY_CHUNK_SIZE):
+            chunk = form_ids[start:start + self.QUERY_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            scanned.update(row['form_id'] for row in self._query(
+                f"SELECT form_id FROM catalog_forms WHERE form_id IN ({placeholders})", chunk))
+            for row in self._query(f"SELECT * FROM fields WHERE form_id IN ({placeholders}) "
+                                   "ORDER BY form_id, position", chunk):
+                fields_by_form.setdefault(row['form_id'], []).append(self._field_from_row(row))
+        return [fields_by_form.get(form_id, []) if form_id in scanned else None for form_id in form_ids]
+
+    def types(self):
+        """
+        Returns the field types in the catalog, most widely used first.
+
+        Returns:
+            list: Dictionaries with 'type', 'forms' (number of forms) and 'fields' (number of fields).
+        """
+        return [dict(row) for row in self._query(
+            "SELECT type, COUNT(DISTINCT form_id) AS forms, COUNT(*) AS fields FROM fields "
+            "GROUP BY type ORDER BY forms DESC, type")]
+
+    def status(self):
+        """
+        Returns the catalog size and crawl state.
+
+        Returns:
+            dict: forms (scanned forms), fields, crawling, progress, last_crawl_at,
+                  last_crawl_summary, last_error and path.
+        """
+        state = {row['key']: row['value'] for row in self._query("SELECT key, value FROM catalog_state")}
+        return {
+            'forms': self._query("SELECT COUNT(*) AS n FROM catalog_forms")[0]['n'],
+            'fields': self._query("SELECT COUNT(*) AS n FROM fields")[0]['n'],
+            'crawling': self.crawling,
+            'progress': dict(self.progress),
+            'last_crawl_at': float(state['last_crawl_at']) if 'last_crawl_at' in state else None,
+            'last_crawl_summary': json.loads(state['last_crawl_summary']) if 'last_crawl_summary' in state else None,
+            'last_error': str(self.last_error) if self.last_error else None,
+            'path': self.path or None
+        }
+
+
+# Example Usage: build the catalog from the command line
+if __name__ == "__main__":
+    import sys
+    from src.api.formstack_client import FormstackClient
+    try:
+        catalog = FieldCatalog(sys.argv[1] if len(sys.argv) > 1 else None)
+        catalog.update(FormstackClient())
+        print(catalog.status())
+        for entry in catalog.types():
+            print(f"  {entry['type']}: {entry['fields']} fields in {entry['forms']} forms")
+        file_forms = catalog.forms_with(field_type='file')
+        print(f"Forms with file upload fields: {len(file_forms)}")
+    except ValueError as ve:
+        print(f"Configuration error while building the field catalog: {ve}")
+    except Exception as e:
+        print(f"An unexpected error occurred while building the field catalog: {e}")
@@ -0,0 +1,518 @@
+# src/storage/snapshot_store.py
+import json
+import os
+import sqlite3
+import threading
+import time
+from dotenv import load_dotenv
+from src.api.job_progress import current_job
+from src.api.rate_limiter import PRIORITY_BACKGROUND, request_priority
+
+# Load environment variables from .env file.
+# This ensures that FORMSTACK_SNAPSHOT_PATH is available for the default store location.
+load_dotenv()
+
+class SnapshotStore:
+    """
+    A local, on-disk SQLite snapshot of the Formstack account: forms, folders,
+    SmartLists and per-form configuration.
+
+    The store is populated by the existing FormstackClient methods and supports
+    incremental sync: per-form configuration is only refetched for forms whose
+    'updated' or 'last_submission_time' changed since that configuration was
+    stored. Each configuration row records the form state it was fetched at, in
+    the same transaction as the configuration itself, so configuration that
+    failed to fetch (or a sync that was cancelled) is fetched again next time.
+
+    It exposes the same read methods the analyzers use on a client
+    (get_all_forms, iter_forms, get_all_folders, get_complete_folder_hierarchy,
+    get_all_smartlists, get_forms_configuration), so FormAnalyzer and
+    FolderAnalyzer can read from it instead of the live API.
+    """
+    # Default location of the snapshot database
+    DEFAULT_PATH = os.getenv("FORMSTACK_SNAPSHOT_PATH", "formstack_snapshot.db")
+
+    # Maximum number of IDs bound in a single IN (...) query
+    QUERY_CHUNK_SIZE = 500
+
+    # Number of forms whose configuration is fetched and committed together during a sync
+    CONFIG_BATCH_SIZE = 100
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS forms (
+            id TEXT PRIMARY KEY,
+            folder TEXT,
+            name TEXT,
+            created TEXT,
+            updated TEXT,
+            last_submission_time TEXT,
+            payload TEXT NOT NULL,
+            synced_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_forms_folder ON forms(folder);
+        CREATE INDEX IF NOT EXISTS idx_forms_updated ON forms(updated);
+        CREATE INDEX IF NOT EXISTS idx_forms_last_submission_time ON forms(last_submission_time);
+
+        CREATE TABLE IF NOT EXISTS folders (
+            id TEXT PRIMARY KEY,
+            parent TEXT,
+            name TEXT,
+            is_top_level INTEGER NOT NULL DEFAULT 0,
+            payload TEXT NOT NULL,
+            synced_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_folders_parent ON folders(parent);
+
+        CREATE TABLE IF NOT EXISTS smartlists (
+            id TEXT PRIMARY KEY,
+            name TEXT,
+            updated TEXT,
+            payload TEXT NOT NULL,
+            synced_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_smartlists_updated ON smartlists(updated);
+
+        CREATE TABLE IF NOT EXISTS form_configs (
+            form_id TEXT NOT NULL,
+            config_type TEXT NOT NULL,
+            item_count INTEGER NOT NULL,
+            payload TEXT NOT NULL,
+            synced_at REAL NOT NULL,
+            form_signature TEXT,
+            PRIMARY KEY (form_id, config_type)
+        );
+        CREATE INDEX IF NOT EXISTS idx_form_configs_type ON form_configs(config_type, item_count);
+
+        CREATE TABLE IF NOT EXISTS sync_state (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, path=None):
+        """
+        Opens (and if needed creates) the snapshot database.
+
+        Args:
+            path (str, optional): Path of the SQLite file. Defaults to DEFAULT_PATH.
+        """
+        self.path = path or self.DEFAULT_PATH
+        # One connection shared between threads, serialized by a lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(self.SCHEMA)
+            # Snapshots created before form_signature existed refetch their configuration once
+            columns = {row['name'] for row in self._conn.execute("PRAGMA table_info(form_configs)")}
+            if 'form_signature' not in columns:
+                self._conn.execute("ALTER TABLE form_configs ADD COLUMN form_signature TEXT")
+            self._conn.commit()
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _str_or_none(value):
+        return None if value is None else str(value)
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def sync(self, client, include_config=True, config_types=None, full=False):
+        """
+        Synchronizes the snapshot with the Formstack account.
+
+        Forms, folders and SmartLists are listed from the API on every sync; only
+        forms whose 'updated' or 'last_submission_time' changed since their stored
+        configuration was fetched (or that are new) have their per-form configuration
+        refetched, in batches of CONFIG_BATCH_SIZE forms committed one at a time.
+        Configuration types whose fetch failed keep their previous rows and are
+        retried by the next sync. Objects that no longer exist in the account are
+        removed from the snapshot.
+
+        Args:
+            client: A FormstackClient used to fetch data.
+            include_config (bool, optional): Whether to sync per-form configuration. Defaults to True.
+            config_types (iterable, optional): Configuration types to sync (keys of
+                                               FormstackClient.FORM_CONFIG_FETCHERS). Defaults to all.
+            full (bool, optional): Refetch configuration for every form, not only changed ones.
+
+        Returns:
+            dict: Counts of what the sync fetched and changed.
+
+        Raises:
+            requests.exceptions.RequestException: If listing forms, folders or SmartLists (or
+                                                  fetching the folder hierarchy) fails.
+            ValueError: If a listing returns an unexpected response.
+                        The snapshot is left unchanged in both cases.
+            JobCancelled: If the current job is cancelled; configuration batches
+                          committed so far are kept.
+        """
+        started_at = time.time()
+        print(f"Syncing Formstack snapshot into {self.path}...")
+
+        # Sync calls are background work: interactive dashboard calls go first
+        with request_priority(PRIORITY_BACKGROUND):
+            # List everything first so a failed listing never wipes the snapshot;
+            # listing errors (and malformed pages) raise instead of returning nothing
+            forms = list(client.iter_forms())
+            basic_folders = list(client.iter_folders())
+            smartlists = list(client.iter_smartlists())
+            detailed_folders = client.get_complete_folder_hierarchy(basic_folders=basic_folders, forms_data=forms,
+                                                                    strict=True)
+
+            changed_form_ids = self._sync_forms(forms, started_at, full)
+            folder_count = self._sync_folders(basic_folders, detailed_folders, started_at)
+            changed_smartlists = self._sync_smartlists(smartlists, started_at)
+
+            config_form_ids = []
+            config_failed = 0
+            if include_config:
+                if config_types is None:
+                    from src.api.formstack_client import FormstackClient
+                    config_types = list(FormstackClient.FORM_CONFIG_FETCHERS)
+                config_types = list(config_types)
+                config_form_ids = self._forms_needing_configuration(forms, config_types, full)
+                job = current_job()
+                for start in range(0, len(config_form_ids), self.CONFIG_BATCH_SIZE):
+                    batch = config_form_ids[start:start + self.CONFIG_BATCH_SIZE]
+                    configurations = client.get_forms_configuration([form_id for form_id, _ in batch], config_types)
+                    if job is not None:
+                        job.raise_if_cancelled()
+                    config_failed += self._store_configurations(batch, configurations, started_at)
+
+        summary = {
+            'forms': len(forms),
+            'forms_changed': len(changed_form_ids),
+            'folders': folder_count,
+            'smartlists': len(smartlists),
+            'smartlists_changed': changed_smartlists,
+            'configurations_fetched': len(config_form_ids),
+            'configuration_failures': config_failed,
+            'duration_seconds': round(time.time() - started_at, 2)
+        }
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                [('last_sync_at', str(started_at)), ('last_sync_summary', json.dumps(summary))]
+            )
+            self._conn.commit()
+        print(f"Snapshot sync finished: {summary}")
+        return summary
+
+    def _sync_forms(self, forms, synced_at, full=False):
+        """
+        Upserts the listed forms and removes deleted ones.
+
+        Returns:
+            list: IDs of forms that are new or whose updated/last_submission_time changed.
+        """
+        stored = {row['id']: (row['updated'], row['last_submission_time'])
+                  for row in self._query("SELECT id, updated, last_submission_time FROM forms")}
+        rows = []
+        changed_form_ids = []
+        for form in forms:
+            form_id = self._str_or_none(form.get('id'))
+            if form_id is None:
+                continue
+            signature = (self._str_or_none(form.get('updated')), self._str_or_none(form.get('last_submission_time')))
+            if full or stored.get(form_id) != signature:
+                changed_form_ids.append(form_id)
+            rows.append((form_id, self._str_or_none(form.get('folder')), form.get('name'),
+                         self._str_or_none(form.get('created')), signature[0], signature[1],
+                         json.dumps(form), synced_at))
+
+        listed_ids = {row[0] for row in rows}
+        deleted_ids = [(form_id,) for form_id in stored if form_id not in listed_ids]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO forms (id, folder, name, created, updated, last_submission_time, payload, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET folder = excluded.folder, name = excluded.name, "
+                "created = excluded.created, updated = excluded.updated, "
+                "last_submission_time = excluded.last_submission_time, "
+                "payload = excluded.payload, synced_at = excluded.synced_at",
+                rows
+            )
+            self._conn.executemany("DELETE FROM forms WHERE id = ?", deleted_ids)
+            self._conn.executemany("DELETE FROM form_configs WHERE form_id = ?", deleted_ids)
+            self._conn.commit()
+        return changed_form_ids
+
+    def _sync_folders(self, basic_folders, detailed_folders, synced_at):
+        """
+        Replaces the stored folders with the current hierarchy. Folder details are
+        preferred; top-level folders whose details could not be fetched keep their
+        basic list entry.
+
+        Returns:
+            int: The number of folders stored.
+        """
+        top_level_ids = {self._str_or_none(folder.get('id')) for folder in basic_folders}
+        folders_by_id = {self._str_or_none(folder.get('id')): folder for folder in basic_folders}
+        folders_by_id.update({self._str_or_none(folder.get('id')): folder for folder in detailed_folders})
+        rows = [(folder_id, self._str_or_none(folder.get('parent')), folder.get('name'),
+                 1 if folder_id in top_level_ids else 0, json.dumps(folder), synced_at)
+                for folder_id, folder in folders_by_id.items() if folder_id is not None]
+        with self._lock:
+            self._conn.execute("DELETE FROM folders")
+            self._conn.executemany(
+                "INSERT INTO folders (id, parent, name, is_top_level, payload, synced_at) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def _sync_smartlists(self, smartlists, synced_at):
+        """
+        Upserts SmartLists whose 'updated' changed and removes deleted ones.
+
+        Returns:
+            int: The number of new or changed SmartLists.
+        """
+        stored = {row['id']: row['updated'] for row in self._query("SELECT id, updated FROM smartlists")}
+        rows = []
+        for smartlist in smartlists:
+            smartlist_id = self._str_or_none(smartlist.get('id'))
+            updated = self._str_or_none(smartlist.get('updated'))
+            if smartlist_id is None or (smartlist_id in stored and stored[smartlist_id] == updated):
+                continue
+            rows.append((smartlist_id, smartlist.get('name'), updated, json.dumps(smartlist), synced_at))
+
+        listed_ids = {self._str_or_none(smartlist.get('id')) for smartlist in smartlists}
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO smartlists (id, name, updated, payload, synced_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET name = excluded.name, updated = excluded.updated, "
+                "payload = excluded.payload, synced_at = excluded.synced_at",
+                rows
+            )
+            self._conn.executemany("DELETE FROM smartlists WHERE id = ?",
+                                   [(smartlist_id,) for smartlist_id in stored if smartlist_id not in listed_ids])
+            self._conn.commit()
+        return len(rows)
+
+    @classmethod
+    def _form_signature(cls, form):
+        return json.dumps([cls._str_or_none(form.get('updated')), cls._str_or_none(form.get('last_submission_time'))])
+
+    def _forms_needing_configuration(self, forms, config_types, full=False):
+        """
+        Returns the forms whose stored configuration is missing a type, or was
+        fetched at another 'updated'/'last_submission_time' than the form has now.
+
+        Returns:
+            list: (form ID, signature) pairs.
+        """
+        stored = {(row['form_id'], row['config_type']): row['form_signature']
+                  for row in self._query("SELECT form_id, config_type, form_signature FROM form_configs")}
+        needed = []
+        for form in forms:
+            form_id = self._str_or_none(form.get('id'))
+            if form_id is None:
+                continue
+            signature = self._form_signature(form)
+            if full or any(stored.get((form_id, config_type)) != signature for config_type in config_types):
+                needed.append((form_id, signature))
+        return needed
+
+    def _store_configurations(self, forms, configurations, synced_at):
+        """
+        Stores per-form configuration as returned by FormstackClient.get_forms_configuration,
+        in one transaction. Each row records the form signature it was fetched at; types
+        whose fetch failed (None) keep their previous row and signature.
+
+        Args:
+            forms (list): (form ID, signature) pairs, in the same order as configurations.
+
+        Returns:
+            int: The number of forms with at least one failed configuration type.
+        """
+        rows = []
+        failed = 0
+        for (form_id, signature), configuration in zip(forms, configurations):
+            failed += any(items is None for items in configuration.values())
+            rows.extend((str(form_id), config_type, len(items), json.dumps(items), synced_at, signature)
+                        for config_type, items in configuration.items() if items is not None)
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO form_configs (form_id, config_type, item_count, payload, synced_at, form_signature) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(form_id, config_type) DO UPDATE SET item_count = excluded.item_count, "
+                "payload = excluded.payload, synced_at = excluded.synced_at, "
+                "form_signature = excluded.form_signature",
+                rows
+            )
+            self._conn.commit()
+        return failed
+
+    def sync_status(self):
+        """
+        Returns when the snapshot was last synced and what that sync did.
+
+        Returns:
+            dict: last_sync_at (epoch seconds or None), age_seconds, last_sync_summary and row counts.
+        """
+        state = {row['key']: row['value'] for row in self._query("SELECT key, value FROM sync_state")}
+        last_sync_at = float(state['last_sync_at']) if 'last_sync_at' in state else None
+        counts = {table: self._query(f"SELECT COUNT(*) AS n FROM {table}")[0]['n']
+                  for table in ('forms', 'folders', 'smartlists', 'form_configs')}
+        return {
+            'path': self.path,
+            'last_sync_at': last_sync_at,
+            'age_seconds': round(time.time() - last_sync_at, 1) if last_sync_at else None,
+            'last_sync_summary': json.loads(state['last_sync_summary']) if 'last_sync_summary' in state else None,
+            'counts': counts
+        }
+
+    # ------------------------------------------------------------------
+    # Client-compatible reads
+    # ------------------------------------------------------------------
+
+    def iter_forms(self, per_page=None, prefetch=True):
+        """
+        Iterates over the stored forms (same payloads as FormstackClient.iter_forms).
+        The paging arguments are accepted for compatibility and ignored.
+        """
+        for row in self._query("SELECT payload FROM forms ORDER BY rowid"):
+            yield json.loads(row['payload'])
+
+    def get_all_forms(self):
+        """
+        Returns all stored forms.
+        """
+        return list(self.iter_forms())
+
+    def get_all_folders(self):
+        """
+        Returns the stored top-level folders (same as FormstackClient.get_all_folders).
+        """
+        return [json.loads(row['payload'])
+                for row in self._query("SELECT payload FROM folders WHERE is_top_level = 1 ORDER BY rowid")]
+
+    def get_complete_folder_hierarchy(self, basic_folders=None, forms_data=None, max_workers=None):
+        """
+        Returns all stored folders (same as FormstackClient.get_complete_folder_hierarchy).
+        The arguments are accepted for compatibility and ignored.
+        """
+        return [json.loads(row['payload']) for row in self._query("SELECT payload FROM folders ORDER BY rowid")]
+
+    def get_all_smartlists(self):
+        """
+        Returns all stored SmartLists.
+        """
+        return [json.loads(row['payload']) for row in self._query("SELECT payload FROM smartlists ORDER BY rowid")]
+
+    def get_forms_configuration(self, form_ids, config_types=None, max_workers=None):
+        """
+        Returns stored per-form configuration in the same shape as
+        FormstackClient.get_forms_configuration. Types that were never synced
+        for a form are returned as None (unknown).
+        """
+        from src.api.formstack_client import FormstackClient
+        form_ids = [str(form_id) for form_id in form_ids]
+        if config_types is None:
+            config_types = list(FormstackClient.FORM_CONFIG_FETCHERS)
+        config_types = list(config_types)
+
+        stored = {}
+        # Look the forms up in chunks to stay below SQLite's bound parameter limit
+        for start in range(0, len(form_ids), self.QUERY_CHUNK_SIZE):
+            chunk = form_ids[start:start + self.QUERY_CHUNK_SIZE]
+            placeholders = ', '.join('?' * len(chunk))
+            for row in self._query(f"SELECT form_id, config_type, payload FROM form_configs "
+                                   f"WHERE form_id IN ({placeholders})", chunk):
+                if row['config_type'] in config_types:
+                    stored[(row['form_id'], row['config_type'])] = json.loads(row['payload'])
+        return [{config_type: stored.get((form_id, config_type)) for config_type in config_types}
+                for form_id in form_ids]
+
+    def iter_forms_configuration(self, form_ids, config_types=None, max_workers=None):
+        """
+        Yields (form_id, configuration) pairs of stored per-form configuration,
+        like FormstackClient.iter_forms_configuration.
+        """
+        form_ids = list(form_ids)
+        for start in range(0, len(form_ids), self.QUERY_CHUNK_SIZE):
+            chunk = form_ids[start:start + self.QUERY_CHUNK_SIZE]
+            yield from zip(chunk, self.get_forms_configuration(chunk, config_types))
+
+    def get_config_counts(self, form_ids, config_types=None):
+        """
+        Returns the stored number of configuration items per form and type, without
+        decoding the configuration payloads.
+
+        Args:
+            form_ids (iterable): Form IDs to look up.
+            config_types (iterable, optional): Configuration types. Defaults to all.
+
+        Returns:
+            dict: {form_id: {configuration type: item count}}. Types that were never
+                  synced for a form are None; forms without any synced type are omitted.
+        """
+        from src.api.formstack_client import FormstackClient
+        form_ids = [str(form_id) for form_id in form_ids]
+        config_types = list(config_types or FormstackClient.FORM_CONFIG_FETCHERS)
+
+        counts = {}
+        for start in range(0, len(form_ids), self.QUERY_CHUNK_SIZE):
+            chunk = form_ids[start:start + self.QUERY_CHUNK_SIZE]
+            placeholders = ', '.join('?' * len(chunk))
+            for row in self._query(f"SELECT form_id, config_type, item_count FROM form_configs "
+                                   f"WHERE form_id IN ({placeholders})", chunk):
+                if row['config_type'] in config_types:
+                    form_counts = counts.setdefault(row['form_id'], dict.fromkeys(config_types))
+                    form_counts[row['config_type']] = row['item_count']
+        return counts
+
+    # ------------------------------------------------------------------
+    # Indexed queries
+    # ------------------------------------------------------------------
+
+    def get_forms_in_folder(self, folder_id):
+        """
+        Returns the stored forms that are directly in a folder.
+        """
+        return [json.loads(row['payload'])
+                for row in self._query("SELECT payload FROM forms WHERE folder = ?", (str(folder_id),))]
+
+    def get_forms_updated_since(self, timestamp):
+        """
+        Returns the stored forms updated at or after a Formstack timestamp
+        (e.g. "2024-01-01 00:00:00").
+        """
+        return [json.loads(row['payload'])
+                for row in self._query("SELECT payload FROM forms WHERE updated >= ?", (timestamp,))]
+
+    def get_forms_submitted_since(self, timestamp):
+        """
+        Returns the stored forms whose last submission was at or after a Formstack timestamp.
+        """
+        return [json.loads(row['payload'])
+                for row in self._query("SELECT payload FROM forms WHERE last_submission_time >= ?", (timestamp,))]
+
+
+# Example Usage: sync the snapshot from the command line
+if __name__ == "__main__":
+    import sys
+    from src.api.formstack_client import FormstackClient
+    try:
+        store = SnapshotStore(sys.argv[1] if len(sys.argv) > 1 else None)
+        store.sync(FormstackClient())
+        print(store.sync_status())
+    except ValueError as ve:
+        print(f"Configuration error during snapshot sync: {ve}")
+    except Exception as e:
+        print(f"An unexpected error occurred during snapshot sync: {e}")
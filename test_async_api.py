@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# Test script to check the async client against the same endpoints as test_api.py.
+# Set FORMSTACK_API_BASE_URL to run it against a local mock server. Under pytest the
+# test is skipped when aiohttp is not installed or FORMSTACK_API_KEY is not set.
+import asyncio
+import sys
+import os
+import pytest
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.api.async_formstack_client import AsyncFormstackClient
+
+async def check_form_endpoints(form_id):
+    async with AsyncFormstackClient() as client:
+        print(f"Testing async API endpoints for Form ID: {form_id}")
+        print("=" * 50)
+
+        # Test form details
+        print("1. Testing get_form_details...")
+        form_data = await client.get_form_details(form_id)
+        if form_data:
+            print(f"✅ Form details retrieved: {form_data.get('name', 'Unknown')}")
+        else:
+            print("❌ No form details found")
+        assert form_data, f"No form details found for form {form_id}"
+
+        # Test the remaining list endpoints concurrently
+        checks = [
+            ("get_form_webhooks", "Webhooks"),
+            ("get_form_integrations", "Integrations"),
+            ("get_form_fields", "Fields"),
+            ("get_form_confirmations", "Confirmations"),
+            ("get_form_notifications", "Notifications"),
+            ("get_form_partial_submissions", "Partial submissions"),
+        ]
+        results = await asyncio.gather(*(getattr(client, method)(form_id) for method, _ in checks))
+        for number, ((method, label), items) in enumerate(zip(checks, results), start=2):
+            print(f"\n{number}. Testing {method}...")
+            assert isinstance(items, list), f"{method} returned {type(items).__name__}, expected a list"
+            print(f"   {label} count: {len(items)}")
+            if items:
+                print(f"   First item: {items[0]}")
+
+def test_form_endpoints_async():
+    pytest.importorskip("aiohttp")
+    if not AsyncFormstackClient.API_KEY:
+        pytest.skip("FORMSTACK_API_KEY is not set")
+    asyncio.run(check_form_endpoints("6186472"))
+
+if __name__ == "__main__":
+    test_form_endpoints_async()
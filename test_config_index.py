@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+# Test script for the configuration index: recording, removing, saving and
+# reloading forms, and crawls where some configuration fetches fail.
+# Runs offline against an in-memory data source.
+import json
+import os
+import sys
+import tempfile
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.analysis.config_index import FormConfigIndex
+
+def full_configuration(webhooks=0, notifications=0):
+    return {
+        'webhooks': [{'id': n} for n in range(webhooks)],
+        'confirmations': [],
+        'notifications': [{'id': n} for n in range(notifications)],
+        'partial_submissions': [],
+        'integrations': []
+    }
+
+class FakeDataSource:
+    """
+    Serves forms and their configuration from memory. Configuration types listed in
+    failing[form_id] come back as None, like a failed fetch from FormstackClient.
+    """
+    def __init__(self, forms, configurations):
+        self.forms = forms
+        self.configurations = configurations
+        self.failing = {}
+        self.fetched = []
+
+    def get_all_forms(self):
+        return self.forms
+
+    def iter_forms_configuration(self, form_ids, config_types=None):
+        for form_id in form_ids:
+            self.fetched.append(form_id)
+            configuration = dict(self.configurations[form_id])
+            for config_type in self.failing.get(form_id, ()):
+                configuration[config_type] = None
+            yield form_id, configuration
+
+def test_add_remove_and_reload():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'index.json')
+        index = FormConfigIndex(path)
+        index.set_configuration('1', full_configuration(webhooks=2), signature='a')
+        index.set_configuration('2', full_configuration(notifications=1), signature='a')
+        index.set_configuration('3', full_configuration(webhooks=1, notifications=3), signature='a')
+        # Only some types of form 4 are known (e.g. recorded by an interactive search)
+        index.set_configuration('4', {'webhooks': [{'id': 1}], 'notifications': None})
+        index.remove('2')
+
+        assert sorted(index.matching_ids(['webhooks'])) == ['1', '3', '4']
+        assert index.matching_ids(['webhooks', 'notifications']) == ['3']
+        assert not index.is_indexed('2')
+        assert not index.is_indexed('4') and index.is_indexed('4', ['webhooks'])
+        assert index.counts('4')['notifications'] is None
+        print("✅ Forms added and removed")
+
+        index.save()
+        reloaded = FormConfigIndex(path)
+        for config_types in (['webhooks'], ['notifications'], ['webhooks', 'notifications'], []):
+            assert sorted(reloaded.matching_ids(config_types)) == sorted(index.matching_ids(config_types))
+        for form_id in ('1', '2', '3', '4'):
+            assert reloaded.is_indexed(form_id) == index.is_indexed(form_id)
+            assert reloaded.counts(form_id) == index.counts(form_id)
+        assert reloaded.status()['known'] == index.status()['known']
+        print("✅ Index reloaded from disk with the same contents")
+
+def test_failed_fetches_are_retried():
+    forms = [{'id': form_id, 'updated': 'a'} for form_id in ('1', '2', '3')]
+    source = FakeDataSource(forms, {'1': full_configuration(webhooks=1),
+                                    '2': full_configuration(webhooks=1),
+                                    '3': full_configuration()})
+    source.failing['2'] = ['webhooks']
+    index = FormConfigIndex(False)
+
+    summary = index.update(source)
+    assert summary == {'crawled': 2, 'failed': 1, 'removed': 0, 'unchanged': 0}
+    # A failed fetch is unknown, not "no webhooks"
+    assert not index.is_indexed('2', ['webhooks'])
+    assert index.matching_ids(['webhooks']) == ['1']
+    print("✅ Failed configuration fetches are not recorded")
+
+    source.failing.clear()
+    source.fetched.clear()
+    summary = index.update(source)
+    assert source.fetched == ['2']
+    assert summary == {'crawled': 1, 'failed': 0, 'removed': 0, 'unchanged': 2}
+    assert sorted(index.matching_ids(['webhooks'])) == ['1', '2']
+    print("✅ Forms with failed fetches are crawled again, and only those")
+
+    source.forms = [forms[0], {'id': '3', 'updated': 'b'}]
+    source.fetched.clear()
+    summary = index.update(source)
+    assert source.fetched == ['3']
+    assert summary == {'crawled': 1, 'failed': 0, 'removed': 1, 'unchanged': 1}
+    assert not index.is_indexed('2')
+    print("✅ Changed forms are recrawled and removed forms dropped")
+
+def test_new_submissions_trigger_a_recrawl():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'index.json')
+        forms = [{'id': '1', 'updated': 'a', 'last_submission_time': 't1'}]
+        source = FakeDataSource(forms, {'1': full_configuration()})
+        index = FormConfigIndex(path)
+        index.update(source)
+
+        # Submissions (and partial submissions) do not change 'updated'
+        source.configurations['1'] = dict(full_configuration(), partial_submissions=[{'id': 1}])
+        source.forms = [dict(forms[0], last_submission_time='t2')]
+        source.fetched.clear()
+        index.update(source)
+        assert source.fetched == ['1']
+        assert index.matching_ids(['partial_submissions']) == ['1']
+        print("✅ A new submission makes the form's configuration be crawled again")
+
+        # Files from before the signature included last_submission_time recrawl every form once
+        with open(path) as f:
+            data = json.load(f)
+        data['version'] = 2
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        reloaded = FormConfigIndex(path)
+        assert reloaded.matching_ids(['partial_submissions']) == ['1']
+        source.fetched.clear()
+        reloaded.update(source)
+        reloaded.update(source)
+        assert source.fetched == ['1']
+        print("✅ Older index files are read and recrawled once")
+
+if __name__ == "__main__":
+    test_add_remove_and_reload()
+    test_failed_fetches_are_retried()
+    test_new_submissions_trigger_a_recrawl()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# Test script for the negative cache thresholds: when an endpoint is marked
+# unsupported for the account, and when a missing object short-circuits calls.
+# Runs offline; no API calls are made.
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.api.negative_cache import CachedHTTPError, NegativeCache
+
+def is_short_circuited(cache, endpoint):
+    try:
+        cache.check(endpoint)
+        return False
+    except CachedHTTPError:
+        return True
+
+def test_unsupported_threshold():
+    cache = NegativeCache(unsupported_threshold=3)
+
+    # 404s on forms that may have been deleted never count
+    for form_id in range(1, 10):
+        cache.record_failure(f"form/{form_id}/webhook.json", 404)
+    assert not cache.is_unsupported("form/100/webhook.json")
+    print("✅ 404s on forms not known to exist do not mark the endpoint unsupported")
+
+    # 404s on forms that exist count, whether the success comes before or after the 404
+    cache.record_success("form/11.json")
+    cache.record_failure("form/11/integration.json", 404)
+    cache.record_failure("form/12/integration.json", 404)
+    cache.record_success("form/12/field.json")
+    assert not cache.is_unsupported("form/100/integration.json")
+    cache.record_success("form/13/webhook.json")
+    cache.record_failure("form/13/integration.json", 404)
+    assert cache.is_unsupported("form/100/integration.json")
+    assert is_short_circuited(cache, "form/100/integration.json")
+    print("✅ 404s on forms known to exist mark the endpoint unsupported at the threshold")
+
+    # 405/501 count even when the object is not known to exist
+    for form_id in range(21, 23):
+        cache.record_failure(f"form/{form_id}/notification.json", 405)
+    assert not cache.is_unsupported("form/100/notification.json")
+    cache.record_failure("form/23/notification.json", 501)
+    assert cache.is_unsupported("form/100/notification.json")
+    print("✅ 405/501 responses count toward the threshold")
+
+    # A success clears both the mark and the failures counted so far
+    cache.record_success("form/24/notification.json")
+    assert not cache.is_unsupported("form/100/notification.json")
+    for form_id in range(25, 27):
+        cache.record_failure(f"form/{form_id}/confirmation.json", 405)
+    cache.record_success("form/27/confirmation.json")
+    cache.record_failure("form/28/confirmation.json", 405)
+    assert not cache.is_unsupported("form/100/confirmation.json")
+    print("✅ A success resets the endpoint")
+
+def test_missing_objects():
+    cache = NegativeCache()
+    cache.record_failure("form/1.json", 404)
+    assert is_short_circuited(cache, "form/1.json")
+    assert is_short_circuited(cache, "form/1/webhook.json")
+    assert not is_short_circuited(cache, "form/2/webhook.json")
+    # Other errors are not cached
+    cache.record_failure("form/3.json", 500)
+    assert not is_short_circuited(cache, "form/3.json")
+    cache.record_success("form/1.json")
+    assert not is_short_circuited(cache, "form/1/webhook.json")
+    assert cache.stats()['hits'] == 2
+    print("✅ Missing objects short-circuit their calls until they are found again")
+
+if __name__ == "__main__":
+    test_unsupported_threshold()
+    test_missing_objects()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Test script for incremental snapshot syncs: only changed forms have their
+# configuration refetched, failed fetches are retried by the next sync, and a
+# failed listing leaves the snapshot unchanged.
+# Runs offline against an in-memory client and a temporary database.
+import os
+import sys
+import tempfile
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.storage.snapshot_store import SnapshotStore
+
+CONFIG_TYPES = ['webhooks', 'notifications']
+
+class FakeClient:
+    """
+    Serves forms, folders, SmartLists and configuration from memory. Configuration
+    types listed in failing[form_id] come back as None, like a failed fetch from
+    FormstackClient.get_forms_configuration.
+    """
+    def __init__(self):
+        self.forms = [{'id': str(form_id), 'name': f"Form {form_id}", 'folder': '10', 'updated': 'a'}
+                      for form_id in range(1, 6)]
+        self.folders = [{'id': '10', 'name': 'Folder', 'parent': '0'}]
+        self.smartlists = [{'id': '20', 'name': 'List', 'updated': 'a'}]
+        self.failing = {}
+        self.fail_listing = False
+        self.fetched = []
+
+    def iter_forms(self):
+        if self.fail_listing:
+            raise ValueError("Unexpected response format for GET /form.json (page 1)")
+        return iter(self.forms)
+
+    def iter_folders(self):
+        return iter(self.folders)
+
+    def iter_smartlists(self):
+        return iter(self.smartlists)
+
+    def get_complete_folder_hierarchy(self, basic_folders=None, forms_data=None, strict=False):
+        return list(self.folders)
+
+    def get_forms_configuration(self, form_ids, config_types=None):
+        configurations = []
+        for form_id in form_ids:
+            self.fetched.append(form_id)
+            configurations.append({config_type: None if config_type in self.failing.get(form_id, ()) else [{'id': 1}]
+                                   for config_type in config_types})
+        return configurations
+
+def test_incremental_sync_with_failed_fetch():
+    with tempfile.TemporaryDirectory() as directory:
+        store = SnapshotStore(os.path.join(directory, 'snapshot.db'))
+        client = FakeClient()
+        client.failing['3'] = ['webhooks']
+
+        summary = store.sync(client, config_types=CONFIG_TYPES)
+        assert summary['forms'] == 5 and summary['folders'] == 1 and summary['smartlists'] == 1
+        assert summary['configurations_fetched'] == 5 and summary['configuration_failures'] == 1
+        # The failed type is unknown, not "no webhooks"
+        counts = store.get_config_counts(['1', '3'], CONFIG_TYPES)
+        assert counts['1'] == {'webhooks': 1, 'notifications': 1}
+        assert counts['3'] == {'webhooks': None, 'notifications': 1}
+        print("✅ First sync stored every form and left the failed type unknown")
+
+        client.failing.clear()
+        client.fetched.clear()
+        summary = store.sync(client, config_types=CONFIG_TYPES)
+        assert client.fetched == ['3']
+        assert summary['configurations_fetched'] == 1 and summary['configuration_failures'] == 0
+        assert store.get_config_counts(['3'], CONFIG_TYPES)['3'] == {'webhooks': 1, 'notifications': 1}
+        print("✅ The form with a failed fetch was refetched, and only that form")
+
+        client.forms[0] = dict(client.forms[0], updated='b')
+        del client.forms[4]
+        client.fetched.clear()
+        summary = store.sync(client, config_types=CONFIG_TYPES)
+        assert client.fetched == ['1']
+        assert summary['forms'] == 4 and summary['forms_changed'] == 1
+        assert '5' not in store.get_config_counts(['5'], CONFIG_TYPES)
+        print("✅ Changed forms were refetched and deleted forms removed")
+
+        client.fail_listing = True
+        try:
+            store.sync(client, config_types=CONFIG_TYPES)
+            assert False, "a failed listing should abort the sync"
+        except ValueError:
+            pass
+        assert store.sync_status()['counts']['forms'] == 4
+        assert store.sync_status()['counts']['folders'] == 1
+        print("✅ A failed listing aborted the sync and left the snapshot unchanged")
+        store.close()
+
+if __name__ == "__main__":
+    test_incremental_sync_with_failed_fetch()